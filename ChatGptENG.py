@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from compounding import INTEREST_MODES, compound_interest
+
 
 class InterestCalculatorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("💰 Interest Calculator")
-        self.root.geometry("400x300")
+        self.root.geometry("420x340")
         self.root.configure(bg="#f4f6f9")
         self.root.resizable(False, False)
 
@@ -14,6 +16,7 @@ class InterestCalculatorApp:
         self.amount_var = tk.StringVar()
         self.rate_var = tk.StringVar()
         self.months_var = tk.StringVar()
+        self.mode_var = tk.StringVar(value="Simple interest")
 
         self._build_ui()
 
@@ -50,18 +53,26 @@ class InterestCalculatorApp:
             row=3, column=1, pady=6
         )
 
+        ttk.Label(card, text="Interest mode:", font=("Arial", 11)).grid(
+            row=4, column=0, sticky="e", padx=8, pady=6
+        )
+        ttk.Combobox(card, textvariable=self.mode_var, values=list(INTEREST_MODES),
+                     state="readonly", width=20, font=("Arial", 11)).grid(
+            row=4, column=1, pady=6
+        )
+
         # Buttons
         btns = ttk.Frame(card)
-        btns.grid(row=4, column=0, columnspan=2, pady=12)
+        btns.grid(row=5, column=0, columnspan=2, pady=12)
         ttk.Button(btns, text="Calculate", command=self.calculate_interest).grid(row=0, column=0, padx=6)
         ttk.Button(btns, text="Clear", command=self.clear_fields).grid(row=0, column=1, padx=6)
 
         # Result label
         self.result_label = ttk.Label(card, text="", font=("Arial", 12), justify="left", foreground="#1a73e8")
-        self.result_label.grid(row=5, column=0, columnspan=2, pady=10)
+        self.result_label.grid(row=6, column=0, columnspan=2, pady=10)
 
     def calculate_interest(self):
-        """Calculate simple interest and show results."""
+        """Calculate simple or compound interest and show results."""
         try:
             principal = float(self.amount_var.get())
             annual_rate = float(self.rate_var.get())
@@ -71,14 +82,22 @@ class InterestCalculatorApp:
                 messagebox.showerror("Invalid Input", "Amount and rate must be ≥ 0, months must be > 0.")
                 return
 
-            monthly_rate = annual_rate / 100 / 12
-            monthly_interest = principal * monthly_rate
-            total_interest = monthly_interest * months
-            total_amount = principal + total_interest
+            mode = INTEREST_MODES[self.mode_var.get()]
+            if mode == 'simple':
+                monthly_rate = annual_rate / 100 / 12
+                monthly_interest = principal * monthly_rate
+                total_interest = monthly_interest * months
+                total_amount = principal + total_interest
+                monthly_text = "Monthly interest"
+            else:
+                total_interest, total_amount, monthly_interest = map(
+                    float, compound_interest(principal, annual_rate, months, mode)
+                )
+                monthly_text = "Average monthly interest"
 
             self.result_label.config(
                 text=(
-                    f"Monthly interest: {monthly_interest:,.2f}\n"
+                    f"{monthly_text}: {monthly_interest:,.2f}\n"
                     f"Total interest ({months} months): {total_interest:,.2f}\n"
                     f"Final amount: {total_amount:,.2f}"
                 )
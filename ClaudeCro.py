@@ -6,9 +6,39 @@ godišnje kamatne stope i trajanja štednje.
 
 import tkinter as tk
 from tkinter import messagebox, ttk
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
+from fixed_point import (CENTS, HALF_EVEN, HALF_UP, RATE_SCALE, div_round, from_cents,
+                         parse_fixed, simple_interest_cents, to_fixed)
+from formula_compiler import DEFAULT_FORMULA, compile_formula, load_formulas
+from interest_engines import get_dispatcher
+from money_format import CURRENCY_SYMBOLS
+from number_parsing import EMPTY, GROUPING, OK, RANGE, SYNTAX, get_parser
+from post_processing import build_pipeline
+from view_binding import ViewBinding
+
+
+# Načini računanja: None je izračun s float brojevima, ostali računaju
+# točno u cijelim centima s navedenim pravilom zaokruživanja
+NACINI_ZAOKRUZIVANJA = {
+    "Decimalni (float)": None,
+    "Točno u centima, pola gore": HALF_UP,
+    "Točno u centima, pola na parno": HALF_EVEN,
+}
+
+# Brojevi u hrvatskom zapisu (1.234,56); jedna točka bez zareza čita se kao decimalna
+BROJEVI = get_parser('hr-HR', decimal_fallback=True)
+PORUKE_O_GRESCI = {
+    EMPTY: "polje je obavezno",
+    SYNTAX: "unesite valjani broj",
+    GROUPING: "točka za tisućice je na krivom mjestu",
+    RANGE: "broj je prevelik",
+}
+
+# Varijable formule za koje kalkulator ima polja; D (mjesečna uplata) nema
+VARIJABLE_FORMULE = ('P', 'r', 't', 'm')
+
 
 @dataclass
 class KamataParametri:
@@ -16,6 +46,7 @@ class KamataParametri:
     pocetni_iznos: float
     godisnja_kamata: float
     mjeseci: int
+    formula: str = DEFAULT_FORMULA
 
 
 @dataclass
@@ -33,6 +64,10 @@ class KamataKalkulator:
     def __init__(self, root: tk.Tk):
         """Inicijalizacija kalkulatora."""
         self.root = root
+        # Rezultati se osvježavaju samo kad se promijene, jednom po ciklusu
+        self.prikaz = ViewBinding(root)
+        # Prag dispečera mjeri se u pozadini; klik do tada koristi zadani prag
+        get_dispatcher().start_calibration()
         self._podesi_prozor()
         self._podesi_stilove()
         self._stvori_varijable()
@@ -83,6 +118,13 @@ class KamataKalkulator:
         self.var_iznos = tk.StringVar()
         self.var_kamata = tk.StringVar()
         self.var_mjeseci = tk.StringVar()
+        self.var_zaokruzivanje = tk.StringVar(value=next(iter(NACINI_ZAOKRUZIVANJA)))
+        self.var_formula = tk.StringVar(value=DEFAULT_FORMULA)
+        # Naknadna obrada: porez na kamate, inflacija i preračun valute
+        self.var_porez = tk.StringVar(value="0")
+        self.var_inflacija = tk.StringVar(value="0")
+        self.var_tecaj = tk.StringVar(value="1")
+        self.var_valuta = tk.StringVar(value="EUR")
         
         # Validacija unosa u realnom vremenu
         self.var_iznos.trace('w', self._validiraj_unos)
@@ -113,6 +155,7 @@ class KamataKalkulator:
         
         self._stvori_naslov(main_container)
         self._stvori_okvir_unosa(main_container)
+        self._stvori_okvir_obrade(main_container)
         self._stvori_gumbove(main_container)
         self._stvori_okvir_rezultata(main_container)
 
@@ -176,6 +219,69 @@ class KamataKalkulator:
                                self.var_mjeseci,
                                "Unesite broj mjeseci štednje")
 
+        # Način zaokruživanja
+        tk.Label(input_frame,
+                 text="🧮 Zaokruživanje:",
+                 font=('Arial', 10, 'bold'),
+                 fg='#34495e',
+                 bg='#ffffff',
+                 anchor='w').grid(row=3, column=0, sticky='w', pady=(8, 4))
+        ttk.Combobox(input_frame,
+                     textvariable=self.var_zaokruzivanje,
+                     values=list(NACINI_ZAOKRUZIVANJA),
+                     state='readonly',
+                     font=('Arial', 10)).grid(row=3, column=1, sticky='ew', padx=(15, 0), pady=(8, 4))
+
+        # Formula kamate: unaprijed definirane formule ili vlastiti izraz
+        tk.Label(input_frame,
+                 text="🧪 Formula kamate:",
+                 font=('Arial', 10, 'bold'),
+                 fg='#34495e',
+                 bg='#ffffff',
+                 anchor='w').grid(row=4, column=0, sticky='w', pady=(8, 4))
+        formula_combo = ttk.Combobox(input_frame,
+                                     textvariable=self.var_formula,
+                                     values=[tekst for tekst in load_formulas().values()
+                                             if self._podrzana_formula(tekst)],
+                                     font=('Arial', 10))
+        formula_combo.grid(row=4, column=1, sticky='ew', padx=(15, 0), pady=(8, 4))
+        self._dodaj_tooltip(formula_combo, "P iznos, r godišnja stopa (0,05 = 5%), t godine, m mjeseci")
+
+    def _stvori_okvir_obrade(self, parent: tk.Widget) -> None:
+        """Stvara okvir za porez, inflaciju i preračun valute."""
+        obrada_frame = tk.LabelFrame(parent,
+                                     text="  🧾 Porez, inflacija i valuta  ",
+                                     font=('Arial', 11, 'bold'),
+                                     fg='#2c3e50',
+                                     bg='#ffffff',
+                                     relief='solid',
+                                     bd=1,
+                                     padx=15,
+                                     pady=15)
+        obrada_frame.pack(fill='x', pady=(0, 15))
+        obrada_frame.columnconfigure(1, weight=1)
+
+        self._stvori_polje_unosa(obrada_frame, 0,
+                               "🏛️ Porez na kamate:",
+                               "%",
+                               self.var_porez,
+                               "Postotak kamate koji se zadržava kao porez")
+        self._stvori_polje_unosa(obrada_frame, 1,
+                               "📉 Godišnja inflacija:",
+                               "%",
+                               self.var_inflacija,
+                               "Iznosi se preračunavaju u današnju vrijednost novca")
+        self._stvori_polje_unosa(obrada_frame, 2,
+                               "💱 Tečaj (1 € =):",
+                               "",
+                               self.var_tecaj,
+                               "Broj jedinica ciljne valute za jedan euro")
+        self._stvori_polje_unosa(obrada_frame, 3,
+                               "🏷️ Ciljna valuta:",
+                               "",
+                               self.var_valuta,
+                               "Oznaka valute, npr. EUR, USD ili HRK")
+
     def _stvori_polje_unosa(self, parent: tk.Widget, red: int, 
                            label_text: str, suffix: str, 
                            varijabla: tk.StringVar, tooltip: str) -> None:
@@ -285,6 +391,8 @@ class KamataKalkulator:
         self._stvori_rezultat_karticu("💰", "Ukupna kamata:", "ukupna_kamata", "#27ae60")
         self._stvori_rezultat_karticu("💵", "Konačni iznos:", "konacni_iznos", "#2980b9")
         self._stvori_rezultat_karticu("📅", "Mjesečna kamata:", "mjesecna_kamata", "#e67e22")
+        self._stvori_rezultat_karticu("🧾", "Neto kamata (nakon poreza):", "neto_kamata", "#16a085")
+        self._stvori_rezultat_karticu("🏦", "Neto konačni iznos:", "neto_iznos", "#8e44ad")
 
         # Separator
         separator = tk.Frame(self.results_container, height=1, bg='#ecf0f1')
@@ -349,8 +457,8 @@ class KamataKalkulator:
     def _validiraj_unos(self, *args) -> None:
         """Validira unos u realnom vremenu i omogućava/onemogućava gumb."""
         try:
-            iznos_ok = self.var_iznos.get() and float(self.var_iznos.get().replace(',', '.')) > 0
-            kamata_ok = self.var_kamata.get() and float(self.var_kamata.get().replace(',', '.')) >= 0
+            iznos_ok = self.var_iznos.get() and self._procitaj_broj(self.var_iznos.get(), "Iznos") > 0
+            kamata_ok = self.var_kamata.get() and self._procitaj_broj(self.var_kamata.get(), "Kamata") >= 0
             mjeseci_ok = self.var_mjeseci.get() and int(self.var_mjeseci.get()) > 0
             
             if iznos_ok and kamata_ok and mjeseci_ok:
@@ -368,22 +476,27 @@ class KamataKalkulator:
         self.var_mjeseci.set("")
         
         # Sakrij rezultate i prikaži poruku
-        self.results_container.pack_forget()
-        self.poruka_label.pack(expand=True)
+        self.prikaz.hide(self.results_container)
+        self.prikaz.show(self.poruka_label, expand=True)
 
     def _dohvati_parametre(self) -> KamataParametri:
         """Dohvaća i validira parametre iz GUI polja."""
         try:
-            iznos = float(self.var_iznos.get().strip().replace(',', '.'))
-            kamata = float(self.var_kamata.get().strip().replace(',', '.'))
+            iznos = self._procitaj_broj(self.var_iznos.get(), "Početni iznos")
+            kamata = self._procitaj_broj(self.var_kamata.get(), "Kamatna stopa")
             mjeseci = int(self.var_mjeseci.get().strip())
+            formula = self.var_formula.get().strip() or DEFAULT_FORMULA
             
             self._validiraj_parametre(iznos, kamata, mjeseci)
+            nepodrzane = [ime for ime in compile_formula(formula).variables if ime not in VARIJABLE_FORMULE]
+            if nepodrzane:
+                raise ValueError(f"Formula koristi varijable koje kalkulator nema: {', '.join(nepodrzane)}")
             
             return KamataParametri(
                 pocetni_iznos=iznos,
                 godisnja_kamata=kamata,
-                mjeseci=mjeseci
+                mjeseci=mjeseci,
+                formula=formula
             )
             
         except ValueError as e:
@@ -391,6 +504,15 @@ class KamataKalkulator:
                 raise ValueError("Molimo unesite valjane brojeve!")
             raise e
 
+    @staticmethod
+    def _procitaj_broj(tekst: str, naziv: str) -> float:
+        """Čita broj istim parserom kao i skupni uvoz; greške su na hrvatskom."""
+        rezultat = BROJEVI.parse_many([tekst])
+        kod = int(rezultat.errors[0])
+        if kod != OK:
+            raise ValueError(f"{naziv}: {PORUKE_O_GRESCI[kod]}!")
+        return float(rezultat.values[0])
+
     def _validiraj_parametre(self, iznos: float, kamata: float, mjeseci: int) -> None:
         """Validira unesene parametre."""
         if iznos <= 0:
@@ -401,19 +523,48 @@ class KamataKalkulator:
             raise ValueError("Trajanje mora biti veće od 0 mjeseci!")
 
     @staticmethod
-    def _izracunaj_jednostavnu_kamatu(parametri: KamataParametri) -> KamataRezultat:
-        """Računa jednostavnu kamatu prema formuli K = P × r × t."""
+    def _izracunaj_jednostavnu_kamatu(parametri: KamataParametri,
+                                     zaokruzivanje: Optional[str] = None) -> KamataRezultat:
+        """
+        Računa jednostavnu kamatu prema formuli K = P × r × t.
+
+        Kamata se računa prevedenom formulom iz parametara. Uz zadano
+        zaokruživanje (HALF_UP ili HALF_EVEN) iznosi se računaju točno u
+        cijelim centima, a kamata se zaokružuje samo jednom.
+        """
         godine = parametri.mjeseci / 12
-        godisnja_kamata_decimalno = parametri.godisnja_kamata / 100
-        
-        ukupna_kamata = (
-            parametri.pocetni_iznos * 
-            godisnja_kamata_decimalno * 
-            godine
-        )
-        
-        konacni_iznos = parametri.pocetni_iznos + ukupna_kamata
-        mjesecna_kamata = ukupna_kamata / parametri.mjeseci
+        formula = compile_formula(parametri.formula)
+        if zaokruzivanje is not None and parametri.formula != DEFAULT_FORMULA:
+            ukupna = int(to_fixed(formula(**KamataKalkulator._vrijednosti_formule(parametri)), CENTS, zaokruzivanje))
+            return KamataRezultat(
+                ukupna_kamata=from_cents(ukupna),
+                konacni_iznos=from_cents(parse_fixed(parametri.pocetni_iznos, CENTS, zaokruzivanje) + ukupna),
+                mjesecna_kamata=from_cents(div_round(ukupna, parametri.mjeseci, zaokruzivanje)),
+                godine=godine
+            )
+        if zaokruzivanje is not None:
+            ukupna, konacni, mjesecna = simple_interest_cents(
+                parse_fixed(parametri.pocetni_iznos, CENTS, zaokruzivanje),
+                parse_fixed(parametri.godisnja_kamata, RATE_SCALE, zaokruzivanje),
+                parametri.mjeseci,
+                rounding=zaokruzivanje
+            )
+            return KamataRezultat(
+                ukupna_kamata=from_cents(ukupna),
+                konacni_iznos=from_cents(konacni),
+                mjesecna_kamata=from_cents(mjesecna),
+                godine=godine
+            )
+
+        if parametri.formula == DEFAULT_FORMULA:
+            # Jedan izračun: dispečer bira skalarni put bez NumPy troška
+            ukupne, mjesecne, konacni = get_dispatcher().calculate(
+                [parametri.pocetni_iznos], [parametri.godisnja_kamata], [parametri.mjeseci])
+            ukupna_kamata, mjesecna_kamata, konacni_iznos = float(ukupne[0]), float(mjesecne[0]), float(konacni[0])
+        else:
+            ukupna_kamata = float(formula(**KamataKalkulator._vrijednosti_formule(parametri)))
+            konacni_iznos = parametri.pocetni_iznos + ukupna_kamata
+            mjesecna_kamata = ukupna_kamata / parametri.mjeseci
         
         return KamataRezultat(
             ukupna_kamata=ukupna_kamata,
@@ -422,38 +573,75 @@ class KamataKalkulator:
             godine=godine
         )
 
+    @staticmethod
+    def _podrzana_formula(tekst: str) -> bool:
+        """Je li formula ispravna i koristi li samo varijable iz VARIJABLE_FORMULE."""
+        try:
+            return all(ime in VARIJABLE_FORMULE for ime in compile_formula(tekst).variables)
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _vrijednosti_formule(parametri: KamataParametri) -> Dict[str, float]:
+        """Vrijednosti varijabli formule."""
+        return {
+            'P': parametri.pocetni_iznos,
+            'r': parametri.godisnja_kamata / 100,
+            't': parametri.mjeseci / 12,
+            'm': parametri.mjeseci,
+        }
+
     def _azuriraj_prikaz(self, parametri: KamataParametri, rezultat: KamataRezultat) -> None:
         """Ažurira GUI s rezultatima računanja."""
+        # Sve što može baciti grešku računa se prije prve promjene prikaza,
+        # da greška ne ostavi bruto rezultate bez neto iznosa
+        neto = self._obradi_rezultat(parametri, rezultat)
+        simbol = CURRENCY_SYMBOLS.get(self.var_valuta.get().strip().upper(), self.var_valuta.get().strip())
+        detalji = self._generiraj_detalje(parametri, rezultat)
+
         # Sakrij poruku i prikaži rezultate
-        self.poruka_label.pack_forget()
-        self.results_container.pack(fill='both', expand=True)
+        self.prikaz.hide(self.poruka_label)
+        self.prikaz.show(self.results_container, fill='both', expand=True)
 
         # Ažuriranje glavnih rezultata s animacijom
-        self.label_ukupna_kamata.config(text=f"{rezultat.ukupna_kamata:.2f} €")
-        self.label_konacni_iznos.config(text=f"{rezultat.konacni_iznos:.2f} €")
-        self.label_mjesecna_kamata.config(text=f"{rezultat.mjesecna_kamata:.2f} €")
+        self.prikaz.set(self.label_ukupna_kamata, text=f"{rezultat.ukupna_kamata:.2f} €")
+        self.prikaz.set(self.label_konacni_iznos, text=f"{rezultat.konacni_iznos:.2f} €")
+        self.prikaz.set(self.label_mjesecna_kamata, text=f"{rezultat.mjesecna_kamata:.2f} €")
+
+        # Porez, inflacija i valuta u jednom prolazu
+        self.prikaz.set(self.label_neto_kamata, text=f"{neto['net_interest'][0]:.2f} {simbol}")
+        self.prikaz.set(self.label_neto_iznos, text=f"{neto['final_amount'][0]:.2f} {simbol}")
 
         # Ažuriranje detalja
-        detalji = self._generiraj_detalje(parametri, rezultat)
-        self.label_detalji.config(text=detalji)
+        self.prikaz.set(self.label_detalji, text=detalji)
+
+    def _obradi_rezultat(self, parametri: KamataParametri, rezultat: KamataRezultat) -> Dict:
+        """Primjenjuje porez, inflaciju, tečaj i zaokruživanje na izračunatu kamatu."""
+        porez = self._procitaj_broj(self.var_porez.get(), "Porez") if self.var_porez.get().strip() else 0
+        inflacija = self._procitaj_broj(self.var_inflacija.get(), "Inflacija") if self.var_inflacija.get().strip() else 0
+        tecaj = self._procitaj_broj(self.var_tecaj.get(), "Tečaj") if self.var_tecaj.get().strip() else 1
+        zaokruzivanje = NACINI_ZAOKRUZIVANJA[self.var_zaokruzivanje.get()] or HALF_UP
+        obrada = build_pipeline(porez, inflacija, tecaj, self.var_valuta.get().strip() or None,
+                                rounding=zaokruzivanje)
+        return obrada.evaluate([parametri.pocetni_iznos], [rezultat.ukupna_kamata], [parametri.mjeseci])
 
     def _generiraj_detalje(self, parametri: KamataParametri, rezultat: KamataRezultat) -> str:
         """Generira tekst s detaljima računanja."""
+        formula = compile_formula(parametri.formula)
         return (
             f"• Početni iznos: {parametri.pocetni_iznos:.2f} €\n"
             f"• Kamatna stopa: {parametri.godisnja_kamata:.2f}% godišnje\n"
             f"• Trajanje: {parametri.mjeseci} mjeseci ({rezultat.godine:.2f} godina)\n"
-            f"• Formula: K = P × r × t\n"
-            f"• Izračun: {parametri.pocetni_iznos:.2f} × "
-            f"{parametri.godisnja_kamata/100:.4f} × {rezultat.godine:.2f} = "
-            f"{rezultat.ukupna_kamata:.2f} €"
+            f"• Formula: {formula.display()}\n"
+            f"• Izračun: {formula.explain(self._vrijednosti_formule(parametri), rezultat.ukupna_kamata)} €"
         )
 
     def _izracunaj_kamatu(self) -> None:
         """Glavna metoda za računanje kamata s error handling-om."""
         try:
             parametri = self._dohvati_parametre()
-            rezultat = self._izracunaj_jednostavnu_kamatu(parametri)
+            rezultat = self._izracunaj_jednostavnu_kamatu(
+                parametri, NACINI_ZAOKRUZIVANJA[self.var_zaokruzivanje.get()])
             self._azuriraj_prikaz(parametri, rezultat)
             
         except ValueError as e:
@@ -4,6 +4,12 @@ from typing import Tuple, Optional
 from dataclasses import dataclass
 import math
 
+from compounding import annuity_factor_scalar
+from money_format import get_formatter
+from number_parsing import get_parser
+from rate_schedule import RateSchedule, parse_rate_changes
+from stall_monitor import attach_if_enabled
+
 
 @dataclass
 class InterestResult:
@@ -82,22 +88,38 @@ class InterestCalculations:
         # Convert annual rate to monthly rate
         monthly_rate = (annual_rate / 100) / 12
         
-        if monthly_rate == 0:
-            # No interest case - simple division
-            monthly_savings = target_amount / months
-        else:
-            # Future value of annuity formula: FV = PMT * [((1 + r)^n - 1) / r]
-            # Solving for PMT: PMT = FV / [((1 + r)^n - 1) / r]
-            factor = ((1 + monthly_rate) ** months - 1) / monthly_rate
-            monthly_savings = target_amount / factor
+        # Future value of annuity formula: FV = PMT * [((1 + r)^n - 1) / r]
+        # Solving for PMT: PMT = FV / [((1 + r)^n - 1) / r]
+        # The factor is evaluated stably; for r = 0 it is exactly n
+        factor = annuity_factor_scalar(monthly_rate, months)
+        monthly_savings = target_amount / factor
             
         return SavingsResult(monthly_savings)
 
+    @staticmethod
+    def calculate_monthly_savings_schedule(target_amount: float, schedule: RateSchedule) -> SavingsResult:
+        """
+        Calculate required monthly savings when the interest rate changes over time.
+        
+        Args:
+            target_amount: Desired final amount
+            schedule: Monthly rates over the whole duration
+            
+        Returns:
+            SavingsResult containing monthly savings required
+            
+        Raises:
+            ValueError: If the target amount is not positive
+        """
+        if target_amount <= 0:
+            raise ValueError("Target amount must be positive")
+        return SavingsResult(float(schedule.required_deposit(target_amount)))
+
 
 class UIConstants:
     """Constants for UI configuration."""
     WINDOW_WIDTH = 520
-    WINDOW_HEIGHT = 650
+    WINDOW_HEIGHT = 690
     PADDING = 25
     SECTION_PADDING = 15
     ENTRY_WIDTH = 18
@@ -127,7 +149,8 @@ class UIConstants:
         'principal': "Enter the initial amount you want to invest or save",
         'rate': "Enter the annual interest rate as a percentage (e.g., 5.5 for 5.5%)",
         'duration': "Enter the number of months for your investment or savings period",
-        'target': "Enter the amount you want to accumulate by the end of the period"
+        'target': "Enter the amount you want to accumulate by the end of the period",
+        'rate_changes': "Optional, e.g. 13:4.5, 25:5 - new annual rate (%) from that month on"
     }
 
 
@@ -178,6 +201,9 @@ class InputValidator:
     def validate_and_convert(value: str, field_name: str, allow_zero: bool = False) -> float:
         """
         Validate and convert string input to float.
+
+        Numbers may use en-US grouping ("1,234.56"), parsed by the same
+        parser as bulk imports.
         
         Args:
             value: String value to validate
@@ -190,13 +216,7 @@ class InputValidator:
         Raises:
             ValueError: If validation fails
         """
-        if not value.strip():
-            raise ValueError(f"{field_name} is required")
-            
-        try:
-            num_value = float(value.strip())
-        except ValueError:
-            raise ValueError(f"{field_name} must be a valid number")
+        num_value = get_parser('en-US').parse(value, field_name)
             
         if not allow_zero and num_value <= 0:
             raise ValueError(f"{field_name} must be positive")
@@ -213,6 +233,7 @@ class InterestCalculatorGUI:
         self.root = root
         self.calculator = InterestCalculations()
         self.validator = InputValidator()
+        self.money = get_formatter('en-US')
         
         self._setup_window()
         self._configure_styles()
@@ -264,6 +285,7 @@ class InterestCalculatorGUI:
         self.rate_var = tk.StringVar()
         self.duration_var = tk.StringVar()
         self.target_var = tk.StringVar()
+        self.rate_changes_var = tk.StringVar()
         
         # Add validation to entries
         vcmd = (self.root.register(self._validate_number), '%P')
@@ -271,13 +293,7 @@ class InterestCalculatorGUI:
         
     def _validate_number(self, value: str) -> bool:
         """Validate numeric input in real-time."""
-        if value == "":
-            return True
-        try:
-            float(value)
-            return True
-        except ValueError:
-            return False
+        return value == "" or get_parser('en-US').is_partial(value)
             
     def _create_widgets(self) -> None:
         """Create and layout all GUI widgets."""
@@ -489,6 +505,19 @@ class InterestCalculatorGUI:
             self.target_var, "Enter your savings goal"
         )
         
+        # Optional rate changes; free text, so no numeric key validation
+        ttk.Label(savings_frame, text="📉 Rate Changes (month:%):", font=UIConstants.LABEL_FONT).grid(
+            row=2, column=0, sticky="w", pady=(5, 5), padx=(0, 10)
+        )
+        rate_changes_entry = ttk.Entry(
+            savings_frame,
+            textvariable=self.rate_changes_var,
+            width=UIConstants.ENTRY_WIDTH,
+            style='Custom.TEntry'
+        )
+        rate_changes_entry.grid(row=2, column=1, sticky="ew", pady=(5, 5))
+        ToolTip(rate_changes_entry, UIConstants.TOOLTIPS['rate_changes'])
+        
         # Calculate button
         self.savings_calc_button = ttk.Button(
             savings_frame, 
@@ -496,10 +525,10 @@ class InterestCalculatorGUI:
             command=self._calculate_monthly_savings,
             style='Primary.TButton'
         )
-        self.savings_calc_button.grid(row=2, column=0, columnspan=2, pady=(15, 10), sticky="ew")
+        self.savings_calc_button.grid(row=3, column=0, columnspan=2, pady=(15, 10), sticky="ew")
         
         # Result
-        self._create_result_row(savings_frame, 3, "💳 Required Monthly Savings:", "monthly_savings_result")
+        self._create_result_row(savings_frame, 4, "💳 Required Monthly Savings:", "monthly_savings_result")
         
     def _create_action_buttons(self) -> None:
         """Create action buttons."""
@@ -576,10 +605,15 @@ class InterestCalculatorGUI:
             ))
             
             # Calculate results
-            result = self.calculator.calculate_monthly_savings(target, rate, duration)
+            rate_changes = parse_rate_changes(self.rate_changes_var.get())
+            if rate_changes:
+                schedule = RateSchedule.from_annual_rates(rate, duration, rate_changes)
+                result = self.calculator.calculate_monthly_savings_schedule(target, schedule)
+            else:
+                result = self.calculator.calculate_monthly_savings(target, rate, duration)
             
             # Update UI
-            self.monthly_savings_result.config(text=f"${result.monthly_savings_required:.2f}")
+            self.monthly_savings_result.config(text=self.money.format(result.monthly_savings_required))
             
         except ValueError as e:
             self._show_error("Input Error", str(e))
@@ -588,14 +622,17 @@ class InterestCalculatorGUI:
             
     def _update_interest_results(self, result: InterestResult, principal: float, rate: float, duration: int) -> None:
         """Update the interest calculation results with enhanced information."""
-        self.interest_result.config(text=f"${result.total_interest:.2f}")
-        self.monthly_interest_result.config(text=f"${result.monthly_interest:.2f}")
-        self.total_result.config(text=f"${result.final_amount:.2f}")
+        interest, monthly, final = self.money.format_many(
+            [result.total_interest, result.monthly_interest, result.final_amount]
+        )
+        self.interest_result.config(text=interest)
+        self.monthly_interest_result.config(text=monthly)
+        self.total_result.config(text=final)
         
         # Update summary
         roi = (result.total_interest / principal) * 100
         years = duration / 12
-        summary_text = f"Your investment will grow by {roi:.1f}% over {years:.1f} year(s), earning ${result.total_interest:.2f} in interest."
+        summary_text = f"Your investment will grow by {roi:.1f}% over {years:.1f} year(s), earning {interest} in interest."
         self.summary_label.config(text=summary_text)
         
     def _show_error(self, title: str, message: str) -> None:
@@ -619,6 +656,7 @@ class InterestCalculatorGUI:
         self.rate_var.set("")
         self.duration_var.set("")
         self.target_var.set("")
+        self.rate_changes_var.set("")
         
         # Clear results
         self.interest_result.config(text="$0.00")
@@ -635,6 +673,7 @@ def main() -> None:
     """Main entry point for the application."""
     root = tk.Tk()
     app = InterestCalculatorGUI(root)
+    attach_if_enabled(root)
     root.mainloop()
 
 
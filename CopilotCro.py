@@ -1,12 +1,95 @@
 import tkinter as tk
 from tkinter import messagebox
+from typing import Optional
+
+from calculation_history import CalculationHistory, HistoryEntry
+from tiered_rates import TieredProduct, product_choices
+
+PROIZVODI = product_choices("Vlastita kamatna stopa")
+
+class PovijestIzracuna(tk.Frame):
+    """Popis prošlih izračuna koji iz baze učitava samo stranice koje se prikazuju."""
+
+    VIDLJIVI_REDOVI = 8
+    VELICINA_STRANICE = 100
+    NAJVISE_STRANICA = 20
+
+    def __init__(self, parent: tk.Widget, povijest: CalculationHistory, na_odabir):
+        super().__init__(parent)
+        self.povijest = povijest
+        self.na_odabir = na_odabir
+        self.filtri: dict = {}
+        self.ukupno = 0
+        self.pocetak = 0
+        self.stranice: dict[int, list[HistoryEntry]] = {}
+        self.prikazani: list[HistoryEntry] = []
+
+        # Lista ima samo vidljive retke; klizač prikazuje položaj u cijeloj povijesti
+        self.lista = tk.Listbox(self, height=self.VIDLJIVI_REDOVI, font=("Courier", 9), activestyle="none")
+        self.klizac = tk.Scrollbar(self, orient="vertical", command=self.pomakni)
+        self.lista.pack(side="left", fill="both", expand=True)
+        self.klizac.pack(side="right", fill="y")
+
+        self.lista.bind("<Double-Button-1>", self._odabrano)
+        self.lista.bind("<Return>", self._odabrano)
+        self.lista.bind("<MouseWheel>", lambda e: self.pomakni("scroll", -1 if e.delta > 0 else 1, "units"))
+        self.lista.bind("<Button-4>", lambda e: self.pomakni("scroll", -1, "units"))
+        self.lista.bind("<Button-5>", lambda e: self.pomakni("scroll", 1, "units"))
+        self.osvjezi()
+
+    def osvjezi(self, **filtri) -> None:
+        """Ponovno učitava povijest, npr. nakon novog izračuna ili uz nove filtre."""
+        self.filtri = filtri
+        self.stranice.clear()
+        self.ukupno = self.povijest.count(**filtri)
+        self.pocetak = 0
+        self._prikazi()
+
+    def pomakni(self, radnja: str, kolicina: str, jedinica: str | None = None) -> None:
+        # Prima iste naredbe kao Listbox.yview: ("moveto", udio) ili ("scroll", n, "units"/"pages")
+        if radnja == "moveto":
+            pocetak = round(float(kolicina) * self.ukupno)
+        else:
+            korak = self.VIDLJIVI_REDOVI if jedinica == "pages" else 1
+            pocetak = self.pocetak + int(kolicina) * korak
+        self.pocetak = max(0, min(pocetak, self.ukupno - self.VIDLJIVI_REDOVI))
+        self._prikazi()
+
+    def _zapis(self, indeks: int) -> HistoryEntry:
+        broj, pomak = divmod(indeks, self.VELICINA_STRANICE)
+        if broj not in self.stranice:
+            if len(self.stranice) >= self.NAJVISE_STRANICA:
+                self.stranice.clear()
+            self.stranice[broj] = self.povijest.page(broj * self.VELICINA_STRANICE,
+                                                     self.VELICINA_STRANICE, **self.filtri)
+        return self.stranice[broj][pomak]
+
+    def _prikazi(self) -> None:
+        kraj = min(self.pocetak + self.VIDLJIVI_REDOVI, self.ukupno)
+        self.prikazani = [self._zapis(i) for i in range(self.pocetak, kraj)]
+        self.lista.delete(0, tk.END)
+        for zapis in self.prikazani:
+            self.lista.insert(tk.END, f"{zapis.amount:>11.2f} € {zapis.rate:6.3f} % {zapis.months:>4} mj"
+                                      f" → {zapis.total_interest:.2f} €")
+        if self.ukupno:
+            self.klizac.set(self.pocetak / self.ukupno, kraj / self.ukupno)
+        else:
+            self.klizac.set(0, 1)
+
+    def _odabrano(self, event=None) -> None:
+        odabir = self.lista.curselection()
+        if odabir:
+            self.na_odabir(self.prikazani[odabir[0]])
 
 class KalkulatorKamate:
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, povijest: Optional[CalculationHistory] = None):
         self.root = root
         self.root.title("💰 Kalkulator Kamate")
-        self.root.geometry("360x400")
+        self.root.geometry("380x720")
         self.root.resizable(False, False)
+        # Povijest se dijeli među pokretanjima; testovi i mjerenja predaju svoju
+        self.povijest = povijest or CalculationHistory()
+        self.root.protocol("WM_DELETE_WINDOW", self.zatvori)
         self.kreiraj_sucelje()
 
     def kreiraj_sucelje(self) -> None:
@@ -22,6 +105,13 @@ class KalkulatorKamate:
         self.entry_kamata = self.kreiraj_polje(okvir, "Godišnja kamata (%):")
         self.entry_mjeseci = self.kreiraj_polje(okvir, "Trajanje (mjeseci):")
 
+        # Štedni proizvod: vlastita stopa ili stope po razredima stanja
+        tk.Label(okvir, text="Štedni proizvod:", font=("Arial", 10)).pack(anchor="w", pady=(10, 0))
+        self.var_proizvod = tk.StringVar(value=next(iter(PROIZVODI)))
+        izbornik = tk.OptionMenu(okvir, self.var_proizvod, *PROIZVODI, command=self.promijeni_proizvod)
+        izbornik.config(width=30)
+        izbornik.pack()
+
         # Gumbi
         gumb_okvir = tk.Frame(okvir)
         gumb_okvir.pack(pady=10)
@@ -33,6 +123,15 @@ class KalkulatorKamate:
         self.label_rezultat = tk.Label(okvir, text="", font=("Arial", 12), fg="blue", justify="left")
         self.label_rezultat.pack(pady=15)
 
+        # Povijest izračuna (dvostruki klik vraća spremljeni rezultat)
+        tk.Label(okvir, text="Povijest izračuna:", font=("Arial", 10, "bold")).pack(anchor="w")
+        povijest_gumbi = tk.Frame(okvir)
+        povijest_gumbi.pack(fill="x", pady=(2, 4))
+        tk.Button(povijest_gumbi, text="Traži po unosu", command=self.pretrazi_povijest).pack(side="left")
+        tk.Button(povijest_gumbi, text="Prikaži sve", command=lambda: self.panel_povijesti.osvjezi()).pack(side="left", padx=5)
+        self.panel_povijesti = PovijestIzracuna(okvir, self.povijest, self.ucitaj_iz_povijesti)
+        self.panel_povijesti.pack(fill="both", expand=True)
+
         # Fokus na prvo polje
         self.entry_iznos.focus()
 
@@ -42,28 +141,75 @@ class KalkulatorKamate:
         entry.pack()
         return entry
 
+    def promijeni_proizvod(self, naziv: str) -> None:
+        # Proizvod s razredima sam određuje stopu pa polje stope nije potrebno
+        self.entry_kamata.config(state="normal" if PROIZVODI[naziv] is None else "disabled")
+
     def izracunaj(self) -> None:
         try:
+            proizvod = PROIZVODI[self.var_proizvod.get()]
             iznos = float(self.entry_iznos.get())
-            kamata = float(self.entry_kamata.get())
+            kamata = float(self.entry_kamata.get()) if proizvod is None else float(proizvod.blended_rate(iznos))
             mjeseci = int(self.entry_mjeseci.get())
 
             if iznos <= 0 or kamata <= 0 or mjeseci <= 0:
                 messagebox.showerror("Neispravan unos", "Sve vrijednosti moraju biti pozitivni brojevi.")
                 return
 
-            ukupna_kamata, mjesecna_kamata, ukupan_iznos = self.izracunaj_kamatu(iznos, kamata, mjeseci)
+            # Već izračunati unos dolazi iz povijesti bez ponovnog računanja
+            naziv_proizvoda = "" if proizvod is None else proizvod.name
+            zapis = self.povijest.lookup(iznos, kamata, mjeseci, naziv_proizvoda)
+            if zapis is None:
+                zapis = self.povijest.record(iznos, kamata, mjeseci, naziv_proizvoda,
+                                             *self.izracunaj_kamatu(iznos, kamata, mjeseci, proizvod))
+
+            self.prikazi_rezultat(zapis)
+            self.panel_povijesti.osvjezi()
+        except ValueError:
+            messagebox.showerror("Greška", "Unesite ispravne brojčane vrijednosti.")
 
-            self.label_rezultat.config(
-                text=(
-                    f"📊 Rezultati:\n"
-                    f"• Ukupna kamata: {ukupna_kamata:.2f} €\n"
-                    f"• Mjesečna kamata: {mjesecna_kamata:.2f} €\n"
-                    f"• Ukupan iznos na kraju: {ukupan_iznos:.2f} €"
-                )
+    def prikazi_rezultat(self, zapis: HistoryEntry) -> None:
+        self.label_rezultat.config(
+            text=(
+                f"📊 Rezultati:\n"
+                f"• Ukupna kamata: {zapis.total_interest:.2f} €\n"
+                f"• Mjesečna kamata: {zapis.monthly_interest:.2f} €\n"
+                f"• Ukupan iznos na kraju: {zapis.final_amount:.2f} €\n"
+                f"• Prosječna stopa: {zapis.rate:.3f} %"
             )
+        )
+
+    def ucitaj_iz_povijesti(self, zapis: HistoryEntry) -> None:
+        # Vraća unos i spremljeni rezultat; ništa se ne računa ponovno
+        naziv = zapis.product if zapis.product in PROIZVODI else next(iter(PROIZVODI))
+        self.var_proizvod.set(naziv)
+        self.entry_kamata.config(state="normal")
+        for entry, vrijednost in ((self.entry_iznos, f"{zapis.amount:g}"),
+                                  (self.entry_kamata, "" if zapis.product else f"{zapis.rate:g}"),
+                                  (self.entry_mjeseci, str(zapis.months))):
+            entry.delete(0, tk.END)
+            entry.insert(0, vrijednost)
+        self.promijeni_proizvod(naziv)
+        self.prikazi_rezultat(self.povijest.lookup(zapis.amount, zapis.rate, zapis.months, zapis.product) or zapis)
+
+    def pretrazi_povijest(self) -> None:
+        # Popunjena polja postaju filtri; prazna se zanemaruju
+        try:
+            filtri = {}
+            if self.entry_iznos.get().strip():
+                filtri["amount"] = float(self.entry_iznos.get())
+            if str(self.entry_kamata.cget("state")) == "normal" and self.entry_kamata.get().strip():
+                filtri["rate"] = float(self.entry_kamata.get())
+            if self.entry_mjeseci.get().strip():
+                filtri["months"] = int(self.entry_mjeseci.get())
         except ValueError:
             messagebox.showerror("Greška", "Unesite ispravne brojčane vrijednosti.")
+            return
+        self.panel_povijesti.osvjezi(**filtri)
+
+    def zatvori(self) -> None:
+        self.povijest.close()
+        self.root.destroy()
 
     def resetiraj(self) -> None:
         self.entry_iznos.delete(0, tk.END)
@@ -73,7 +219,11 @@ class KalkulatorKamate:
         self.entry_iznos.focus()
 
     @staticmethod
-    def izracunaj_kamatu(iznos: float, kamata: float, mjeseci: int) -> tuple[float, float, float]:
+    def izracunaj_kamatu(iznos: float, kamata: float, mjeseci: int,
+                         proizvod: TieredProduct | None = None) -> tuple[float, float, float]:
+        if proizvod is not None:
+            ukupna_kamata, mjesecna_kamata, ukupan_iznos = map(float, proizvod.simple_interest(iznos, mjeseci))
+            return ukupna_kamata, mjesecna_kamata, ukupan_iznos
         ukupna_kamata = (iznos * kamata * mjeseci) / (100 * 12)
         mjesecna_kamata = ukupna_kamata / mjeseci
         ukupan_iznos = iznos + ukupna_kamata
@@ -1,12 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from compounding import INTEREST_MODES, compound_interest
+
 
 class InterestCalculatorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("💰 Monthly Interest Calculator")
-        self.root.geometry("400x320")
+        self.root.geometry("400x360")
         self.root.resizable(False, False)
 
         self._setup_style()
@@ -33,13 +35,18 @@ class InterestCalculatorApp:
         self._add_label("Duration (months):", 3)
         self.duration_entry = self._add_entry(3)
 
+        self._add_label("Interest Mode:", 4)
+        self.mode_combo = ttk.Combobox(self.root, values=list(INTEREST_MODES), state="readonly", width=18)
+        self.mode_combo.current(0)
+        self.mode_combo.grid(row=4, column=1, padx=10, pady=5)
+
         # Calculate Button
-        ttk.Button(self.root, text="Calculate", command=self.calculate_interest).grid(row=4, column=0, columnspan=2, pady=15)
+        ttk.Button(self.root, text="Calculate", command=self.calculate_interest).grid(row=5, column=0, columnspan=2, pady=15)
 
         # Results
-        self.monthly_result = self._add_result_label("Monthly Interest:", 5)
-        self.total_interest_result = self._add_result_label("Total Interest:", 6)
-        self.final_amount_result = self._add_result_label("Final Amount:", 7)
+        self.monthly_result = self._add_result_label("Monthly Interest:", 6)
+        self.total_interest_result = self._add_result_label("Total Interest:", 7)
+        self.final_amount_result = self._add_result_label("Final Amount:", 8)
 
         # Autofocus
         self.amount_entry.focus()
@@ -68,14 +75,22 @@ class InterestCalculatorApp:
                 messagebox.showerror("Input Error", "All values must be positive numbers.")
                 return
 
-            # Convert annual rate to decimal
-            annual_rate /= 100
-            monthly_rate = annual_rate / 12
-            monthly_interest = principal * monthly_rate
-            total_interest = monthly_interest * months
-            total_amount = principal + total_interest
-
-            self.monthly_result.config(text=f"Monthly Interest: €{monthly_interest:.2f}")
+            mode = INTEREST_MODES[self.mode_combo.get()]
+            if mode == 'simple':
+                # Convert annual rate to decimal
+                annual_rate /= 100
+                monthly_rate = annual_rate / 12
+                monthly_interest = principal * monthly_rate
+                total_interest = monthly_interest * months
+                total_amount = principal + total_interest
+                monthly_text = "Monthly Interest"
+            else:
+                total_interest, total_amount, monthly_interest = map(
+                    float, compound_interest(principal, annual_rate, months, mode)
+                )
+                monthly_text = "Average Monthly Interest"
+
+            self.monthly_result.config(text=f"{monthly_text}: €{monthly_interest:.2f}")
             self.total_interest_result.config(text=f"Total Interest: €{total_interest:.2f}")
             self.final_amount_result.config(text=f"Final Amount After {months} Months: €{total_amount:.2f}")
 
@@ -2,9 +2,14 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Tuple, Optional
 
+from money_format import get_formatter
+from view_binding import ViewBinding
+
 class KalkulatorKamata:
     def __init__(self, root: tk.Tk):
         self.root = root
+        # Labele rezultata mijenjaju se samo kad im se tekst promijeni
+        self.prikaz = ViewBinding(root)
         self.root.title("Kalkulator kamata na štednju")
         self.root.geometry("600x1200")
         self.root.resizable(True, True)
@@ -319,12 +324,12 @@ class KalkulatorKamata:
     
     def _display_results(self, results: dict):
         """Prikazuje rezultate korisniku UNUTAR aplikacije"""
-        for config in self.result_configs:
-            key = config['key']
-            value = results[key]
+        formatter = get_formatter('hr-HR', group_separator=" ")
+        iznosi = formatter.format_many([results[config['key']] for config in self.result_configs])
+        for config, iznos in zip(self.result_configs, iznosi):
             # PRIKAZUJEMO REZULTATE U LABEL-IMA UNUTAR APLIKACIJE
-            result_text = f"{config['icon']} {config['text']} {value:,.2f} €".replace(',', ' ')
-            self.result_labels[key].config(text=result_text)
+            result_text = f"{config['icon']} {config['text']} {iznos}"
+            self.prikaz.set(self.result_labels[config['key']], text=result_text)
     
     def _izracunaj_kamatu(self):
         """Glavna funkcija za izračun kamata - SADA PRIKAZUJE REZULTATE U APLIKACIJI"""
@@ -348,7 +353,7 @@ class KalkulatorKamata:
         
         # Resetiraj rezultate na prazan tekst
         for config in self.result_configs:
-            self.result_labels[config['key']].config(text="")
+            self.prikaz.set(self.result_labels[config['key']], text="")
         
         self.entries["Početni iznos (€)"].focus()
 
@@ -1,8 +1,14 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import tkinter.font as tkfont
 
+from deposit_ledger import DepositLedger
+from fixed_point import (CENTS, HALF_EVEN, HALF_UP, RATE_SCALE, div_round, from_cents, mul_div,
+                         parse_fixed, simple_interest_cents)
+from stall_monitor import attach_if_enabled
+from view_binding import ViewBinding
+
 
 class Theme:
     """Centralized theme configuration"""
@@ -30,12 +36,23 @@ class Theme:
     }
 
 
+# Calculation modes offered in the UI: None keeps the float calculation
+ROUNDING_CHOICES = {
+    "Float (legacy)": None,
+    "Exact cents, half-up": HALF_UP,
+    "Exact cents, half-even": HALF_EVEN,
+}
+
+NO_EDITS_TEXT = "No edits: every month uses the monthly deposit."
+
+
 class InterestCalculator:
     """Handles the interest calculation logic"""
     
     @staticmethod
     def calculate_simple_interest(principal: float, annual_rate: float, 
-                                 months: int, monthly_deposit: float = 0) -> Tuple[float, float, float]:
+                                 months: int, monthly_deposit: float = 0,
+                                 rounding: Optional[str] = None) -> Tuple[float, float, float]:
         """
         Calculate simple interest and related amounts
         
@@ -44,6 +61,8 @@ class InterestCalculator:
             annual_rate: Annual interest rate in percentage
             months: Duration in months
             monthly_deposit: Optional monthly deposit amount
+            rounding: HALF_UP or HALF_EVEN to calculate exactly in integer
+                cents with that rounding mode; None for the float calculation
             
         Returns:
             Tuple of (total_interest, total_amount, monthly_interest)
@@ -51,6 +70,16 @@ class InterestCalculator:
         if any(val <= 0 for val in [principal, annual_rate, months]) or monthly_deposit < 0:
             raise ValueError("All values must be positive")
         
+        if rounding is not None:
+            results = simple_interest_cents(
+                parse_fixed(principal, CENTS, rounding),
+                parse_fixed(annual_rate, RATE_SCALE, rounding),
+                months,
+                parse_fixed(monthly_deposit, CENTS, rounding),
+                rounding=rounding,
+            )
+            return tuple(from_cents(cents) for cents in results)
+        
         years = months / 12
         principal_interest = principal * (annual_rate / 100) * years
         total_interest = principal_interest
@@ -69,6 +98,36 @@ class InterestCalculator:
         
         return round(total_interest, 2), round(total_amount, 2), round(average_monthly_interest, 2)
 
+    @staticmethod
+    def calculate_ledger_interest(principal: float, annual_rate: float, ledger: DepositLedger,
+                                  rounding: Optional[str] = None) -> Tuple[float, float, float]:
+        """
+        Calculate simple interest with individually edited monthly deposits
+        
+        Args:
+            principal: Initial amount
+            annual_rate: Annual interest rate in percentage
+            ledger: Deposits for every month of the duration; in dollars for
+                the float calculation, in integer cents when rounding is set
+            rounding: HALF_UP or HALF_EVEN for the exact cents calculation
+            
+        Returns:
+            Tuple of (total_interest, total_amount, monthly_interest)
+        """
+        months = ledger.months
+        if rounding is None:
+            total_interest = ledger.interest(months, principal, annual_rate)
+            total_amount = principal + ledger.total_deposits(months) + total_interest
+            average_monthly_interest = total_interest / months
+            return round(total_interest, 2), round(total_amount, 2), round(average_monthly_interest, 2)
+        
+        principal_cents = parse_fixed(principal, CENTS, rounding)
+        total_interest = mul_div(ledger.amount_months(months, principal_cents),
+                                 parse_fixed(annual_rate, RATE_SCALE, rounding), 1200 * RATE_SCALE, rounding)
+        total_amount = principal_cents + ledger.total_deposits(months) + total_interest
+        average_monthly_interest = div_round(total_interest, months, rounding)
+        return from_cents(total_interest), from_cents(total_amount), from_cents(average_monthly_interest)
+
 
 class InputValidator:
     """Handles input validation"""
@@ -111,20 +170,22 @@ class ResultsDisplay:
         self.total_label = total_label
         self.monthly_interest_label = monthly_interest_label
         self.results_frame = results_frame
+        # Labels are only reconfigured when their text changes, once per idle cycle
+        self.view = ViewBinding(results_frame)
     
     def update_results(self, total_interest: float, total_amount: float, 
                       monthly_interest: float) -> None:
         """Update the result labels with formatted values and visual feedback"""
         # Format currency values
-        self.interest_label.config(text=f"${total_interest:,.2f}")
-        self.total_label.config(text=f"${total_amount:,.2f}")
-        self.monthly_interest_label.config(text=f"${monthly_interest:,.2f}")
+        self.view.set(self.interest_label, text=f"${total_interest:,.2f}")
+        self.view.set(self.total_label, text=f"${total_amount:,.2f}")
+        self.view.set(self.monthly_interest_label, text=f"${monthly_interest:,.2f}")
     
     def clear_results(self) -> None:
         """Reset all result labels to zero"""
-        self.interest_label.config(text="$0.00")
-        self.total_label.config(text="$0.00")
-        self.monthly_interest_label.config(text="$0.00")
+        self.view.set(self.interest_label, text="$0.00")
+        self.view.set(self.total_label, text="$0.00")
+        self.view.set(self.monthly_interest_label, text="$0.00")
 
 
 class InputFields:
@@ -168,6 +229,11 @@ class SavingsCalculatorApp:
     
     def __init__(self, root: tk.Tk):
         self.root = root
+        # Deposits edited by month, the inputs of the last calculation and
+        # the ledger built from them (None until a deposit is edited)
+        self.deposit_overrides: Dict[int, float] = {}
+        self.last_inputs: Optional[Tuple[float, float, int, float, Optional[str]]] = None
+        self.ledger: Optional[DepositLedger] = None
         self.setup_window()
         self.create_widgets()
         self.setup_components()
@@ -175,7 +241,7 @@ class SavingsCalculatorApp:
     def setup_window(self) -> None:
         """Configure the main window settings"""
         self.root.title("💰 Simple Interest Calculator")
-        self.root.geometry("600x600")
+        self.root.geometry("600x760")
         self.root.resizable(False, False)
         self.root.configure(bg=Theme.COLORS['background'])
     
@@ -191,6 +257,9 @@ class SavingsCalculatorApp:
         # Input card
         self.create_input_card()
         
+        # Deposit edits card
+        self.create_deposit_editor()
+        
         # Results card
         self.create_results_card()
         
@@ -258,13 +327,21 @@ class SavingsCalculatorApp:
         self.monthly_entry.grid(row=3, column=1, pady=6, sticky=(tk.W, tk.E))
         self.monthly_entry.insert(0, "0")
         
+        # Rounding mode
+        ttk.Label(parent, text="Rounding:", font=Theme.FONTS['body']).grid(
+            row=4, column=0, sticky=tk.W, pady=6, padx=(0, 10))
+        self.rounding_combo = ttk.Combobox(parent, values=list(ROUNDING_CHOICES), state="readonly",
+                                           font=Theme.FONTS['body'], width=20)
+        self.rounding_combo.current(0)
+        self.rounding_combo.grid(row=4, column=1, pady=6, sticky=(tk.W, tk.E))
+        
         # Configure grid weights
         parent.columnconfigure(1, weight=1)
     
     def create_action_buttons(self, parent: ttk.Frame) -> None:
         """Create action buttons with proper styling"""
         button_frame = ttk.Frame(parent)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=5, column=0, columnspan=2, pady=15)
         
         # Create regular tkinter buttons with proper styling
         self.calculate_btn = tk.Button(
@@ -315,6 +392,27 @@ class SavingsCalculatorApp:
         )
         self.example_btn.pack(side=tk.LEFT)
     
+    def create_deposit_editor(self) -> None:
+        """Create the card for editing single months' deposits"""
+        editor = ttk.LabelFrame(self.main_container, text="✏️ Deposit Edits", padding="10")
+        editor.pack(fill=tk.X, pady=(0, 15))
+        
+        ttk.Label(editor, text="Month:", font=Theme.FONTS['body']).grid(row=0, column=0, sticky=tk.W)
+        self.edit_month_entry = ttk.Entry(editor, font=Theme.FONTS['body'], width=6)
+        self.edit_month_entry.grid(row=0, column=1, padx=(5, 15))
+        
+        ttk.Label(editor, text="Deposit ($):", font=Theme.FONTS['body']).grid(row=0, column=2, sticky=tk.W)
+        self.edit_amount_entry = ttk.Entry(editor, font=Theme.FONTS['body'], width=10)
+        self.edit_amount_entry.grid(row=0, column=3, padx=(5, 15))
+        
+        ttk.Button(editor, text="Set", command=self.apply_deposit_edit).grid(row=0, column=4, padx=(0, 5))
+        ttk.Button(editor, text="Reset", command=self.reset_deposit_edits).grid(row=0, column=5)
+        
+        self.edits_label = ttk.Label(editor, text=NO_EDITS_TEXT,
+                                     font=('Segoe UI', 9), foreground=Theme.COLORS['text_secondary'],
+                                     wraplength=520)
+        self.edits_label.grid(row=1, column=0, columnspan=6, sticky=tk.W, pady=(8, 0))
+    
     def create_results_card(self) -> None:
         """Create results display section as a card"""
         self.results_frame = ttk.LabelFrame(self.main_container, text="📈 Results", 
@@ -380,10 +478,18 @@ class SavingsCalculatorApp:
             # Get and validate inputs
             input_values = self.input_fields.get_values()
             principal, annual_rate, months, monthly_deposit = InputValidator.validate_inputs(*input_values)
+            rounding = ROUNDING_CHOICES[self.rounding_combo.get()]
+            self.last_inputs = (principal, annual_rate, months, monthly_deposit, rounding)
+            self.ledger = None
+            
+            if self.deposit_overrides:
+                self.ledger = self.build_ledger()
+                self.show_ledger_results()
+                return
             
             # Calculate results
             total_interest, total_amount, monthly_interest = InterestCalculator.calculate_simple_interest(
-                principal, annual_rate, months, monthly_deposit
+                principal, annual_rate, months, monthly_deposit, rounding=rounding
             )
             
             # Update display with visual feedback
@@ -394,8 +500,70 @@ class SavingsCalculatorApp:
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred: {str(e)}", icon='error')
     
+    def ledger_amount(self, amount: float):
+        """Amount in the ledger's unit: dollars, or integer cents in exact mode"""
+        rounding = self.last_inputs[4]
+        return amount if rounding is None else parse_fixed(amount, CENTS, rounding)
+    
+    def build_ledger(self) -> DepositLedger:
+        """Build the deposit ledger for the last inputs with all edits applied"""
+        months, monthly_deposit = self.last_inputs[2], self.last_inputs[3]
+        ledger = DepositLedger(months, self.ledger_amount(monthly_deposit))
+        for month, amount in self.deposit_overrides.items():
+            if month <= months:
+                ledger.set_deposit(month, self.ledger_amount(amount))
+        return ledger
+    
+    def show_ledger_results(self) -> None:
+        """Display results from the ledger and list the edited months"""
+        principal, annual_rate, months, _, rounding = self.last_inputs
+        self.results_display.update_results(
+            *InterestCalculator.calculate_ledger_interest(principal, annual_rate, self.ledger, rounding)
+        )
+        edits = [f"month {month}: ${amount:,.2f}"
+                 for month, amount in sorted(self.deposit_overrides.items()) if month <= months]
+        self.edits_label.config(text="Edited " + ", ".join(edits) if edits else NO_EDITS_TEXT)
+    
+    def apply_deposit_edit(self) -> None:
+        """Set one month's deposit and update the results in O(log n)"""
+        try:
+            if self.last_inputs is None:
+                raise ValueError("Calculate once before editing single deposits")
+            months = self.last_inputs[2]
+            try:
+                month = int(self.edit_month_entry.get())
+                amount = float(self.edit_amount_entry.get())
+            except ValueError:
+                raise ValueError("Enter a whole month number and a deposit amount") from None
+            if not 1 <= month <= months:
+                raise ValueError(f"Month must be between 1 and {months}")
+            if amount < 0:
+                raise ValueError("Deposits cannot be negative")
+            
+            self.deposit_overrides[month] = amount
+            if self.ledger is None:
+                self.ledger = self.build_ledger()
+            else:
+                self.ledger.set_deposit(month, self.ledger_amount(amount))
+            self.show_ledger_results()
+            
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e), icon='warning')
+    
+    def reset_deposit_edits(self) -> None:
+        """Drop all single-month edits and recalculate with the constant deposit"""
+        self.deposit_overrides.clear()
+        self.ledger = None
+        self.edits_label.config(text=NO_EDITS_TEXT)
+        if self.last_inputs is not None:
+            self.calculate_interest()
+    
     def clear_fields(self) -> None:
         """Clear all input fields and reset results"""
+        self.deposit_overrides.clear()
+        self.last_inputs = None
+        self.ledger = None
+        self.edits_label.config(text=NO_EDITS_TEXT)
         self.input_fields.clear_all()
         self.results_display.clear_results()
         self.amount_entry.focus_set()
@@ -426,6 +594,7 @@ def main():
     root = tk.Tk()
     app = SavingsCalculatorApp(root)
     center_window(root)
+    attach_if_enabled(root)
     root.mainloop()
 
 
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
 
+from money_format import get_formatter
+
 class KamataKalkulatorApp:
     def __init__(self, master):
         self.master = master
@@ -69,9 +71,12 @@ class KamataKalkulatorApp:
             ukupni_iznos = iznos + ukupna_kamata
 
             # Ažuriranje labele s rezultatima
-            self.rezultat_mj_kamata_label.config(text=f"Mjesečna kamata: {mjesecna_kamata:.2f} HRK")
-            self.rezultat_ukupna_kamata_label.config(text=f"Ukupna kamata: {ukupna_kamata:.2f} HRK")
-            self.rezultat_ukupno_label.config(text=f"Ukupan iznos na kraju: {ukupni_iznos:.2f} HRK")
+            mj_kamata, uk_kamata, ukupno = get_formatter('hr-HR', 'HRK').format_many(
+                [mjesecna_kamata, ukupna_kamata, ukupni_iznos]
+            )
+            self.rezultat_mj_kamata_label.config(text=f"Mjesečna kamata: {mj_kamata}")
+            self.rezultat_ukupna_kamata_label.config(text=f"Ukupna kamata: {uk_kamata}")
+            self.rezultat_ukupno_label.config(text=f"Ukupan iznos na kraju: {ukupno}")
         
         except ValueError:
             messagebox.showerror("Pogreška u unosu", "Molimo unesite valjane numeričke vrijednosti.")
@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+import numpy as np
+
+from interest_grid import ResultGrid
+
 class InterestCalculatorApp:
     """
     A GUI application for calculating simple interest using tkinter with an improved UI.
@@ -21,6 +25,15 @@ class InterestCalculatorApp:
     FONT_RESULT_LABEL = ("Helvetica", 11)
     FONT_RESULT_VALUE = ("Helvetica", 12, "bold")
 
+    # --- What-if slider settings ---
+    SLIDER_RANGES = {
+        'principal': (0.0, 100000.0),
+        'rate': (0.0, 20.0),
+        'months': (1.0, 360.0),
+    }
+    GRID_POINTS = {'principal': 51, 'rate': 41, 'months': 60}
+    REFINE_DELAY_MS = 150
+
     def __init__(self, root_window):
         """
         Initializes the application.
@@ -46,6 +59,14 @@ class InterestCalculatorApp:
         self.result_total_interest_var = tk.StringVar(value="$0.00")
         self.result_monthly_interest_var = tk.StringVar(value="$0.00")
 
+        self.what_if_enabled = tk.BooleanVar(value=False)
+        self.slider_vars = {
+            name: tk.DoubleVar(value=low) for name, (low, _) in self.SLIDER_RANGES.items()
+        }
+        self.slider_value_vars = {name: tk.StringVar() for name in self.SLIDER_RANGES}
+        self._grid = None
+        self._refine_job = None
+
     def _create_styles(self):
         """Creates custom styles for ttk widgets."""
         style = ttk.Style()
@@ -100,6 +121,9 @@ class InterestCalculatorApp:
         # --- Results Display ---
         self._create_results_display(main_frame)
 
+        # --- What-if Sliders ---
+        self._create_what_if_sliders(main_frame)
+
     def _create_input_field(self, parent, label_text, row):
         """Helper method to create a label and an entry widget in a grid."""
         label = ttk.Label(parent, text=label_text, style='TLabel')
@@ -126,6 +150,35 @@ class InterestCalculatorApp:
         value_display = ttk.Label(parent, textvariable=text_variable, font=self.FONT_RESULT_VALUE, foreground=self.RESULT_TEXT_COLOR, anchor="e")
         value_display.grid(row=row, column=1, sticky="e", pady=4, padx=5)
 
+    def _create_what_if_sliders(self, parent):
+        """Helper method to create the toggle and the (initially hidden) what-if sliders."""
+        toggle = ttk.Checkbutton(
+            parent, text="Live what-if sliders", variable=self.what_if_enabled,
+            command=self._toggle_what_if
+        )
+        toggle.pack(pady=(15, 5), anchor="w")
+
+        self.sliders_frame = ttk.Frame(parent, style='Card.TFrame', padding=15)
+        self.sliders_frame.columnconfigure(1, weight=1)
+
+        labels = {
+            'principal': "Principal Amount ($):",
+            'rate': "Annual Interest Rate (%):",
+            'months': "Duration (in months):",
+        }
+        for row, (name, (low, high)) in enumerate(self.SLIDER_RANGES.items()):
+            ttk.Label(self.sliders_frame, text=labels[name], style='TLabel').grid(
+                row=row, column=0, sticky="w", pady=5, padx=5
+            )
+            scale = ttk.Scale(
+                self.sliders_frame, from_=low, to=high, variable=self.slider_vars[name],
+                command=lambda value: self._on_slider_drag()
+            )
+            scale.grid(row=row, column=1, sticky="ew", pady=5, padx=5)
+            scale.bind("<ButtonRelease-1>", lambda event: self._refine_exact())
+            ttk.Label(self.sliders_frame, textvariable=self.slider_value_vars[name], width=10,
+                      anchor="e", style='TLabel').grid(row=row, column=2, sticky="e", pady=5, padx=5)
+
     def _calculate_interest(self):
         """
         Validates input, calculates simple interest, and updates the display.
@@ -139,19 +192,103 @@ class InterestCalculatorApp:
                 messagebox.showerror("Input Error", "Please enter positive values. Duration must be greater than 0.")
                 return
 
-            total_interest = principal * (annual_rate / 100) * (months / 12)
-            total_amount = principal + total_interest
-            monthly_interest_amount = total_interest / months
-
-            self.result_total_amount_var.set(f"${total_amount:,.2f}")
-            self.result_total_interest_var.set(f"${total_interest:,.2f}")
-            self.result_monthly_interest_var.set(f"${monthly_interest_amount:,.2f}")
+            self._show_results(*self.simple_interest(principal, annual_rate, months))
 
         except ValueError:
             messagebox.showerror("Input Error", "Please enter valid numbers in all fields.")
         except Exception as e:
             messagebox.showerror("Error", f"An unexpected error occurred: {e}")
 
+    @staticmethod
+    def simple_interest(principal, annual_rate, months):
+        """
+        Returns (total_amount, total_interest, monthly_interest).
+        Works on plain numbers as well as on NumPy arrays.
+        """
+        total_interest = principal * (annual_rate / 100) * (months / 12)
+        total_amount = principal + total_interest
+        monthly_interest_amount = total_interest / months
+        return total_amount, total_interest, monthly_interest_amount
+
+    def _show_results(self, total_amount, total_interest, monthly_interest_amount):
+        """Writes the three results into the display."""
+        self.result_total_amount_var.set(f"${total_amount:,.2f}")
+        self.result_total_interest_var.set(f"${total_interest:,.2f}")
+        self.result_monthly_interest_var.set(f"${monthly_interest_amount:,.2f}")
+
+    def _toggle_what_if(self):
+        """Shows or hides the sliders; the result grid is built in the background on first use."""
+        if not self.what_if_enabled.get():
+            self.sliders_frame.pack_forget()
+            return
+
+        self.sliders_frame.pack(fill="x", expand=True)
+        if self._grid is None:
+            ranges = self.SLIDER_RANGES
+            self._grid = ResultGrid(
+                lambda p, r, m: np.stack(self.simple_interest(p, r, m), axis=-1),
+                (*ranges['principal'], self.GRID_POINTS['principal']),
+                (*ranges['rate'], self.GRID_POINTS['rate']),
+                (*ranges['months'], self.GRID_POINTS['months']),
+            )
+            self._grid.build_async()
+        self._sync_sliders_from_entries()
+        self._on_slider_drag()
+
+    def _slider_values(self):
+        principal = self.slider_vars['principal'].get()
+        rate = self.slider_vars['rate'].get()
+        months = max(1, int(round(self.slider_vars['months'].get())))
+        return principal, rate, months
+
+    def _sync_sliders_from_entries(self):
+        """Starts the sliders from the values typed into the entries, when they are valid."""
+        try:
+            values = {
+                'principal': float(self.principal_entry.get()),
+                'rate': float(self.rate_entry.get()),
+                'months': float(int(self.months_entry.get())),
+            }
+        except ValueError:
+            return
+        for name, value in values.items():
+            low, high = self.SLIDER_RANGES[name]
+            self.slider_vars[name].set(min(max(value, low), high))
+
+    def _on_slider_drag(self):
+        """
+        Answers a drag event from the precomputed grid and schedules the
+        exact calculation for when the sliders stop moving.
+        """
+        principal, rate, months = self._slider_values()
+        self.slider_value_vars['principal'].set(f"${principal:,.0f}")
+        self.slider_value_vars['rate'].set(f"{rate:.2f}%")
+        self.slider_value_vars['months'].set(f"{months} mo")
+
+        approximation = self._grid.lookup(principal, rate, months) if self._grid else None
+        if approximation is None:
+            # Grid still building: the direct formula is cheap enough for one point
+            self._show_results(*self.simple_interest(principal, rate, months))
+        else:
+            self._show_results(*approximation)
+
+        if self._refine_job is not None:
+            self.root.after_cancel(self._refine_job)
+        self._refine_job = self.root.after(self.REFINE_DELAY_MS, self._refine_exact)
+
+    def _refine_exact(self):
+        """Copies the slider values into the entries and runs the exact calculation."""
+        if self._refine_job is not None:
+            self.root.after_cancel(self._refine_job)
+            self._refine_job = None
+        principal, rate, months = self._slider_values()
+        for entry, value in ((self.principal_entry, f"{principal:.2f}"),
+                             (self.rate_entry, f"{rate:.2f}"),
+                             (self.months_entry, str(months))):
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
+        self._calculate_interest()
+
     def _clear_fields(self):
         """Clears all input and result fields."""
         self.principal_entry.delete(0, tk.END)
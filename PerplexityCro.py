@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import messagebox
 
+from tiered_rates import product_choices
+
+PROIZVODI = product_choices("Vlastita kamatna stopa")
+
 class KalkulatorKamate:
     def __init__(self, root):
         self.root = root
@@ -39,6 +43,14 @@ class KalkulatorKamate:
         self.entry_mjeseci = tk.Entry(row3)
         self.entry_mjeseci.pack(side="right", fill="x", expand=True)
 
+        # Proizvod: vlastita stopa ili stope po razredima stanja
+        row4 = tk.Frame(frame_unos)
+        row4.pack(fill="x", pady=5)
+        tk.Label(row4, text="Štedni proizvod:", width=20, anchor='w').pack(side="left")
+        self.var_proizvod = tk.StringVar(value=next(iter(PROIZVODI)))
+        tk.OptionMenu(row4, self.var_proizvod, *PROIZVODI, command=self._promijeni_proizvod).pack(
+            side="right", fill="x", expand=True)
+
         # Gumb za izračun
         btn_frame = tk.Frame(self.root)
         btn_frame.pack(fill="x", padx=10, pady=(0,10))
@@ -58,17 +70,27 @@ class KalkulatorKamate:
         self.label_ukupan_iznos = tk.Label(frame_izlaz, text="Ukupan iznos: -")
         self.label_ukupan_iznos.pack(anchor="w", pady=5)
 
+        self.label_stopa = tk.Label(frame_izlaz, text="Prosječna stopa: -")
+        self.label_stopa.pack(anchor="w", pady=5)
+
+    def _promijeni_proizvod(self, naziv):
+        # Proizvod s razredima sam određuje stopu pa polje stope nije potrebno
+        self.entry_kamata.config(state="normal" if PROIZVODI[naziv] is None else "disabled")
+
     def izracunaj(self):
         try:
+            proizvod = PROIZVODI[self.var_proizvod.get()]
             iznos = float(self.entry_iznos.get())
-            god_kamata = float(self.entry_kamata.get())
+            god_kamata = float(self.entry_kamata.get()) if proizvod is None else 0.0
             mjeseci = int(self.entry_mjeseci.get())
 
             if not self._validiraj_unos(iznos, god_kamata, mjeseci):
                 return
 
-            mjesecna_kamata, ukupna_kamata, ukupan_iznos = self._izracunaj_kamate(iznos, god_kamata, mjeseci)
+            mjesecna_kamata, ukupna_kamata, ukupan_iznos = self._izracunaj_kamate(iznos, god_kamata, mjeseci, proizvod)
             self._prikazi_rezultate(mjesecna_kamata, ukupna_kamata, ukupan_iznos)
+            stopa = god_kamata if proizvod is None else float(proizvod.blended_rate(iznos))
+            self.label_stopa.config(text=f"Prosječna stopa: {stopa:.3f} %")
 
         except ValueError:
             messagebox.showerror("Greška", "Molimo unesite valjane brojeve!")
@@ -79,7 +101,10 @@ class KalkulatorKamate:
             return False
         return True
 
-    def _izracunaj_kamate(self, iznos, god_kamata, mjeseci):
+    def _izracunaj_kamate(self, iznos, god_kamata, mjeseci, proizvod=None):
+        if proizvod is not None:
+            ukupna_kamata, mjesecna_kamata, ukupan_iznos = map(float, proizvod.simple_interest(iznos, mjeseci))
+            return mjesecna_kamata, ukupna_kamata, ukupan_iznos
         mjesecna_kamata_stopa = god_kamata / 100 / 12
         mjesecna_kamata = iznos * mjesecna_kamata_stopa
         ukupna_kamata = mjesecna_kamata * mjeseci
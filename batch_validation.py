@@ -0,0 +1,196 @@
+"""
+Validation of whole input files with boolean masks instead of exceptions.
+
+The GUI validators (InputValidator in ClaudeENG and DeepSeekENG) stop at the
+first bad field by raising ValueError, which is right for a form but costs
+one exception per bad row when checking a file. Here every rule is a
+vectorized check that yields a boolean mask over all rows; the masks are
+combined into a ValidationReport with the number of failing rows and their
+indices per rule, and nothing is raised for bad data.
+
+Each field gets three built-in rules, checked in order so a row is reported
+once per field:
+
+    <field>_required  a required value is missing
+    <field>_number    the text is not a number (see number_parsing)
+    <field>_integer   a fractional value in an integer field
+
+followed by the value rules in RULES (positivity and so on), which only see
+rows whose value parsed. Columns shorter than the longest one are padded
+with empty cells, and the rows past their end fail the row_incomplete rule.
+
+Usage:
+    python batch_validation.py accounts.csv --locale hr-HR
+"""
+
+import argparse
+import csv
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Callable, Dict, List, Mapping, Sequence, Union
+
+import numpy as np
+
+from number_parsing import EMPTY, OK, get_parser
+
+
+@dataclass(frozen=True)
+class Field:
+    """An input column."""
+    name: str
+    required: bool = True
+    integer: bool = False
+
+
+@dataclass(frozen=True)
+class Rule:
+    """A vectorized check on the parsed values of one field."""
+    name: str
+    field: str
+    message: str
+    fails: Callable[[np.ndarray], np.ndarray]
+
+
+FIELDS = (
+    Field('principal'),
+    Field('annual_rate'),
+    Field('months', integer=True),
+    Field('monthly_deposit', required=False),
+)
+
+RULES = (
+    Rule('principal_positive', 'principal', "Principal must be positive", lambda values: values <= 0),
+    Rule('rate_non_negative', 'annual_rate', "Interest rate cannot be negative", lambda values: values < 0),
+    Rule('months_positive', 'months', "Duration must be at least one month", lambda values: values <= 0),
+    Rule('deposit_non_negative', 'monthly_deposit', "Monthly deposit cannot be negative",
+         lambda values: values < 0),
+)
+
+Column = Union[Sequence[str], np.ndarray]
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of validating a batch of rows."""
+    rows: int
+    valid: np.ndarray
+    values: Dict[str, np.ndarray]
+    failures: Dict[str, np.ndarray] = field(default_factory=dict)
+    messages: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """True if every row passed every rule."""
+        return not self.failures
+
+    def counts(self) -> Dict[str, int]:
+        """Number of failing rows per rule, for rules that failed."""
+        return {name: int(rows.size) for name, rows in self.failures.items()}
+
+    def summary(self, max_rows: int = 5) -> str:
+        """Readable report: one line per failed rule with its first few row numbers (1-based)."""
+        lines = [f"{int(self.valid.sum())} of {self.rows} rows valid"]
+        for name, rows in self.failures.items():
+            shown = ", ".join(str(row + 1) for row in rows[:max_rows])
+            more = f", ... (+{rows.size - max_rows})" if rows.size > max_rows else ""
+            lines.append(f"  {name}: {rows.size} rows - {self.messages[name]} (rows {shown}{more})")
+        return "\n".join(lines)
+
+
+def validate_columns(columns: Mapping[str, Column], fields: Sequence[Field] = FIELDS,
+                     rules: Sequence[Rule] = RULES, locale: str = 'en-US') -> ValidationReport:
+    """
+    Validate columns of raw strings (or already numeric arrays) in one pass per rule.
+
+    Args:
+        columns: Column name -> values; missing optional columns count as empty
+        fields: Expected columns
+        rules: Value rules applied to rows whose field parsed
+        locale: Number format of string columns (see number_parsing)
+
+    Returns:
+        ValidationReport with the parsed values (0 where a value is missing or did
+        not parse; values failing a value rule are kept) and the failing rows per rule
+    """
+    rows = max((len(columns[spec.name]) for spec in fields if spec.name in columns), default=0)
+    incomplete = np.zeros(rows, dtype=bool)
+
+    parser = get_parser(locale)
+    masks: Dict[str, np.ndarray] = {}
+    messages: Dict[str, str] = {}
+    values: Dict[str, np.ndarray] = {}
+    parsed: Dict[str, np.ndarray] = {}
+
+    def check(name: str, message: str, mask: np.ndarray) -> None:
+        masks[name] = mask
+        messages[name] = message
+
+    for spec in fields:
+        column = columns.get(spec.name)
+        if column is not None and len(column) < rows:
+            incomplete[len(column):] = True
+            column = _pad(column, rows)
+        if column is None:
+            values[spec.name], errors = np.zeros(rows), np.full(rows, EMPTY, dtype=np.uint8)
+        elif isinstance(column, np.ndarray) and column.dtype.kind in 'fiu':
+            values[spec.name] = column.astype(float)
+            errors = np.where(np.isnan(values[spec.name]), EMPTY, OK).astype(np.uint8)
+        else:
+            result = parser.parse_many(column)
+            values[spec.name], errors = result.values, result.errors
+
+        if spec.required:
+            check(f"{spec.name}_required", f"{spec.name} is required", errors == EMPTY)
+        check(f"{spec.name}_number", f"{spec.name} must be a valid number", (errors != OK) & (errors != EMPTY))
+        ok = errors == OK
+        if spec.integer:
+            fractional = ok & (values[spec.name] != np.trunc(values[spec.name]))
+            check(f"{spec.name}_integer", f"{spec.name} must be a whole number", fractional)
+            ok &= ~fractional
+        values[spec.name][~ok] = 0
+        parsed[spec.name] = ok
+
+    check('row_incomplete', "row is missing cells at the end of a column", incomplete)
+    for rule in rules:
+        check(rule.name, rule.message, parsed[rule.field] & rule.fails(values[rule.field]))
+
+    invalid = np.zeros(rows, dtype=bool)
+    for mask in masks.values():
+        invalid |= mask
+    failures = {name: np.flatnonzero(mask) for name, mask in masks.items() if mask.any()}
+    return ValidationReport(rows, ~invalid, values, failures,
+                            {name: messages[name] for name in failures})
+
+
+def _pad(column: Column, rows: int) -> Column:
+    """Extend a column to ``rows`` with empty cells (NaN for numeric arrays)."""
+    missing = rows - len(column)
+    if isinstance(column, np.ndarray) and column.dtype.kind in 'fiu':
+        return np.concatenate([column.astype(float), np.full(missing, np.nan)])
+    return list(column) + [""] * missing
+
+
+def read_columns(path: str) -> Dict[str, List[str]]:
+    """Read a CSV file with a header row into lists of strings per column; short rows are padded."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        data = list(zip_longest(*reader, fillvalue=""))
+    rows = len(data[0]) if data else 0
+    return {name: list(data[index]) if index < len(data) else [""] * rows for index, name in enumerate(header)}
+
+
+def main() -> None:
+    """Command-line entry point: validate a CSV of accounts."""
+    parser = argparse.ArgumentParser(description="Validate an input file without stopping at the first error.")
+    parser.add_argument('input', help="CSV with principal, annual_rate, months and optional monthly_deposit")
+    parser.add_argument('--locale', default='en-US', help="number format, e.g. hr-HR or en-US")
+    parser.add_argument('--max-rows', type=int, default=5, help="row numbers shown per rule")
+    args = parser.parse_args()
+
+    report = validate_columns(read_columns(args.input), locale=args.locale)
+    print(report.summary(args.max_rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Accuracy and speed benchmark for the annuity factor ((1 + r) ** n - 1) / r.
+
+The stable kernels in compounding (annuity_factor for arrays,
+annuity_factor_scalar for Python floats) are compared with the textbook
+expression ClaudeENG's savings calculator used. Every float input is
+converted exactly to a high-precision oracle value (mpmath when it is
+installed, otherwise decimal), so the reported relative errors are those of
+the double-precision evaluations alone.
+
+Usage:
+    python bench_annuity.py
+    python bench_annuity.py --size 2000000 --digits 60
+"""
+
+import argparse
+import time
+from decimal import Decimal, localcontext
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from compounding import annuity_factor, annuity_factor_scalar
+
+try:
+    import mpmath
+except ImportError:  # decimal is slower but always available
+    mpmath = None
+
+
+RATE_DECADES = list(range(-16, 0))
+HORIZONS = [1, 12, 120, 360, 1200, 12000, 120000]
+
+
+def naive_factor(rate, periods):
+    """The textbook expression, with the zero-rate special case."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = ((1 + rate) ** periods - 1) / rate
+    return np.where(rate == 0, periods, factor)
+
+
+def naive_factor_scalar(rate: float, periods: float) -> float:
+    """The expression from ClaudeENG's calculate_monthly_savings."""
+    if rate == 0:
+        return periods
+    return ((1 + rate) ** periods - 1) / rate
+
+
+def oracle_factor(rate: float, periods: int, digits: int) -> float:
+    """Exact-input high-precision annuity factor, rounded to the nearest float."""
+    if rate == 0:
+        return float(periods)
+    if mpmath is not None:
+        with mpmath.workdps(digits):
+            r = mpmath.mpf(rate)
+            return float(mpmath.expm1(periods * mpmath.log1p(r)) / r)
+    with localcontext() as context:
+        context.prec = digits
+        r = Decimal(rate)
+        return float(((1 + r) ** periods - 1) / r)
+
+
+def check_input_shapes() -> None:
+    """
+    annuity_factor must accept every ArrayLike: Python scalars, 0-d arrays and lists.
+
+    Raises:
+        AssertionError: If a shape fails or disagrees with annuity_factor_scalar
+    """
+    cases = [(0.0, 120), (0.004, 120), (np.array(0.004), np.array(120)), (np.float64(1e-12), 12)]
+    for rate, periods in cases:
+        factor = annuity_factor(rate, periods)
+        assert factor.shape == (), (rate, periods, factor.shape)
+        expected = annuity_factor_scalar(float(rate), float(periods))
+        assert abs(float(factor) - expected) <= 4e-16 * expected, (rate, periods, float(factor), expected)
+    factors = annuity_factor([0.0, 0.004], 120)
+    assert factors.shape == (2,) and factors[0] == 120.0, factors
+
+
+def accuracy_table(digits: int, samples: int, seed: int = 1) -> List[Tuple[int, int, float, float]]:
+    """
+    Maximum relative error of both expressions per (rate decade, horizon) cell.
+
+    Returns:
+        Rows of (rate decade, horizon, naive error, stable error)
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for decade in RATE_DECADES:
+        rates = 10.0 ** (decade + rng.random(samples))
+        for periods in HORIZONS:
+            exact = np.array([oracle_factor(float(rate), periods, digits) for rate in rates])
+            with np.errstate(over='ignore'):
+                naive = naive_factor(rates, periods)
+                stable = annuity_factor(rates, periods)
+            finite = np.isfinite(exact)
+            if not finite.any():
+                continue
+            exact, naive, stable = exact[finite], naive[finite], stable[finite]
+            rows.append((decade, periods,
+                         float(np.max(np.abs(naive - exact) / exact)),
+                         float(np.max(np.abs(stable - exact) / exact))))
+    return rows
+
+
+def _best_time(function: Callable[[], object], repeat: int = 5) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def speed_table(size: int, seed: int = 2) -> List[Tuple[str, float, float]]:
+    """
+    Time both expressions on arrays and on Python scalars.
+
+    Returns:
+        Rows of (case, naive ns per value, stable ns per value)
+    """
+    rng = np.random.default_rng(seed)
+    rates = 10.0 ** rng.uniform(-8, -1, size)
+    periods = rng.integers(1, 600, size).astype(float)
+
+    rows = [('numpy arrays',
+             _best_time(lambda: naive_factor(rates, periods)) / size * 1e9,
+             _best_time(lambda: annuity_factor(rates, periods)) / size * 1e9)]
+
+    scalar_rates = rates[:100000].tolist()
+    scalar_periods = periods[:100000].tolist()
+    pairs = list(zip(scalar_rates, scalar_periods))
+
+    def scalar_naive():
+        for rate, n in pairs:
+            naive_factor_scalar(rate, n)
+
+    def scalar_stable():
+        for rate, n in pairs:
+            annuity_factor_scalar(rate, n)
+
+    rows.append(('python scalars',
+                 _best_time(scalar_naive) / len(pairs) * 1e9,
+                 _best_time(scalar_stable) / len(pairs) * 1e9))
+    return rows
+
+
+def main() -> None:
+    """Command-line entry point: print the accuracy and speed tables."""
+    parser = argparse.ArgumentParser(description="Accuracy and speed of the annuity factor kernels.")
+    parser.add_argument('--digits', type=int, default=50, help="oracle precision in decimal digits")
+    parser.add_argument('--samples', type=int, default=20, help="random rates per decade")
+    parser.add_argument('--size', type=int, default=1000000, help="array length for the speed test")
+    args = parser.parse_args()
+
+    check_input_shapes()
+    oracle = "mpmath" if mpmath is not None else "decimal"
+    print(f"Max relative error vs {oracle} oracle ({args.digits} digits)")
+    print(f"{'rate':>8}{'periods':>9}{'naive':>12}{'stable':>12}")
+    for decade, periods, naive_error, stable_error in accuracy_table(args.digits, args.samples):
+        print(f"{'1e' + str(decade):>8}{periods:>9}{naive_error:>12.2e}{stable_error:>12.2e}")
+
+    print("\nSpeed (best of 5, ns per value)")
+    print(f"{'case':<16}{'naive':>10}{'stable':>10}")
+    for case, naive_ns, stable_ns in speed_table(args.size):
+        print(f"{case:<16}{naive_ns:>10.1f}{stable_ns:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
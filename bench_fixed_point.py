@@ -0,0 +1,96 @@
+"""
+Exactness and speed of the int64-cents simple-interest kernel.
+
+Random portfolios are evaluated by fixed_point.simple_interest_cents and by
+a per-value decimal.Decimal reference. The script reports mismatches (which
+must be zero for both rounding modes) and the time per row of each. It first
+checks that number_parsing reads amounts around 2**46 and MAX_CENTS_AMOUNT
+into exact cents.
+
+Usage:
+    python bench_fixed_point.py
+    python bench_fixed_point.py --rows 200000
+"""
+
+import argparse
+import time
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from typing import List, Tuple
+
+import numpy as np
+
+from fixed_point import HALF_EVEN, HALF_UP, RATE_SCALE, simple_interest_cents
+from number_parsing import MAX_CENTS_AMOUNT, OK, RANGE, parse_column
+
+
+DECIMAL_ROUNDING = {HALF_UP: ROUND_HALF_UP, HALF_EVEN: ROUND_HALF_EVEN}
+
+
+def decimal_interest(principal: int, rate: int, months: int, deposit: int, rounding: str) -> Tuple[int, int, int]:
+    """Reference implementation: DeepSeekENG's deposit loop in Decimal cents."""
+    mode = DECIMAL_ROUNDING[rounding]
+    annual = Decimal(rate) / (100 * RATE_SCALE)
+    interest = Decimal(principal) * annual * months / 12
+    for month in range(months):
+        interest += Decimal(deposit) * annual * (months - month) / 12
+    total = int(interest.quantize(Decimal(1), rounding=mode))
+    monthly = int((Decimal(total) / months).quantize(Decimal(1), rounding=mode))
+    return total, principal + deposit * months + total, monthly
+
+
+def random_portfolio(rows: int, seed: int = 0) -> List[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return [
+        rng.integers(1, 10**9, rows),             # principal: up to 10M in cents
+        rng.integers(0, 20 * RATE_SCALE, rows),   # rate: up to 20 %
+        rng.integers(1, 121, rows),               # months: up to 10 years
+        rng.integers(0, 10**5, rows),             # monthly deposit: up to 1000
+    ]
+
+
+def check_parsed_cents(samples: int = 2000, seed: int = 3) -> None:
+    """
+    Amounts from 2**46 up to MAX_CENTS_AMOUNT must parse to the cents they
+    were written with, and MAX_CENTS_AMOUNT itself must be out of range.
+    """
+    limit = int(Decimal(MAX_CENTS_AMOUNT) * 100)
+    rng = np.random.default_rng(seed)
+    cents = rng.integers(2 ** 46 * 100, limit, samples).tolist() + [2 ** 46 * 100 + 1, limit - 1]
+    texts = [f"{value // 100},{value % 100:02d}" for value in cents]
+    result = parse_column(texts, cents=True)
+    assert (result.errors == OK).all(), "amounts below MAX_CENTS_AMOUNT must parse"
+    wrong = [text for text, value, expected in zip(texts, result.values.tolist(), cents) if value != expected]
+    assert not wrong, f"{len(wrong)} amounts parsed to the wrong cents, e.g. {wrong[:3]}"
+
+    edge = parse_column([f"{limit // 100},{limit % 100:02d}"], cents=True)
+    assert edge.errors[0] == RANGE, "MAX_CENTS_AMOUNT must be out of range"
+
+
+def main() -> None:
+    """Command-line entry point: check exactness and print timings."""
+    parser = argparse.ArgumentParser(description="Exactness and speed of fixed-point interest.")
+    parser.add_argument('--rows', type=int, default=1000000, help="rows for the vectorized kernel")
+    parser.add_argument('--reference-rows', type=int, default=5000, help="rows checked against Decimal")
+    args = parser.parse_args()
+
+    check_parsed_cents()
+    columns = random_portfolio(args.rows)
+    print(f"{'rounding':<11}{'mismatches':>12}{'int64 ns/row':>14}{'Decimal ns/row':>16}")
+    for rounding in (HALF_UP, HALF_EVEN):
+        start = time.perf_counter()
+        results = simple_interest_cents(*columns, rounding=rounding)
+        vector_ns = (time.perf_counter() - start) / args.rows * 1e9
+
+        checked = min(args.reference_rows, args.rows)
+        mismatches = 0
+        start = time.perf_counter()
+        for i in range(checked):
+            expected = decimal_interest(*(int(column[i]) for column in columns), rounding)
+            mismatches += expected != tuple(int(result[i]) for result in results)
+        decimal_ns = (time.perf_counter() - start) / checked * 1e9
+
+        print(f"{rounding:<11}{mismatches:>12}{vector_ns:>14.1f}{decimal_ns:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Calculate-to-idle latency benchmark for every calculator GUI.
+
+Each app runs in its own process under Xvfb. The harness fills the inputs
+programmatically, fires the Calculate command and measures the time until
+Tk has processed every resulting event and redraw. Inputs change on every
+iteration so the result labels really are updated.
+
+Usage:
+    python bench_latency.py
+    python bench_latency.py --iterations 5000 ClaudeENG.py DeepSeekCro.py
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from gui_harness import APP_SPECS, DialogRaised, DrivenApp, VirtualDisplay, input_cycle, run_worker
+
+
+def measure_app(script: str, iterations: int, warmup: int = 50) -> Dict[str, float]:
+    """
+    Measure calculate-to-idle latency of one app in the current process.
+
+    Returns:
+        Summary statistics in milliseconds plus the number of dialogs raised
+    """
+    app = DrivenApp(APP_SPECS[script])
+    samples: List[float] = []
+    dialogs = 0
+    try:
+        for iteration in range(warmup + iterations):
+            app.set_inputs(input_cycle(iteration))
+            app.settle()
+
+            start = time.perf_counter()
+            try:
+                app.calculate()
+            except DialogRaised:
+                dialogs += 1
+            app.settle()
+            elapsed = time.perf_counter() - start
+
+            if iteration >= warmup:
+                samples.append(elapsed * 1000)
+    finally:
+        app.destroy()
+
+    percentiles = statistics.quantiles(samples, n=100, method='inclusive')
+    return {
+        'iterations': iterations,
+        'mean_ms': statistics.fmean(samples),
+        'p50_ms': percentiles[49],
+        'p90_ms': percentiles[89],
+        'p99_ms': percentiles[98],
+        'max_ms': max(samples),
+        'dialogs': dialogs,
+    }
+
+
+def main() -> None:
+    """Command-line entry point: benchmark the apps and print a comparison."""
+    parser = argparse.ArgumentParser(description="Calculate-to-idle latency of the calculator GUIs.")
+    parser.add_argument('scripts', nargs='*', help="apps to benchmark (default: all)")
+    parser.add_argument('--iterations', type=int, default=2000, help="measured iterations per app")
+    parser.add_argument('--display', default=None, help="use this X display instead of starting Xvfb")
+    parser.add_argument('--json', action='store_true', help="print raw results as JSON")
+    parser.add_argument('--worker', metavar='SCRIPT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(measure_app(args.worker, args.iterations)))
+        return
+
+    scripts = args.scripts or list(APP_SPECS)
+    results = {}
+    with VirtualDisplay(args.display):
+        for script in scripts:
+            output = run_worker('bench_latency', ['--worker', script, '--iterations', str(args.iterations)])
+            results[script] = json.loads(output)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'app':<18}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}{'mean ms':>9}{'dialogs':>9}")
+    for script, stats in sorted(results.items(), key=lambda item: item[1]['p50_ms']):
+        print(f"{script:<18}{stats['p50_ms']:>9.3f}{stats['p90_ms']:>9.3f}{stats['p99_ms']:>9.3f}"
+              f"{stats['max_ms']:>9.3f}{stats['mean_ms']:>9.3f}{stats['dialogs']:>9}")
+
+
+if __name__ == "__main__":
+    main()
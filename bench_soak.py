@@ -0,0 +1,204 @@
+"""
+Memory soak benchmark for the calculator GUIs.
+
+Kiosk installs run an app for weeks, so a few bytes or one Tcl command
+leaked per calculation add up. Each app runs in its own process under Xvfb
+and repeats its calculate/clear cycle (with changing inputs, and hovering
+every widget that has an <Enter> binding so tooltips are created and
+destroyed) for a large number of iterations. Every sample_every iterations
+the worker records:
+
+    rss_kb      resident set size of the process
+    traced_kb   Python heap allocated since tracing started (tracemalloc)
+    commands    Tcl commands in the interpreter (widgets, callbacks)
+    images      Tcl images
+    widgets     live Tk widgets
+    afters      pending after() callbacks
+
+After a warm-up the trend of every series is fitted with a least-squares
+line; a series whose projected growth per 100,000 iterations exceeds its
+limit in GROWTH_LIMITS is flagged. The source lines that gained the most
+memory between the first and last tracemalloc snapshot are listed for
+flagged apps.
+
+Usage:
+    python bench_soak.py ClaudeENG.py DeepSeekCro.py
+    python bench_soak.py --iterations 500000 --sample-every 5000
+"""
+
+import argparse
+import json
+import os
+import resource
+import tkinter as tk
+import tracemalloc
+from typing import Dict, List
+
+from gui_harness import APP_SPECS, DialogRaised, DrivenApp, VirtualDisplay, input_cycle, run_worker
+
+
+SERIES = ('rss_kb', 'traced_kb', 'commands', 'images', 'widgets', 'afters')
+
+# Allowed growth per 100,000 iterations before a series is flagged
+GROWTH_LIMITS = {
+    'rss_kb': 4096,
+    'traced_kb': 1024,
+    'commands': 1,
+    'images': 1,
+    'widgets': 1,
+    'afters': 1,
+}
+
+# Fraction of the samples treated as warm-up (caches filling, first allocations)
+WARMUP_FRACTION = 0.2
+
+# Source lines listed per flagged app
+TOP_LINES = 5
+
+
+def rss_kb() -> int:
+    """Current resident set size; the peak where /proc is unavailable."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _widgets(widget: tk.Misc) -> List[tk.Misc]:
+    found = [widget]
+    for child in widget.winfo_children():
+        found.extend(_widgets(child))
+    return found
+
+
+def sample(root: tk.Misc) -> Dict[str, int]:
+    """One measurement of every series."""
+    return {
+        'rss_kb': rss_kb(),
+        'traced_kb': tracemalloc.get_traced_memory()[0] // 1024,
+        'commands': len(root.tk.splitlist(root.tk.call('info', 'commands'))),
+        'images': len(root.tk.splitlist(root.tk.call('image', 'names'))),
+        'widgets': len(_widgets(root)),
+        'afters': len(root.tk.splitlist(root.tk.call('after', 'info'))),
+    }
+
+
+def slope(xs: List[float], ys: List[float]) -> float:
+    """Least-squares slope of ys over xs."""
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def growth(samples: List[Dict[str, int]]) -> Dict[str, float]:
+    """Fitted growth per 100,000 iterations of every series, ignoring the warm-up."""
+    steady = samples[int(len(samples) * WARMUP_FRACTION):]
+    if len(steady) < 2:
+        return {name: 0.0 for name in SERIES}
+    iterations = [entry['iteration'] for entry in steady]
+    return {name: slope(iterations, [entry[name] for entry in steady]) * 100_000 for name in SERIES}
+
+
+def soak_app(script: str, iterations: int, sample_every: int, hover: bool = True) -> Dict:
+    """
+    Run one app's calculate/clear cycle ``iterations`` times in the current process.
+
+    Returns:
+        Samples, fitted growth, flagged series and the top growing source lines
+    """
+    tracemalloc.start()
+    app = DrivenApp(APP_SPECS[script])
+    hovered = [widget for widget in _widgets(app.root) if '<Enter>' in widget.bind()] if hover else []
+    samples: List[Dict[str, int]] = []
+    dialogs = 0
+    first_snapshot = None
+    try:
+        for iteration in range(iterations + 1):
+            if iteration % sample_every == 0:
+                app.settle()
+                samples.append(dict(sample(app.root), iteration=iteration))
+                if first_snapshot is None and iteration >= iterations * WARMUP_FRACTION:
+                    first_snapshot = tracemalloc.take_snapshot()
+            app.set_inputs(input_cycle(iteration))
+            try:
+                app.calculate()
+            except DialogRaised:
+                dialogs += 1
+            for widget in hovered:
+                widget.event_generate('<Enter>')
+                widget.event_generate('<Leave>')
+            app.settle()
+            app.clear()
+            app.settle()
+        last_snapshot = tracemalloc.take_snapshot()
+    finally:
+        app.destroy()
+        tracemalloc.stop()
+
+    fitted = growth(samples)
+    flagged = [name for name in SERIES if fitted[name] > GROWTH_LIMITS[name]]
+    top_lines = []
+    if flagged and first_snapshot is not None:
+        for stat in last_snapshot.compare_to(first_snapshot, 'lineno')[:TOP_LINES]:
+            frame = stat.traceback[0]
+            top_lines.append(f"{os.path.basename(frame.filename)}:{frame.lineno} "
+                             f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks)")
+    return {
+        'iterations': iterations,
+        'dialogs': dialogs,
+        'hovered': len(hovered),
+        'samples': samples,
+        'growth': fitted,
+        'flagged': flagged,
+        'top_lines': top_lines,
+    }
+
+
+def main() -> None:
+    """Command-line entry point: soak the apps and report memory growth."""
+    parser = argparse.ArgumentParser(description="Long-running memory soak of the calculator GUIs.")
+    parser.add_argument('scripts', nargs='*', help="apps to soak (default: all)")
+    parser.add_argument('--iterations', type=int, default=200_000, help="calculate/clear cycles per app")
+    parser.add_argument('--sample-every', type=int, default=2000, help="iterations between samples")
+    parser.add_argument('--no-hover', action='store_true', help="do not hover widgets with tooltips")
+    parser.add_argument('--display', default=None, help="use this X display instead of starting Xvfb")
+    parser.add_argument('--json', action='store_true', help="print raw results as JSON")
+    parser.add_argument('--worker', metavar='SCRIPT', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(soak_app(args.worker, args.iterations, args.sample_every, not args.no_hover)))
+        return
+
+    scripts = args.scripts or list(APP_SPECS)
+    results = {}
+    with VirtualDisplay(args.display):
+        for script in scripts:
+            arguments = ['--worker', script, '--iterations', str(args.iterations),
+                         '--sample-every', str(args.sample_every)]
+            if args.no_hover:
+                arguments.append('--no-hover')
+            results[script] = json.loads(run_worker('bench_soak', arguments))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print("Growth per 100,000 iterations after warm-up (* = over the limit)")
+    print(f"{'app':<18}" + "".join(f"{name:>12}" for name in SERIES))
+    for script, stats in results.items():
+        cells = "".join(f"{stats['growth'][name]:>11.1f}" + ("*" if name in stats['flagged'] else " ")
+                        for name in SERIES)
+        print(f"{script:<18}{cells}")
+    for script, stats in results.items():
+        if stats['top_lines']:
+            print(f"\n{script}: largest Python allocations gained")
+            for line in stats['top_lines']:
+                print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Persistent history of interest calculations stored in SQLite.
+
+Each distinct input (amount, rate, months, product) is stored once together
+with its results; running the same calculation again only refreshes its
+"last used" time. The history therefore doubles as a result cache: lookup()
+finds a stored result through the unique index on the inputs, so recalling
+a past calculation never recomputes it.
+
+Amount leads the unique index and rate and months have indexes of their
+own, so filtering on any input stays a short index scan with hundreds of
+thousands of rows. page() returns the history most recent first in
+fixed-size pages, for views that load only the rows on screen.
+"""
+
+import os
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache",
+                                    "calculation_history.sqlite")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS calculations (
+    id INTEGER PRIMARY KEY,
+    amount REAL NOT NULL,
+    rate REAL NOT NULL,
+    months INTEGER NOT NULL,
+    product TEXT NOT NULL DEFAULT '',
+    total_interest REAL NOT NULL,
+    monthly_interest REAL NOT NULL,
+    final_amount REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS calculations_by_inputs ON calculations(amount, rate, months, product);
+CREATE INDEX IF NOT EXISTS calculations_by_rate ON calculations(rate);
+CREATE INDEX IF NOT EXISTS calculations_by_months ON calculations(months);
+CREATE INDEX IF NOT EXISTS calculations_by_use ON calculations(used);
+"""
+
+_COLUMNS = "id, amount, rate, months, product, total_interest, monthly_interest, final_amount, used"
+
+
+@dataclass
+class HistoryEntry:
+    """One stored calculation."""
+    id: int
+    amount: float
+    rate: float
+    months: int
+    product: str
+    total_interest: float
+    monthly_interest: float
+    final_amount: float
+    used: float
+
+
+def _where(amount: Optional[float], rate: Optional[float], months: Optional[int]) -> Tuple[str, tuple]:
+    """WHERE clause and parameters for equality filters on the indexed inputs."""
+    conditions, parameters = [], []
+    for column, value in (('amount', amount), ('rate', rate), ('months', months)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            parameters.append(value)
+    clause = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return clause, tuple(parameters)
+
+
+class CalculationHistory:
+    """Calculation history and result cache in an SQLite database."""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def lookup(self, amount: float, rate: float, months: int, product: str = "") -> Optional[HistoryEntry]:
+        """
+        Stored result for these inputs, or None if they were never calculated.
+
+        A hit is marked as used now, so it moves to the top of the history.
+        """
+        row = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM calculations WHERE amount = ? AND rate = ? AND months = ? AND product = ?",
+            (amount, rate, months, product),
+        ).fetchone()
+        if row is None:
+            return None
+        entry = HistoryEntry(*row)
+        entry.used = time.time()
+        with self.connection:
+            self.connection.execute("UPDATE calculations SET used = ? WHERE id = ?", (entry.used, entry.id))
+        return entry
+
+    def record(self, amount: float, rate: float, months: int, product: str,
+               total_interest: float, monthly_interest: float, final_amount: float) -> HistoryEntry:
+        """Store a calculation, replacing the results of an earlier run with the same inputs."""
+        used = time.time()
+        with self.connection:
+            entry_id = self.connection.execute(
+                "INSERT INTO calculations (amount, rate, months, product, total_interest, monthly_interest, "
+                "final_amount, used) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (amount, rate, months, product) DO UPDATE SET "
+                "total_interest = excluded.total_interest, monthly_interest = excluded.monthly_interest, "
+                "final_amount = excluded.final_amount, used = excluded.used RETURNING id",
+                (amount, rate, months, product, total_interest, monthly_interest, final_amount, used),
+            ).fetchone()[0]
+        return HistoryEntry(entry_id, amount, rate, months, product, total_interest, monthly_interest,
+                            final_amount, used)
+
+    def count(self, amount: Optional[float] = None, rate: Optional[float] = None,
+              months: Optional[int] = None) -> int:
+        """Number of stored calculations matching the given inputs (all if none are given)."""
+        clause, parameters = _where(amount, rate, months)
+        return self.connection.execute(f"SELECT COUNT(*) FROM calculations{clause}", parameters).fetchone()[0]
+
+    def page(self, offset: int, limit: int, amount: Optional[float] = None, rate: Optional[float] = None,
+             months: Optional[int] = None) -> List[HistoryEntry]:
+        """
+        One page of matching calculations, most recently used first.
+
+        Args:
+            offset: Number of matching calculations to skip
+            limit: Maximum number of calculations returned
+            amount, rate, months: Optional equality filters
+        """
+        clause, parameters = _where(amount, rate, months)
+        rows = self.connection.execute(
+            f"SELECT {_COLUMNS} FROM calculations{clause} ORDER BY used DESC, id DESC LIMIT ? OFFSET ?",
+            (*parameters, limit, offset),
+        )
+        return [HistoryEntry(*row) for row in rows]
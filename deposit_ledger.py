@@ -0,0 +1,116 @@
+"""
+Editable monthly deposit ledger backed by Fenwick trees.
+
+Deposits follow DeepSeekENG's simple-interest model: the deposit of month m
+(1-based) is made at the start of that month, so by the end of month k it
+has earned interest for k - m + 1 months. Interest up to month k is then
+
+    rate / 1200 * (P * k + sum over m <= k of d_m * (k - m + 1))
+  = rate / 1200 * (P * k + (k + 1) * S0(k) - S1(k))
+
+with S0(k) = sum of d_m and S1(k) = sum of m * d_m over m <= k. Both prefix
+sums live in Fenwick (binary indexed) trees, so changing one month's
+deposit and querying the balance at any month each take O(log n).
+
+Amounts may be floats or ints (e.g. cents from fixed_point); the trees only
+add and subtract, so integer ledgers stay exact.
+"""
+
+from typing import List, Sequence, Union
+
+
+Number = Union[int, float]
+
+
+class FenwickTree:
+    """Prefix sums over a fixed-length sequence with point updates."""
+
+    def __init__(self, values: Sequence[Number]):
+        """Build the tree in O(n) from the initial values."""
+        self.size = len(values)
+        self._tree: List[Number] = [0] + list(values)
+        for i in range(1, self.size + 1):
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self._tree[parent] += self._tree[i]
+
+    def add(self, index: int, delta: Number) -> None:
+        """Add ``delta`` to the item at 1-based ``index``."""
+        while index <= self.size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, count: int) -> Number:
+        """Sum of the first ``count`` items."""
+        total = 0
+        while count > 0:
+            total += self._tree[count]
+            count -= count & -count
+        return total
+
+
+class DepositLedger:
+    """Per-month deposits with O(log n) edits and balance queries."""
+
+    def __init__(self, months: int, monthly_deposit: Number = 0):
+        """
+        Args:
+            months: Number of months in the ledger
+            monthly_deposit: Initial deposit for every month
+
+        Raises:
+            ValueError: If months is not positive
+        """
+        if months <= 0:
+            raise ValueError("Duration must be positive")
+        self.months = months
+        self._deposits = [monthly_deposit] * months
+        self._sums = FenwickTree(self._deposits)
+        self._weighted_sums = FenwickTree([month * monthly_deposit for month in range(1, months + 1)])
+
+    def _check_month(self, month: int, allow_zero: bool = False) -> None:
+        lowest = 0 if allow_zero else 1
+        if not lowest <= month <= self.months:
+            raise ValueError(f"Month must be between {lowest} and {self.months}")
+
+    def deposit(self, month: int) -> Number:
+        """Deposit made in ``month`` (1-based)."""
+        self._check_month(month)
+        return self._deposits[month - 1]
+
+    def set_deposit(self, month: int, amount: Number) -> None:
+        """Replace the deposit of one month, e.g. to skip it (0) or raise it."""
+        self._check_month(month)
+        if amount < 0:
+            raise ValueError("Deposits cannot be negative")
+        delta = amount - self._deposits[month - 1]
+        self._deposits[month - 1] = amount
+        self._sums.add(month, delta)
+        self._weighted_sums.add(month, month * delta)
+
+    def add_deposit(self, month: int, amount: Number) -> None:
+        """Add a one-off deposit on top of the month's regular deposit."""
+        self.set_deposit(month, self.deposit(month) + amount)
+
+    def total_deposits(self, month: int) -> Number:
+        """Sum of deposits made in months 1 through ``month``."""
+        self._check_month(month, allow_zero=True)
+        return self._sums.prefix_sum(month)
+
+    def amount_months(self, month: int, principal: Number = 0) -> Number:
+        """
+        Money-months invested by the end of ``month``: each amount times the
+        number of months it has been in the account. Simple interest is this
+        times the annual rate / 1200.
+        """
+        self._check_month(month, allow_zero=True)
+        deposit_months = (month + 1) * self._sums.prefix_sum(month) - self._weighted_sums.prefix_sum(month)
+        return principal * month + deposit_months
+
+    def interest(self, month: int, principal: float, annual_rate: float) -> float:
+        """Simple interest accrued by the end of ``month`` at ``annual_rate`` percent."""
+        return self.amount_months(month, principal) * annual_rate / 1200
+
+    def balance(self, month: int, principal: float, annual_rate: float) -> float:
+        """Principal plus deposits plus accrued interest at the end of ``month``."""
+        return principal + self.total_deposits(month) + self.interest(month, principal, annual_rate)
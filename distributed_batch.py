@@ -0,0 +1,367 @@
+"""
+Simple-interest batches split over workers on one or more machines.
+
+A coordinator cuts the input into chunks of rows and serves them over TCP.
+Workers connect (several may run on one host), pull a lease on one chunk at
+a time, compute it with ClaudeENG.InterestCalculations and send the results
+back on the same connection. Messages are one JSON object per line:
+
+    worker -> coordinator   {"op": "lease"}
+    coordinator -> worker   {"op": "chunk", "chunk": 7, "lease": 12, "rows": [[p, rate, m], ...]}
+                            {"op": "wait", "seconds": 0.5}   nothing to hand out yet
+                            {"op": "done"}                   every chunk is complete
+    worker -> coordinator   {"op": "result", "chunk": 7, "lease": 12, "results": [...]}
+    coordinator -> worker   {"op": "ack", "accepted": true}
+
+Because workers pull, a fast worker simply takes more chunks. A lease that is
+not answered within lease_seconds (the worker died or hung) expires and the
+chunk is handed out again. Once no chunk is left to lease, idle workers
+steal: they get a second lease on the chunk that has been running longest,
+so one slow machine cannot hold up the end of a run. Whichever copy of a
+chunk reports first is kept and later copies are discarded, so every row
+appears in the output exactly once.
+
+Each result row is [total_interest, monthly_interest, final_amount], or the
+ValueError message for rows InterestCalculations rejects.
+
+Usage:
+    python distributed_batch.py coordinator accounts.csv results.csv --port 5055 --local-workers 4
+    python distributed_batch.py worker --host 192.168.1.10 --port 5055
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import socket
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Union
+
+from batch_validation import read_columns, validate_columns
+from ClaudeENG import InterestCalculations
+from money_format import export_cell
+
+
+DEFAULT_PORT = 5055
+
+# Rows per lease: large enough that a round trip is small next to computing it
+DEFAULT_CHUNK_ROWS = 10_000
+
+# Seconds a worker may hold a lease before the chunk is handed out again
+DEFAULT_LEASE_SECONDS = 30.0
+
+# How long an idle worker is told to wait when every chunk is leased and none can be stolen
+WAIT_SECONDS = 0.2
+
+RowResult = Union[List[float], str]
+
+
+@dataclass
+class Lease:
+    """One chunk handed to one worker."""
+    lease_id: int
+    chunk: int
+    worker: str
+    started: float
+    deadline: float
+
+
+def compute_chunk(rows: Sequence[Sequence[float]]) -> List[RowResult]:
+    """Results of InterestCalculations for each [principal, annual_rate, months] row."""
+    calculate = InterestCalculations.calculate_simple_interest
+    results: List[RowResult] = []
+    for principal, annual_rate, months in rows:
+        try:
+            result = calculate(principal, annual_rate, int(months))
+        except ValueError as e:
+            results.append(str(e))
+            continue
+        results.append([result.total_interest, result.monthly_interest, result.final_amount])
+    return results
+
+
+def _valid_row(result) -> bool:
+    if isinstance(result, str):
+        return True
+    return (isinstance(result, list) and len(result) == 3
+            and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in result))
+
+
+class Coordinator:
+    """Hands out chunk leases and assembles the results."""
+
+    def __init__(self, rows: Sequence[Sequence[float]], chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS, host: str = '0.0.0.0', port: int = DEFAULT_PORT):
+        self.rows = [list(row) for row in rows]
+        self.chunk_rows = chunk_rows
+        self.lease_seconds = lease_seconds
+        self.chunks = [(start, min(start + chunk_rows, len(self.rows)))
+                       for start in range(0, len(self.rows), chunk_rows)]
+        self.pending = list(range(len(self.chunks)))
+        self.leases: Dict[int, Lease] = {}
+        self.issued: Dict[int, int] = {}        # every lease id ever handed out -> its chunk
+        self.results: Dict[int, List[RowResult]] = {}
+        self.stats = {'leased': 0, 'expired': 0, 'stolen': 0, 'duplicates': 0}
+        self._next_lease = 0
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        if not self.chunks:
+            self._finished.set()
+        self._server = socketserver.ThreadingTCPServer((host, port), self._handler_class(), bind_and_activate=False)
+        self._server.daemon_threads = True
+        self._server.allow_reuse_address = True
+
+    @property
+    def address(self):
+        return self._server.server_address
+
+    def _handler_class(self):
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                worker = f"{self.client_address[0]}:{self.client_address[1]}"
+                for line in self.rfile:
+                    try:
+                        reply = coordinator.handle(json.loads(line), worker)
+                    except (ValueError, KeyError, TypeError, IndexError) as e:
+                        reply = {'op': 'error', 'message': str(e)}
+                    self.wfile.write(json.dumps(reply).encode('utf-8') + b"\n")
+                    if reply['op'] == 'done':
+                        return
+
+        return Handler
+
+    def handle(self, message: dict, worker: str) -> dict:
+        """Reply to one worker message."""
+        if message['op'] == 'lease':
+            return self.lease(worker)
+        if message['op'] == 'result':
+            return {'op': 'ack', 'accepted': self.complete(message['lease'], message['chunk'], message['results'])}
+        raise ValueError(f"Unknown operation: {message['op']}")
+
+    def _expire(self, now: float) -> None:
+        for lease_id, lease in list(self.leases.items()):
+            if lease.deadline <= now:
+                del self.leases[lease_id]
+                self.stats['expired'] += 1
+                if lease.chunk not in self.results and not self._is_leased(lease.chunk):
+                    self.pending.append(lease.chunk)
+
+    def _is_leased(self, chunk: int) -> bool:
+        return any(lease.chunk == chunk for lease in self.leases.values())
+
+    def lease(self, worker: str) -> dict:
+        """Lease the next pending chunk, or steal the longest-running one."""
+        with self._lock:
+            if self._finished.is_set():
+                return {'op': 'done'}
+            now = time.monotonic()
+            self._expire(now)
+            if self.pending:
+                chunk = self.pending.pop(0)
+            else:
+                # Steal: duplicate the oldest lease held by another worker
+                others = [lease for lease in self.leases.values()
+                          if lease.worker != worker and not any(
+                              other.chunk == lease.chunk and other.worker == worker
+                              for other in self.leases.values())]
+                if not others:
+                    return {'op': 'wait', 'seconds': WAIT_SECONDS}
+                chunk = min(others, key=lambda lease: lease.started).chunk
+                self.stats['stolen'] += 1
+            self._next_lease += 1
+            self.leases[self._next_lease] = Lease(self._next_lease, chunk, worker, now, now + self.lease_seconds)
+            self.issued[self._next_lease] = chunk
+            self.stats['leased'] += 1
+            start, end = self.chunks[chunk]
+            return {'op': 'chunk', 'chunk': chunk, 'lease': self._next_lease, 'rows': self.rows[start:end]}
+
+    def complete(self, lease_id: int, chunk: int, results: List[RowResult]) -> bool:
+        """
+        Record a chunk's results; the first complete answer per chunk wins.
+
+        Results from an expired lease are still accepted if the chunk is not
+        done yet, since every copy computes the same values. Results for a
+        lease that was never issued for ``chunk``, or that are not one
+        3-number list or error message per row, are rejected.
+
+        Returns:
+            Whether the results were kept
+        """
+        with self._lock:
+            if type(chunk) is not int or self.issued.get(lease_id) != chunk:
+                return False
+            self.leases.pop(lease_id, None)
+            start, end = self.chunks[chunk]
+            if chunk in self.results:
+                self.stats['duplicates'] += 1
+                return False
+            if not isinstance(results, list) or len(results) != end - start or not all(map(_valid_row, results)):
+                return False
+            self.results[chunk] = results
+            if chunk in self.pending:
+                self.pending.remove(chunk)
+            for other_id in [i for i, lease in self.leases.items() if lease.chunk == chunk]:
+                del self.leases[other_id]
+            if len(self.results) == len(self.chunks):
+                self._finished.set()
+            return True
+
+    def start(self) -> None:
+        """Start accepting workers in a background thread."""
+        self._server.server_bind()
+        self._server.server_activate()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def wait(self, timeout: Optional[float] = None) -> List[RowResult]:
+        """
+        Block until every chunk is complete.
+
+        Returns:
+            One result per input row, in input order
+
+        Raises:
+            TimeoutError: If the results are not complete within ``timeout`` seconds
+        """
+        if not self._finished.wait(timeout):
+            raise TimeoutError(f"{len(self.results)} of {len(self.chunks)} chunks complete")
+        return [result for chunk in range(len(self.chunks)) for result in self.results[chunk]]
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def run_worker(host: str = 'localhost', port: int = DEFAULT_PORT, connect_timeout: float = 10.0) -> int:
+    """
+    Compute chunks for a coordinator until it reports that the run is done.
+
+    Returns:
+        Number of chunks whose results were accepted
+    """
+    deadline = time.monotonic() + connect_timeout
+    while True:
+        try:
+            connection = socket.create_connection((host, port))
+            break
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(WAIT_SECONDS)
+
+    accepted = 0
+    with connection, connection.makefile('rwb') as stream:
+        def request(message: dict) -> dict:
+            stream.write(json.dumps(message).encode('utf-8') + b"\n")
+            stream.flush()
+            line = stream.readline()
+            if not line:
+                raise ConnectionError("Coordinator closed the connection")
+            return json.loads(line)
+
+        while True:
+            reply = request({'op': 'lease'})
+            if reply['op'] == 'done':
+                return accepted
+            if reply['op'] == 'wait':
+                time.sleep(reply['seconds'])
+                continue
+            if reply['op'] != 'chunk':
+                raise ConnectionError(reply.get('message', f"Unexpected reply: {reply['op']}"))
+            results = compute_chunk(reply['rows'])
+            ack = request({'op': 'result', 'chunk': reply['chunk'], 'lease': reply['lease'], 'results': results})
+            accepted += bool(ack.get('accepted'))
+
+
+def _worker_process(host: str, port: int) -> None:
+    try:
+        run_worker(host, port)
+    except (ConnectionError, OSError):
+        pass
+
+
+def run_coordinator(input_path: str, output_path: str, port: int = DEFAULT_PORT, local_workers: int = 0,
+                    chunk_rows: int = DEFAULT_CHUNK_ROWS, lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                    locale: str = 'en-US') -> Coordinator:
+    """
+    Serve the valid rows of ``input_path`` to workers and write every row's result.
+
+    Args:
+        local_workers: Worker processes to start on this machine in addition to remote ones
+    """
+    raw = read_columns(input_path)
+    report = validate_columns(raw, locale=locale)
+    columns = [report.values[name].tolist() for name in ('principal', 'annual_rate', 'months')]
+    valid = report.valid.nonzero()[0]
+    coordinator = Coordinator([[column[row] for column in columns] for row in valid.tolist()],
+                              chunk_rows, lease_seconds, port=port)
+    coordinator.start()
+    processes = [multiprocessing.Process(target=_worker_process, args=('localhost', coordinator.address[1]),
+                                         daemon=True)
+                 for _ in range(local_workers)]
+    for process in processes:
+        process.start()
+    try:
+        results = coordinator.wait()
+    finally:
+        coordinator.stop()
+        for process in processes:
+            process.join(timeout=5)
+
+    by_row: Dict[int, RowResult] = dict(zip(valid.tolist(), results))
+    with open(output_path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out)
+        writer.writerow(['principal', 'annual_rate', 'months', 'total_interest', 'monthly_interest',
+                         'final_amount', 'error'])
+        for row in range(report.rows):
+            result = by_row.get(row)
+            if result is None:
+                # Rejected by validation: echo the row as it was written
+                writer.writerow([raw.get(name, [""] * report.rows)[row]
+                                 for name in ('principal', 'annual_rate', 'months')] + ["", "", "", "invalid input"])
+                continue
+            # Principal and results are money (2 decimals); rate and months are written exactly
+            values = [export_cell(column[row], money) for column, money in zip(columns, (True, False, False))]
+            if isinstance(result, str):
+                writer.writerow(values + ["", "", "", result])
+            else:
+                writer.writerow(values + [export_cell(value, True) for value in result] + [""])
+    return coordinator
+
+
+def main() -> None:
+    """Command-line entry point: run a coordinator or a worker."""
+    parser = argparse.ArgumentParser(description="Distribute a simple-interest batch over TCP workers.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    coordinator = commands.add_parser('coordinator', help="serve an input file to workers")
+    coordinator.add_argument('input', help="CSV with principal, annual_rate and months columns")
+    coordinator.add_argument('output', help="CSV to write")
+    coordinator.add_argument('--port', type=int, default=DEFAULT_PORT)
+    coordinator.add_argument('--local-workers', type=int, default=0, help="workers to start on this machine")
+    coordinator.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    coordinator.add_argument('--lease-seconds', type=float, default=DEFAULT_LEASE_SECONDS)
+    coordinator.add_argument('--locale', default='en-US', help="number format of the input")
+
+    worker = commands.add_parser('worker', help="compute chunks for a coordinator")
+    worker.add_argument('--host', default='localhost')
+    worker.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    if args.command == 'worker':
+        print(f"{run_worker(args.host, args.port)} chunks accepted")
+        return
+    start = time.perf_counter()
+    result = run_coordinator(args.input, args.output, args.port, args.local_workers, args.chunk_rows,
+                             args.lease_seconds, args.locale)
+    stats = ", ".join(f"{value} {name}" for name, value in result.stats.items())
+    print(f"{len(result.rows)} rows in {len(result.chunks)} chunks, "
+          f"{time.perf_counter() - start:.2f} s ({stats})")
+
+
+if __name__ == "__main__":
+    main()
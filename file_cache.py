@@ -0,0 +1,59 @@
+"""
+Content-hash helpers shared by the analysis tools.
+
+Results are stored as one JSON file per key under .cache/<namespace>/, so a
+tool re-runs its work only for inputs whose hash it has not seen before.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Iterable, Optional
+
+
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+
+def file_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of a file, read in blocks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def combined_hash(parts: Iterable[str]) -> str:
+    """Return one digest for an ordered sequence of strings (e.g. other digests)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class JsonCache:
+    """Directory of JSON documents addressed by content hash."""
+
+    def __init__(self, namespace: str, root: str = CACHE_ROOT):
+        self.directory = os.path.join(root, namespace)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".json")
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if it is missing or unreadable."""
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value atomically, so readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(value, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(key))
@@ -0,0 +1,209 @@
+"""
+Safe compiler for user-defined interest formulas.
+
+Formulas are plain expressions over a fixed set of variables, optionally
+prefixed with the name of the result, e.g. "K = P × r × t". They are parsed
+with ``ast``, checked against a whitelist of node types, variables and
+functions, and compiled once into a Python function whose arithmetic runs on
+NumPy, so the same callable evaluates one account or a million. Compiled
+formulas are cached by their text.
+
+Variables:
+    P  principal
+    r  annual interest rate as a decimal (5% -> 0.05)
+    t  duration in years
+    m  duration in months
+    D  deposit per month
+"""
+
+import ast
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+
+VARIABLES: Dict[str, str] = {
+    'P': "principal",
+    'r': "annual interest rate as a decimal",
+    't': "duration in years",
+    'm': "duration in months",
+    'D': "deposit per month",
+}
+
+FUNCTIONS: Dict[str, Callable] = {
+    'exp': np.exp,
+    'expm1': np.expm1,
+    'log': np.log,
+    'log1p': np.log1p,
+    'sqrt': np.sqrt,
+    'abs': np.abs,
+    'min': np.minimum,
+    'max': np.maximum,
+}
+# ufuncs treat extra positional arguments as output arrays, so counts are fixed
+_ARITY = {name: 2 if name in ('min', 'max') else 1 for name in FUNCTIONS}
+
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd,
+)
+# Typographic operators people paste from documents
+_OPERATOR_ALIASES = {'×': '*', '·': '*', '÷': '/', '−': '-', '^': '**'}
+
+MAX_FORMULA_LENGTH = 500
+
+DEFAULT_FORMULA = "K = P × r × t"
+FORMULAS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "formule.json")
+
+
+class FormulaError(ValueError):
+    """Raised for formulas that do not parse or use anything outside the whitelist."""
+
+
+def _normalize(text: str) -> Tuple[str, str]:
+    """Split off the optional "name =" prefix and replace operator aliases."""
+    target, separator, expression = text.partition('=')
+    if not separator:
+        target, expression = "K", text
+    target = target.strip() or "K"
+    if not target.isidentifier():
+        raise FormulaError(f"Invalid result name: {target}")
+    for alias, operator in _OPERATOR_ALIASES.items():
+        expression = expression.replace(alias, operator)
+    return target, expression.strip()
+
+
+def _validate(tree: ast.Expression) -> None:
+    called = {id(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)}
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise FormulaError(f"Not allowed in a formula: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool)
+                                               or not isinstance(node.value, (int, float))):
+            raise FormulaError(f"Only numeric constants are allowed, not {node.value!r}")
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+                raise FormulaError(f"Unknown function; allowed: {', '.join(FUNCTIONS)}")
+            if node.keywords or len(node.args) != _ARITY[node.func.id]:
+                raise FormulaError(f"{node.func.id} takes {_ARITY[node.func.id]} positional argument(s)")
+        elif isinstance(node, ast.Name) and node.id not in VARIABLES:
+            if node.id in FUNCTIONS and id(node) not in called:
+                raise FormulaError(f"Function {node.id} must be called, e.g. {node.id}(r)")
+            if node.id not in FUNCTIONS:
+                raise FormulaError(f"Unknown variable {node.id}; allowed: {', '.join(VARIABLES)}")
+
+
+class _FloatConstants(ast.NodeTransformer):
+    """Make every constant a float so ``**`` can never build huge integers."""
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:
+        return ast.copy_location(ast.Constant(float(node.value)), node)
+
+
+class _SubstituteValues(ast.NodeTransformer):
+    """Replace variables with their formatted values, for explanations."""
+
+    def __init__(self, labels: Mapping[str, str]):
+        self.labels = labels
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:
+        return ast.Name(self.labels.get(node.id, node.id), ast.Load())
+
+
+@dataclass(frozen=True)
+class CompiledFormula:
+    """A validated formula and its vectorized implementation."""
+    text: str
+    target: str
+    expression: str
+    variables: Tuple[str, ...]
+    tree: ast.Expression
+    function: Callable
+
+    def __call__(self, **values):
+        """
+        Evaluate the formula; variables may be numbers or NumPy arrays.
+
+        Raises:
+            FormulaError: If a variable the formula uses is missing, or the
+                result overflows
+        """
+        missing = [name for name in self.variables if name not in values]
+        if missing:
+            raise FormulaError(f"Missing values for: {', '.join(missing)}")
+        try:
+            with np.errstate(over='raise', invalid='ignore', divide='ignore'):
+                return self.function(*(np.asarray(values[name], dtype=float) for name in self.variables))
+        except (OverflowError, FloatingPointError):
+            raise FormulaError("The formula overflows for these values") from None
+
+    def display(self) -> str:
+        """The formula as written with typographic multiplication signs."""
+        return f"{self.target} = {ast.unparse(self.tree).replace(' * ', ' × ')}"
+
+    def explain(self, values: Mapping[str, float], result: Optional[float] = None,
+                precision: Optional[Mapping[str, int]] = None) -> str:
+        """
+        The formula with every variable replaced by its value, e.g.
+        "1000.00 × 0.0500 × 1.00 = 50.00".
+
+        Args:
+            values: Scalar value per variable
+            result: Result to append; calculated if omitted
+            precision: Decimals per variable (default 2, 4 for r, 0 for m)
+        """
+        precision = {'r': 4, 'm': 0, **(precision or {})}
+        labels = {name: f"{values[name]:.{precision.get(name, 2)}f}" for name in self.variables}
+        substituted = _SubstituteValues(labels).visit(ast.parse(ast.unparse(self.tree), mode='eval'))
+        if result is None:
+            result = float(self(**values))
+        return f"{ast.unparse(substituted).replace(' * ', ' × ')} = {result:.2f}"
+
+
+@lru_cache(maxsize=256)
+def compile_formula(text: str) -> CompiledFormula:
+    """
+    Parse, validate and compile a formula; results are cached by text.
+
+    Raises:
+        FormulaError: If the formula is invalid
+    """
+    if len(text) > MAX_FORMULA_LENGTH:
+        raise FormulaError(f"Formulas are limited to {MAX_FORMULA_LENGTH} characters")
+    target, expression = _normalize(text)
+    if not expression:
+        raise FormulaError("The formula is empty")
+    try:
+        tree = ast.parse(expression, mode='eval')
+    except SyntaxError as e:
+        raise FormulaError(f"Cannot parse formula: {e.msg}") from None
+    _validate(tree)
+
+    variables = tuple(sorted({node.id for node in ast.walk(tree)
+                              if isinstance(node, ast.Name) and node.id in VARIABLES}))
+    body = _FloatConstants().visit(ast.parse(expression, mode='eval')).body
+    function_tree = ast.Expression(ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(name) for name in variables], vararg=None,
+                           kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]),
+        body=body,
+    ))
+    ast.fix_missing_locations(function_tree)
+    code = compile(function_tree, f"<formula {text!r}>", 'eval')
+    function = eval(code, {'__builtins__': {}, **FUNCTIONS})
+    return CompiledFormula(text, target, expression, variables, tree, function)
+
+
+def load_formulas(path: str = FORMULAS_FILE) -> Dict[str, str]:
+    """
+    Named formulas defined by the product team, from a JSON object of
+    name -> formula text. Falls back to the simple-interest formula when the
+    file does not exist.
+    """
+    if not os.path.exists(path):
+        return {"Jednostavna kamata": DEFAULT_FORMULA}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,207 @@
+"""
+Shared plumbing for driving the calculator GUIs without a user.
+
+Every app is described by an AppSpec: how to construct it, which widgets or
+StringVars hold the principal / rate / months inputs, and which methods the
+Calculate and Clear buttons call. Benchmarks run each app in its own process
+under a virtual X display (Xvfb) so apps never share Tcl interpreters.
+"""
+
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from tkinter import messagebox
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from calculation_history import CalculationHistory
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _with_root(class_name: str) -> Callable[[Any], Tuple[tk.Tk, Any]]:
+    """Factory for apps whose constructor takes the root window."""
+    def create(module):
+        root = tk.Tk()
+        return root, getattr(module, class_name)(root)
+    return create
+
+
+def _meta_ai(module):
+    app = module.InterestCalculator()
+    return app.window, app
+
+
+def _copilot_cro(module):
+    # An in-memory history, so driven runs never fill the user's saved one
+    root = tk.Tk()
+    return root, module.KalkulatorKamate(root, CalculationHistory(':memory:'))
+
+
+def _perplexity_eng(module):
+    # The app keeps its widgets in module globals, so the module is the target
+    return module.create_ui(), module
+
+
+@dataclass(frozen=True)
+class AppSpec:
+    """How to construct and drive one calculator app."""
+    script: str
+    create: Callable[[Any], Tuple[tk.Tk, Any]]
+    fields: Tuple[str, str, str]
+    calculate: str
+    clear: Optional[str] = None
+    close: Optional[str] = None     # method that releases resources and destroys the window
+
+    @property
+    def module_name(self) -> str:
+        return os.path.splitext(self.script)[0]
+
+
+APP_SPECS = {spec.script: spec for spec in [
+    AppSpec("ChatGptENG.py", _with_root('InterestCalculatorApp'),
+            ('amount_var', 'rate_var', 'months_var'), 'calculate_interest', 'clear_fields'),
+    AppSpec("ChatGptCro.py", _with_root('KalkulatorKamate'),
+            ('entry_iznos', 'entry_stopa', 'entry_trajanje'), 'izracunaj'),
+    AppSpec("ClaudeENG.py", _with_root('InterestCalculatorGUI'),
+            ('principal_var', 'rate_var', 'duration_var'), '_calculate_interest', '_clear_all'),
+    AppSpec("ClaudeCro.py", _with_root('KamataKalkulator'),
+            ('var_iznos', 'var_kamata', 'var_mjeseci'), '_izracunaj_kamatu', '_obrisi_polja'),
+    AppSpec("CopilotENG.py", _with_root('InterestCalculatorApp'),
+            ('amount_entry', 'rate_entry', 'duration_entry'), 'calculate_interest'),
+    AppSpec("CopilotCro.py", _copilot_cro,
+            ('entry_iznos', 'entry_kamata', 'entry_mjeseci'), 'izracunaj', 'resetiraj', 'zatvori'),
+    AppSpec("DeepSeekENG.py", _with_root('SavingsCalculatorApp'),
+            ('amount_entry', 'rate_entry', 'duration_entry'), 'calculate_interest', 'clear_fields'),
+    AppSpec("DeepSeekCro.py", _with_root('KalkulatorKamata'),
+            ('iznos_var', 'kamatna_stopa_var', 'mjeseci_var'), '_izracunaj_kamatu', '_resetiraj'),
+    AppSpec("GeminiENG.py", _with_root('InterestCalculatorApp'),
+            ('principal_entry', 'rate_entry', 'months_entry'), '_calculate_interest', '_clear_fields'),
+    AppSpec("GeminiCro.py", _with_root('KamataKalkulatorApp'),
+            ('unos_iznos', 'unos_stopa', 'unos_mjeseci'), 'izracunaj_kamatu'),
+    AppSpec("MetaAIENG.py", _meta_ai,
+            ('amount_entry', 'interest_rate_entry', 'duration_entry'), 'calculate_interest', 'clear_fields'),
+    AppSpec("PerplexityENG.py", _perplexity_eng,
+            ('entry_amount', 'entry_rate', 'entry_months'), 'on_calculate'),
+    AppSpec("PerplexityCro.py", _with_root('KalkulatorKamate'),
+            ('entry_iznos', 'entry_kamata', 'entry_mjeseci'), 'izracunaj'),
+]}
+
+
+class DialogRaised(RuntimeError):
+    """Raised instead of opening a modal messagebox while an app is driven."""
+
+
+def suppress_dialogs() -> None:
+    """Replace the blocking messagebox functions with ones that raise DialogRaised."""
+    def raise_dialog(title=None, message=None, **options):
+        raise DialogRaised(f"{title}: {message}")
+    for name in ('showerror', 'showwarning', 'showinfo', 'askyesno', 'askokcancel'):
+        setattr(messagebox, name, raise_dialog)
+
+
+class DrivenApp:
+    """A live app instance plus helpers to fill its inputs and press its buttons."""
+
+    def __init__(self, spec: AppSpec):
+        self.spec = spec
+        if SCRIPT_DIR not in sys.path:
+            sys.path.insert(0, SCRIPT_DIR)
+        suppress_dialogs()
+        module = importlib.import_module(spec.module_name)
+        self.root, self.target = spec.create(module)
+        self.root.update()
+
+    def set_inputs(self, values: Sequence[str]) -> None:
+        """Write the principal, rate and months strings into the app's fields."""
+        for attribute, value in zip(self.spec.fields, values):
+            holder = getattr(self.target, attribute)
+            if isinstance(holder, tk.Variable):
+                holder.set(value)
+            else:
+                holder.delete(0, tk.END)
+                holder.insert(0, value)
+
+    def calculate(self) -> None:
+        getattr(self.target, self.spec.calculate)()
+
+    def clear(self) -> None:
+        """Press Clear, or blank the inputs for apps that have no Clear button."""
+        if self.spec.clear:
+            getattr(self.target, self.spec.clear)()
+        else:
+            self.set_inputs(("", "", ""))
+
+    def settle(self) -> None:
+        """Process pending events and redraws until Tk is idle."""
+        self.root.update_idletasks()
+        self.root.update()
+
+    def destroy(self) -> None:
+        if self.spec.close:
+            getattr(self.target, self.spec.close)()
+        else:
+            self.root.destroy()
+
+
+def input_cycle(iteration: int) -> Tuple[str, str, str]:
+    """Deterministic, always-valid inputs that change every iteration."""
+    principal = 1000 + (iteration * 37) % 99000
+    rate = 0.5 + (iteration % 80) / 10
+    months = 1 + iteration % 360
+    return str(principal), f"{rate:.1f}", str(months)
+
+
+class VirtualDisplay:
+    """Context manager that starts Xvfb when no display is available."""
+
+    def __init__(self, display: Optional[str] = None, size: str = "1280x1024x24"):
+        self.requested = display
+        self.size = size
+        self.process: Optional[subprocess.Popen] = None
+        self.previous = os.environ.get('DISPLAY')
+
+    def __enter__(self) -> str:
+        if self.requested is None and self.previous:
+            return self.previous
+        display = self.requested or f":{90 + os.getpid() % 100}"
+        if self.requested is None:
+            if shutil.which('Xvfb') is None:
+                raise RuntimeError("No DISPLAY set and Xvfb is not installed")
+            self.process = subprocess.Popen(
+                ['Xvfb', display, '-screen', '0', self.size, '-nolisten', 'tcp'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            socket_path = f"/tmp/.X11-unix/X{display.lstrip(':')}"
+            deadline = time.monotonic() + 10
+            while not os.path.exists(socket_path):
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError(f"Xvfb failed to start on {display}")
+                time.sleep(0.05)
+        os.environ['DISPLAY'] = display
+        return display
+
+    def __exit__(self, *exc_info) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+        if self.previous is None:
+            os.environ.pop('DISPLAY', None)
+        else:
+            os.environ['DISPLAY'] = self.previous
+
+
+def run_worker(module_name: str, arguments: List[str], timeout: Optional[float] = None) -> str:
+    """Run ``python -m module_name arguments`` in a fresh process and return its stdout."""
+    completed = subprocess.run(
+        [sys.executable, '-m', module_name, *arguments],
+        cwd=SCRIPT_DIR, capture_output=True, text=True, timeout=timeout,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip() or f"worker exited with {completed.returncode}")
+    return completed.stdout
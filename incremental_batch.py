@@ -0,0 +1,217 @@
+"""
+Incremental nightly batch of simple-interest results.
+
+Results depend only on a row's (principal, annual_rate, months), so each run
+keeps an index of row hashes and their results next to the output. The
+next run hashes its rows in one vectorized pass, finds the known ones with
+a binary search over the sorted index and calls
+ClaudeENG.InterestCalculations only for rows that are new or changed.
+Cached and fresh results are merged back in input order, so the work done
+grows with the number of changed rows rather than with the file.
+
+Rows are validated with batch_validation first; invalid rows are echoed as
+they were written, with empty results and the first failed rule in the
+error column. They are counted, never recomputed.
+
+Usage:
+    python incremental_batch.py accounts.csv results.csv
+    python incremental_batch.py accounts.csv results.csv --locale hr-HR --full
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
+
+from batch_validation import ValidationReport, read_columns, validate_columns
+from ClaudeENG import InterestCalculations
+from money_format import CHUNK_SIZE, format_csv_rows
+
+
+# Bump when the calculation changes so stale indexes are ignored
+INDEX_VERSION = 1
+
+INPUT_COLUMNS = ('principal', 'annual_rate', 'months')
+RESULT_COLUMNS = ('total_interest', 'monthly_interest', 'final_amount')
+
+# Which output columns are money (written with cents); rate and months are written exactly
+MONEY_COLUMNS = (True, False, False) + (True,) * len(RESULT_COLUMNS)
+
+
+@dataclass
+class RunStats:
+    """What an incremental run did."""
+    rows: int
+    reused: int
+    computed: int
+    invalid: int
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads every input bit over the whole 64-bit word."""
+    values = values ^ (values >> np.uint64(30))
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    return values
+
+
+def row_hashes(principal: np.ndarray, annual_rate: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """64-bit content hash of every (principal, annual_rate, months) row."""
+    digest = np.full(len(principal), INDEX_VERSION, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        for column in (principal, annual_rate, months):
+            bits = np.ascontiguousarray(column, dtype=np.float64).view(np.uint64)
+            digest = _mix(digest ^ _mix(bits + np.uint64(0x9E3779B97F4A7C15)))
+    return digest
+
+
+class ResultIndex:
+    """Sorted row hashes of a previous run with their results."""
+
+    def __init__(self, hashes: Optional[np.ndarray] = None, results: Optional[np.ndarray] = None):
+        self.hashes = np.zeros(0, dtype=np.uint64) if hashes is None else hashes
+        self.results = np.zeros((0, len(RESULT_COLUMNS))) if results is None else results
+
+    @classmethod
+    def load(cls, path: str) -> 'ResultIndex':
+        """Index saved by an earlier run; empty if missing, unreadable or from another version."""
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != INDEX_VERSION:
+                    return cls()
+                return cls(data['hashes'], data['results'])
+        except (OSError, KeyError, ValueError):
+            return cls()
+
+    @classmethod
+    def build(cls, hashes: np.ndarray, results: np.ndarray) -> 'ResultIndex':
+        """Index of unique hashes, sorted for binary search."""
+        hashes, first = np.unique(hashes, return_index=True)
+        return cls(hashes, results[first])
+
+    def lookup(self, hashes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns:
+            (found mask, results of the found rows in the order of ``hashes[found]``)
+        """
+        if not self.hashes.size:
+            return np.zeros(len(hashes), dtype=bool), self.results
+        position = np.minimum(np.searchsorted(self.hashes, hashes), self.hashes.size - 1)
+        found = self.hashes[position] == hashes
+        return found, self.results[position[found]]
+
+    def save(self, path: str) -> None:
+        """Write the index atomically, so an interrupted run leaves the old one intact."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, version=INDEX_VERSION, hashes=self.hashes, results=self.results)
+        os.replace(tmp_path, path)
+
+
+def compute_rows(principal: np.ndarray, annual_rate: np.ndarray, months: np.ndarray) -> np.ndarray:
+    """Results of InterestCalculations for each row, as an (n, 3) array."""
+    results = np.empty((len(principal), len(RESULT_COLUMNS)))
+    calculate = InterestCalculations.calculate_simple_interest
+    for row, (p, rate, m) in enumerate(zip(principal.tolist(), annual_rate.tolist(), months.tolist())):
+        result = calculate(p, rate, int(m))
+        results[row] = result.total_interest, result.monthly_interest, result.final_amount
+    return results
+
+
+def error_messages(report: ValidationReport) -> Dict[int, str]:
+    """Row -> message of the first rule the row failed, for every invalid row."""
+    errors: Dict[int, str] = {}
+    for name, rows in reversed(report.failures.items()):
+        errors.update(dict.fromkeys(rows.tolist(), report.messages[name]))
+    return errors
+
+
+def write_output(out: TextIO, columns: Sequence[np.ndarray], raw: Dict[str, List[str]],
+                 errors: Dict[int, str]) -> None:
+    """
+    Write the result rows: valid rows from the numeric columns with an empty
+    error cell, invalid rows echoed from the raw input text with empty results
+    and their error.
+    """
+    writer = csv.writer(out, lineterminator="\n")
+    rows = len(columns[0])
+    invalid = sorted(errors)
+    for start in range(0, rows, CHUNK_SIZE):
+        lines = format_csv_rows([column[start:start + CHUNK_SIZE] for column in columns], MONEY_COLUMNS).split("\n")
+        lines.pop()
+        previous = 0
+        for row in invalid[bisect_left(invalid, start):bisect_left(invalid, start + CHUNK_SIZE)]:
+            if row - start > previous:
+                out.write(",\n".join(lines[previous:row - start]) + ",\n")
+            writer.writerow([raw.get(name, [""] * rows)[row] for name in INPUT_COLUMNS]
+                            + [""] * len(RESULT_COLUMNS) + [errors[row]])
+            previous = row - start + 1
+        if previous < len(lines):
+            out.write(",\n".join(lines[previous:]) + ",\n")
+
+
+def run_incremental(input_path: str, output_path: str, index_path: Optional[str] = None,
+                    locale: str = 'en-US', full: bool = False) -> RunStats:
+    """
+    Calculate every row of ``input_path``, reusing results of unchanged rows.
+
+    Args:
+        input_path: CSV with principal, annual_rate and months columns
+        output_path: CSV to write, one row per input row
+        index_path: Hash index of the previous run (default: next to the output)
+        locale: Number format of the input
+        full: Ignore the previous index and recompute everything
+
+    Returns:
+        RunStats with the number of reused, computed and invalid rows
+    """
+    index_path = index_path or output_path + ".index.npz"
+    raw = read_columns(input_path)
+    report = validate_columns(raw, locale=locale)
+    principal, annual_rate, months = (report.values[name] for name in INPUT_COLUMNS)
+    valid = report.valid
+
+    hashes = row_hashes(principal[valid], annual_rate[valid], months[valid])
+    previous = ResultIndex() if full else ResultIndex.load(index_path)
+    found, cached = previous.lookup(hashes)
+
+    valid_results = np.empty((hashes.size, len(RESULT_COLUMNS)))
+    valid_results[found] = cached
+    changed = ~found
+    valid_results[changed] = compute_rows(principal[valid][changed], annual_rate[valid][changed],
+                                          months[valid][changed])
+
+    results = np.full((report.rows, len(RESULT_COLUMNS)), np.nan)
+    results[valid] = valid_results
+    with open(output_path, 'w', newline='', encoding='utf-8') as out:
+        out.write(",".join(INPUT_COLUMNS + RESULT_COLUMNS) + ",error\n")
+        write_output(out, [principal, annual_rate, months, *results.T], raw, error_messages(report))
+
+    ResultIndex.build(hashes, valid_results).save(index_path)
+    return RunStats(report.rows, int(found.sum()), int(changed.sum()), int((~valid).sum()))
+
+
+def main() -> None:
+    """Command-line entry point: incremental batch run."""
+    parser = argparse.ArgumentParser(description="Simple interest for a CSV, recomputing only changed rows.")
+    parser.add_argument('input', help="CSV with principal, annual_rate and months columns")
+    parser.add_argument('output', help="CSV to write")
+    parser.add_argument('--index', default=None, help="hash index of the previous run")
+    parser.add_argument('--locale', default='en-US', help="number format of the input")
+    parser.add_argument('--full', action='store_true', help="recompute every row")
+    args = parser.parse_args()
+
+    stats = run_incremental(args.input, args.output, args.index, args.locale, args.full)
+    print(f"{stats.rows} rows: {stats.reused} reused, {stats.computed} computed, {stats.invalid} invalid")
+
+
+if __name__ == "__main__":
+    main()
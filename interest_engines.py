@@ -0,0 +1,275 @@
+"""
+Interchangeable simple-interest engines and a size-based dispatcher.
+
+Three engines compute the same batch calculation (total interest, monthly
+interest and final amount for rows of principal, annual rate in percent and
+months):
+
+    scalar  plain Python loops; no per-call overhead, best for a GUI click
+    numpy   one vectorized pass; pays array conversion once per call
+    pool    the NumPy kernel on chunks spread over a process pool; pays
+            process start-up and pickling, so only huge batches gain
+
+The Dispatcher picks an engine by batch size. The crossover points are
+measured on the host the first time they are needed and cached under
+.cache/engine_thresholds/, keyed by host, Python and NumPy version, so
+later runs reuse them. The pool is only calibrated, and only considered,
+for batches of at least POOL_MIN_ROWS; its PoolEngine is created on first
+use, not at import. GUIs call start_calibration() at start-up: the NumPy
+crossover is then measured in a daemon thread and DEFAULT_NUMPY_THRESHOLD
+is used until it is known, so no click waits for the measurement.
+
+Usage:
+    python interest_engines.py --calibrate
+    python interest_engines.py --rows 2000000
+"""
+
+import argparse
+import os
+import platform
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from file_cache import JsonCache, combined_hash
+
+
+# Bump when the engines or the calibration method change
+CALIBRATION_VERSION = 1
+
+# Batches below this never go to the pool; starting workers alone takes longer
+POOL_MIN_ROWS = 100_000
+
+# NumPy crossover used while the calibration runs in the background
+DEFAULT_NUMPY_THRESHOLD = 2048
+
+Batch = Tuple[Sequence[float], Sequence[float], Sequence[float]]
+
+
+def scalar_engine(principal: Sequence[float], annual_rate: Sequence[float], months: Sequence[float]) -> Batch:
+    """Pure-Python loop; returns lists."""
+    totals, monthly, finals = [], [], []
+    for p, rate, m in zip(principal, annual_rate, months):
+        total = p * rate * m / 1200
+        totals.append(total)
+        monthly.append(total / m)
+        finals.append(p + total)
+    return totals, monthly, finals
+
+
+def numpy_engine(principal: Sequence[float], annual_rate: Sequence[float], months: Sequence[float]) -> Batch:
+    """Vectorized NumPy kernel; returns arrays."""
+    principal = np.asarray(principal, dtype=float)
+    months = np.asarray(months, dtype=float)
+    total = principal * np.asarray(annual_rate, dtype=float)
+    total *= months
+    total /= 1200
+    return total, total / months, principal + total
+
+
+class PoolEngine:
+    """The NumPy kernel on chunks spread over a lazily started process pool."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __call__(self, principal: Sequence[float], annual_rate: Sequence[float], months: Sequence[float]) -> Batch:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        columns = [np.asarray(column, dtype=float) for column in (principal, annual_rate, months)]
+        chunks = [np.array_split(column, self.workers) for column in columns]
+        parts = list(self._pool.map(numpy_engine, *chunks))
+        return tuple(np.concatenate([part[index] for part in parts]) for index in range(3))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+_POOL: List[PoolEngine] = []
+
+
+def get_pool() -> PoolEngine:
+    """Return the shared PoolEngine, creating it on first use."""
+    if not _POOL:
+        _POOL.append(PoolEngine())
+    return _POOL[0]
+
+
+def pool_engine(principal: Sequence[float], annual_rate: Sequence[float], months: Sequence[float]) -> Batch:
+    """The shared PoolEngine; processes are only started by the first call."""
+    return get_pool()(principal, annual_rate, months)
+
+
+def close_pool() -> None:
+    """Shut down the shared pool's workers, if it was ever used."""
+    if _POOL:
+        _POOL[0].close()
+
+
+ENGINES: Dict[str, Callable[..., Batch]] = {
+    'scalar': scalar_engine,
+    'numpy': numpy_engine,
+    'pool': pool_engine,
+}
+
+
+def register_engine(name: str, engine: Callable[..., Batch]) -> None:
+    """Add or replace an engine; the dispatcher only uses the three built-in names."""
+    ENGINES[name] = engine
+
+
+def _best_time(engine: Callable[..., Batch], batch: Tuple[np.ndarray, ...], repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        engine(*batch)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _sample_batch(rows: int, as_lists: bool) -> Tuple:
+    rng = np.random.default_rng(rows)
+    batch = (rng.uniform(100, 100_000, rows), rng.uniform(0.1, 10, rows), rng.integers(1, 361, rows).astype(float))
+    return tuple(column.tolist() for column in batch) if as_lists else batch
+
+
+def _crossover(faster: Callable[..., Batch], slower: Callable[..., Batch], sizes: Sequence[int],
+               repeats: int, as_lists: bool) -> Optional[int]:
+    """Smallest size from which ``faster`` wins at every larger size, or None if it never does."""
+    crossover = None
+    for rows in sizes:
+        batch = _sample_batch(rows, as_lists)
+        if _best_time(faster, batch, repeats) < _best_time(slower, batch, repeats):
+            crossover = crossover or rows
+        else:
+            crossover = None
+    return crossover
+
+
+def host_key() -> str:
+    """Cache key for thresholds measured on this host and software stack."""
+    return combined_hash([
+        f"v{CALIBRATION_VERSION}", platform.node(), platform.machine(), platform.python_version(),
+        np.__version__, str(os.cpu_count()),
+    ])
+
+
+class Dispatcher:
+    """Chooses an engine per call from the batch size."""
+
+    def __init__(self, cache: Optional[JsonCache] = None):
+        self.cache = cache or JsonCache('engine_thresholds')
+        self.key = host_key()
+        self.thresholds: Dict[str, Optional[int]] = self.cache.get(self.key) or {}
+        self._calibration: Optional[threading.Thread] = None
+
+    def _save(self) -> None:
+        self.cache.put(self.key, self.thresholds)
+
+    def start_calibration(self) -> None:
+        """Measure the NumPy crossover in a daemon thread if it is not cached yet."""
+        if 'numpy' in self.thresholds or self._calibration is not None:
+            return
+        self._calibration = threading.Thread(target=self.numpy_threshold, name='engine-calibration', daemon=True)
+        self._calibration.start()
+
+    def numpy_threshold(self) -> int:
+        """
+        Batch size from which NumPy beats the scalar loop (calibrated on first use).
+
+        While start_calibration() is still measuring, DEFAULT_NUMPY_THRESHOLD is
+        returned instead of waiting for it.
+        """
+        if 'numpy' not in self.thresholds:
+            if self._calibration is not None and self._calibration is not threading.current_thread():
+                return DEFAULT_NUMPY_THRESHOLD
+            # Inputs arrive as Python lists, as they do from the GUIs. If NumPy
+            # never wins in the measured range, it still takes everything above it.
+            sizes = [2 ** k for k in range(11)]
+            self.thresholds['numpy'] = _crossover(numpy_engine, scalar_engine, sizes, repeats=200,
+                                                  as_lists=True) or DEFAULT_NUMPY_THRESHOLD
+            self._save()
+        return self.thresholds['numpy']
+
+    def pool_threshold(self) -> Optional[int]:
+        """Batch size from which the process pool beats NumPy (calibrated on first use)."""
+        if 'pool' not in self.thresholds:
+            pool = get_pool()
+            pool(*_sample_batch(pool.workers, as_lists=False))      # start the workers outside the timing
+            self.thresholds['pool'] = _crossover(pool, numpy_engine,
+                                                 [POOL_MIN_ROWS * 2 ** k for k in range(6)], repeats=3,
+                                                 as_lists=False)
+            self._save()
+        return self.thresholds['pool']
+
+    def choose(self, rows: int) -> str:
+        """Name of the engine for a batch of ``rows`` rows."""
+        if rows < self.numpy_threshold():
+            return 'scalar'
+        if rows >= POOL_MIN_ROWS:
+            pool_from = self.pool_threshold()
+            if pool_from is not None and rows >= pool_from:
+                return 'pool'
+        return 'numpy'
+
+    def calculate(self, principal: Sequence[float], annual_rate: Sequence[float], months: Sequence[float]) -> Batch:
+        """
+        Simple interest for a batch with the engine suited to its size.
+
+        Returns:
+            Tuple of (total_interest, monthly_interest, final_amount) sequences
+        """
+        return ENGINES[self.choose(len(principal))](principal, annual_rate, months)
+
+    def recalibrate(self) -> Dict[str, Optional[int]]:
+        """Discard the cached thresholds and measure them again."""
+        if self._calibration is not None:
+            self._calibration.join()
+            self._calibration = None
+        self.thresholds = {}
+        self.numpy_threshold()
+        self.pool_threshold()
+        return self.thresholds
+
+
+_DISPATCHER: List[Dispatcher] = []
+
+
+def get_dispatcher() -> Dispatcher:
+    """Return the shared dispatcher, loading cached thresholds once per process."""
+    if not _DISPATCHER:
+        _DISPATCHER.append(Dispatcher())
+    return _DISPATCHER[0]
+
+
+def main() -> None:
+    """Command-line entry point: calibrate or time a batch."""
+    parser = argparse.ArgumentParser(description="Calibrate and compare the interest engines.")
+    parser.add_argument('--calibrate', action='store_true', help="re-measure the crossover thresholds")
+    parser.add_argument('--rows', type=int, default=0, help="time every engine on a batch of this size")
+    args = parser.parse_args()
+
+    dispatcher = get_dispatcher()
+    try:
+        thresholds = dispatcher.recalibrate() if args.calibrate else {
+            'numpy': dispatcher.numpy_threshold(), 'pool': dispatcher.pool_threshold()}
+        for name, rows in thresholds.items():
+            print(f"{name:>6}: " + (f"from {rows} rows" if rows is not None else "never faster"))
+
+        if args.rows:
+            batch = _sample_batch(args.rows, as_lists=False)
+            for name, engine in ENGINES.items():
+                print(f"{name:>6}: {_best_time(engine, batch, 3) * 1000:10.3f} ms")
+            print(f"dispatcher picks {dispatcher.choose(args.rows)}")
+    finally:
+        close_pool()
+
+
+if __name__ == "__main__":
+    main()
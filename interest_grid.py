@@ -0,0 +1,83 @@
+"""
+Precomputed result grids for real-time what-if sliders.
+
+A ResultGrid evaluates a vectorized calculation once over a regular
+(principal, rate, months) lattice covering the slider ranges, in a
+background thread. Slider drag events are then answered by trilinear
+interpolation, which costs a handful of array lookups regardless of how
+expensive the underlying calculation is.
+"""
+
+import threading
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+Axis = Tuple[float, float, int]
+GridFunction = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+
+class ResultGrid:
+    """Lattice of precomputed results with trilinear interpolation."""
+
+    def __init__(self, function: GridFunction, principal_axis: Axis,
+                 rate_axis: Axis, months_axis: Axis):
+        """
+        Args:
+            function: Vectorized f(principal, annual_rate, months) -> result array;
+                the last axis of the result may hold several outputs
+            principal_axis: (minimum, maximum, points)
+            rate_axis: (minimum, maximum, points)
+            months_axis: (minimum, maximum, points)
+        """
+        self.function = function
+        self.axes = [np.linspace(lo, hi, n) for lo, hi, n in (principal_axis, rate_axis, months_axis)]
+        self.values: Optional[np.ndarray] = None
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def build_async(self) -> None:
+        """Start evaluating the grid in a daemon thread."""
+        self._thread = threading.Thread(target=self.build, daemon=True)
+        self._thread.start()
+
+    def build(self) -> None:
+        """Evaluate the function on every lattice point."""
+        principal, rate, months = np.meshgrid(*self.axes, indexing='ij')
+        self.values = np.asarray(self.function(principal, rate, months), dtype=float)
+        self._ready.set()
+
+    def covers(self, principal: float, rate: float, months: float) -> bool:
+        return all(axis[0] <= value <= axis[-1] for axis, value in zip(self.axes, (principal, rate, months)))
+
+    def lookup(self, principal: float, rate: float, months: float) -> Optional[np.ndarray]:
+        """
+        Interpolate the result at a point.
+
+        Returns:
+            Interpolated result, or None if the grid is not built yet or the
+            point lies outside it
+        """
+        if not self.ready or not self.covers(principal, rate, months):
+            return None
+
+        indices = []
+        weights = []
+        for axis, value in zip(self.axes, (principal, rate, months)):
+            i = min(int(np.searchsorted(axis, value, side='right')) - 1, len(axis) - 2)
+            i = max(i, 0)
+            span = axis[i + 1] - axis[i]
+            indices.append(i)
+            weights.append((value - axis[i]) / span if span else 0.0)
+
+        (i, j, k), (wp, wr, wm) = indices, weights
+        cube = self.values[i:i + 2, j:j + 2, k:k + 2]
+        # Collapse one axis at a time: months, then rate, then principal
+        cube = cube[:, :, 0] * (1 - wm) + cube[:, :, 1] * wm
+        cube = cube[:, 0] * (1 - wr) + cube[:, 1] * wr
+        return cube[0] * (1 - wp) + cube[1] * wp
@@ -0,0 +1,219 @@
+"""
+Shared money formatting for the calculator apps and batch exports.
+
+Each locale is compiled once into a number template, a translation table for
+the grouping/decimal separators and the currency placement. Bulk formatting
+expands the template into one format string per chunk of amounts, renders the
+whole chunk with a single str.format() call, translates the separators in one
+C-level pass and attaches the currency symbols with replace(), which avoids the
+per-value f-string + replace() cost.
+"""
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO
+
+
+CURRENCY_SYMBOLS: Dict[str, str] = {
+    'EUR': "€",
+    'USD': "$",
+    'HRK': "HRK",
+    'KN': "kn",
+}
+
+
+@dataclass(frozen=True)
+class LocaleSpec:
+    """Grouping, decimal and currency conventions of a single locale."""
+    group_separator: str
+    decimal_separator: str
+    default_currency: str
+    symbol_before: bool
+    symbol_spacing: str
+    # Other thousands separators accepted when parsing (e.g. "1 234,50")
+    alternate_group_separators: str = ""
+
+
+LOCALES: Dict[str, LocaleSpec] = {
+    'hr-HR': LocaleSpec(group_separator=".", decimal_separator=",",
+                        default_currency='EUR', symbol_before=False, symbol_spacing=" ",
+                        alternate_group_separators=" \u00a0"),
+    'en-US': LocaleSpec(group_separator=",", decimal_separator=".",
+                        default_currency='USD', symbol_before=True, symbol_spacing=""),
+}
+
+# Number of amounts rendered by one str.format() call in bulk mode
+CHUNK_SIZE = 8192
+
+
+class MoneyFormatter:
+    """Formats amounts for one locale and currency, singly or in bulk."""
+
+    def __init__(self, locale: str = 'en-US', currency: Optional[str] = None,
+                 decimals: int = 2, grouping: bool = True,
+                 group_separator: Optional[str] = None):
+        """
+        Compile the formatting template for a locale.
+
+        Args:
+            locale: Locale key from LOCALES (e.g. 'hr-HR', 'en-US')
+            currency: Currency code from CURRENCY_SYMBOLS, or None for the locale default
+            decimals: Number of decimal places
+            grouping: Whether to insert thousands separators
+            group_separator: Overrides the locale's thousands separator
+
+        Raises:
+            ValueError: If the locale or currency is unknown
+        """
+        if locale not in LOCALES:
+            raise ValueError(f"Unknown locale: {locale}")
+        spec = LOCALES[locale]
+        currency = currency or spec.default_currency
+        if currency not in CURRENCY_SYMBOLS:
+            raise ValueError(f"Unknown currency: {currency}")
+
+        self.locale = locale
+        self.currency = currency
+        self.decimals = decimals
+
+        # Python always renders "," for grouping and "." for decimals, so a
+        # single translate() call maps both to the locale's separators.
+        template = ("{:,.%df}" if grouping else "{:.%df}") % decimals
+        self._number = template.format
+        group = spec.group_separator if group_separator is None else group_separator
+        self._table = str.maketrans({",": group, ".": spec.decimal_separator})
+        self._translate = (group, spec.decimal_separator) != (",", ".")
+
+        symbol = CURRENCY_SYMBOLS[currency]
+        if spec.symbol_before:
+            self._prefix, self._suffix = symbol + spec.symbol_spacing, ""
+        else:
+            self._prefix, self._suffix = "", spec.symbol_spacing + symbol
+
+        self._item = template + "\n"
+        self._chunk_template = self._item * CHUNK_SIZE
+
+    def format(self, amount: float) -> str:
+        """Format a single amount with the currency symbol."""
+        number = self._number(amount).translate(self._table)
+        if self._prefix and number.startswith("-"):
+            # The sign goes before a leading symbol: -$1,234.50
+            return "-" + self._prefix + number[1:]
+        return self._prefix + number + self._suffix
+
+    def format_number(self, amount: float) -> str:
+        """Format a single amount without the currency symbol."""
+        return self._number(amount).translate(self._table)
+
+    def format_many(self, amounts: Iterable[float], symbol: bool = True) -> List[str]:
+        """
+        Format a whole column of amounts in one pass.
+
+        Args:
+            amounts: Any iterable of numbers, including NumPy arrays
+            symbol: Whether to attach the currency symbol
+
+        Returns:
+            List of formatted strings in input order
+        """
+        text = self.format_lines(amounts, symbol)
+        return text.split("\n") if text else []
+
+    def format_lines(self, amounts: Iterable[float], symbol: bool = True) -> str:
+        """
+        Format amounts into a newline-separated block, ready for export.
+
+        Args:
+            amounts: Any iterable of numbers, including NumPy arrays
+            symbol: Whether to attach the currency symbol
+
+        Returns:
+            Formatted amounts joined by newlines (no trailing newline)
+        """
+        if hasattr(amounts, 'tolist'):
+            amounts = amounts.tolist()
+        iterator = iter(amounts)
+        parts = []
+        while True:
+            chunk = list(islice(iterator, CHUNK_SIZE))
+            if not chunk:
+                break
+            template = self._chunk_template if len(chunk) == CHUNK_SIZE else self._item * len(chunk)
+            parts.append(template.format(*chunk))
+        if not parts:
+            return ""
+
+        # Translate while the text is still pure ASCII (CPython's fast path),
+        # then attach the symbols with C-level replace() calls.
+        body = "".join(parts)[:-1]
+        if self._translate:
+            body = body.translate(self._table)
+        if symbol and self._prefix:
+            body = self._prefix + body.replace("\n", "\n" + self._prefix)
+            if "-" in body:
+                body = body.replace(self._prefix + "-", "-" + self._prefix)
+        if symbol and self._suffix:
+            body = body.replace("\n", self._suffix + "\n") + self._suffix
+        return body
+
+
+_FORMATTERS: Dict[tuple, MoneyFormatter] = {}
+
+
+def get_formatter(locale: str = 'en-US', currency: Optional[str] = None, **options) -> MoneyFormatter:
+    """Return a cached formatter so templates are compiled only once per configuration."""
+    key = (locale, currency, tuple(sorted(options.items())))
+    formatter = _FORMATTERS.get(key)
+    if formatter is None:
+        formatter = _FORMATTERS[key] = MoneyFormatter(locale, currency, **options)
+    return formatter
+
+
+def export_cell(value: float, money: bool, decimals: int = 2) -> str:
+    """Render one value the way format_csv_rows renders a cell of its column."""
+    if value != value:
+        return ""
+    if money:
+        return get_formatter('en-US', grouping=False, decimals=decimals).format_number(value)
+    text = repr(float(value))
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _export_cells(values: Iterable[float], money: bool, decimals: int) -> List[str]:
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    if money:
+        text = get_formatter('en-US', grouping=False, decimals=decimals).format_lines(values, symbol=False)
+    else:
+        # Shortest text that reads back as the same float; whole numbers without ".0"
+        text = "\n".join(map(float.__repr__, map(float, values)))
+        text = (text + "\n").replace(".0\n", "\n")[:-1]
+    cells = text.split("\n") if text else []
+    if "nan" in text:
+        cells = ["" if cell == "nan" else cell for cell in cells]
+    return cells
+
+
+def format_csv_rows(columns: Sequence[Iterable[float]], money: Sequence[bool], decimals: int = 2) -> str:
+    """
+    Render numeric columns as CSV rows for machine-readable exports.
+
+    Money columns get ``decimals`` fixed decimals (no grouping, no symbol, "."
+    as the decimal point); other columns are written exactly, as the
+    shortest text that reads back as the same float. NaN becomes an empty cell.
+
+    Returns:
+        The rows, each ending with a newline
+    """
+    cells = [_export_cells(column, is_money, decimals) for column, is_money in zip(columns, money)]
+    if not cells or not cells[0]:
+        return ""
+    return "\n".join(map(",".join, zip(*cells))) + "\n"
+
+
+def write_csv(out: TextIO, columns: Sequence[Iterable[float]], money: Sequence[bool], decimals: int = 2) -> None:
+    """Write columns as CSV rows (see format_csv_rows), CHUNK_SIZE rows per formatting pass."""
+    columns = [column.tolist() if hasattr(column, 'tolist') else list(column) for column in columns]
+    rows = len(columns[0]) if columns else 0
+    for start in range(0, rows, CHUNK_SIZE):
+        out.write(format_csv_rows([column[start:start + CHUNK_SIZE] for column in columns], money, decimals))
@@ -0,0 +1,313 @@
+"""
+Locale-aware parsing of numbers, for single fields and whole columns.
+
+Uses the grouping and decimal conventions of money_format.LOCALES, so
+"1.234.567,89" (hr-HR) and "1,234,567.89" (en-US) read as the same amount.
+Thousands separators are optional but must sit between groups of exactly
+three digits; "1.23,5" is rejected rather than silently read as 123.5. A
+locale's alternate separators (a space or no-break space in hr-HR, as
+written by DeepSeekCro's formatter) are read as its thousands separator.
+
+Columns are validated without a regular expression per row: a chunk of
+strings is joined into one byte buffer, every byte is classified with NumPy
+and the per-row checks (allowed characters, sign position, separator
+placement, decimal count) become a few array reductions. Valid rows are
+then converted with one translate() of the whole chunk and a single
+float() pass; in cents mode the digits are read as int64 directly, so the
+cents stay exact up to MAX_CENTS_AMOUNT. Each row gets an error code instead of an exception, so a bad
+row costs nothing extra.
+
+The GUIs validate single fields through the same parser, so a value typed
+into a form and the same value in an imported file are read identically.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+
+from money_format import LOCALES
+
+
+OK = 0
+EMPTY = 1          # nothing but whitespace
+SYNTAX = 2         # not a number (stray characters, misplaced sign, two decimal separators)
+GROUPING = 3       # thousands separator in the wrong place
+PRECISION = 4      # more than two decimals where cents were requested
+RANGE = 5          # too large to represent
+
+ERROR_NAMES: Dict[int, str] = {
+    EMPTY: 'empty',
+    SYNTAX: 'syntax',
+    GROUPING: 'grouping',
+    PRECISION: 'precision',
+    RANGE: 'range',
+}
+
+ERROR_MESSAGES: Dict[int, str] = {
+    EMPTY: "is required",
+    SYNTAX: "must be a valid number",
+    GROUPING: "has a misplaced thousands separator",
+    PRECISION: "has more than two decimals",
+    RANGE: "is too large",
+}
+
+# Largest amount accepted in cents mode: 2**53 cents, the most that from_cents
+# and other float conversions of the int64 cents still represent exactly
+_MAX_CENTS = 2 ** 53
+MAX_CENTS_AMOUNT = _MAX_CENTS / 100
+
+# Cents per unit of the last digit, by number of fraction digits (0, 1 or 2)
+_CENT_SCALE = np.array([100, 10, 1], dtype=np.int64)
+
+# Rows longer than this (in bytes) could overflow int64 once scaled to cents
+_INT64_DIGITS = 16
+
+# Rows validated together; bounds the size of the per-byte work arrays
+CHUNK_SIZE = 65536
+
+_DIGIT_0, _DIGIT_9, _PLUS, _MINUS, _NEWLINE = b"09+-\n"
+
+
+@dataclass
+class ParseResult:
+    """Parsed column: values plus one error code per row (OK = 0)."""
+    values: np.ndarray
+    errors: np.ndarray
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean mask of rows that parsed."""
+        return self.errors == OK
+
+    def error_rows(self, code: Optional[int] = None) -> np.ndarray:
+        """Indices of rows with any error, or with one specific error code."""
+        return np.flatnonzero(self.errors != OK if code is None else self.errors == code)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of rows per error name; error codes that did not occur are left out."""
+        totals = np.bincount(self.errors, minlength=len(ERROR_NAMES) + 1)
+        return {ERROR_NAMES[code]: int(totals[code]) for code in ERROR_NAMES if totals[code]}
+
+
+class NumberParser:
+    """Parses numbers written with one locale's grouping and decimal separators."""
+
+    def __init__(self, locale: str = 'hr-HR', decimal_fallback: bool = False):
+        """
+        Args:
+            locale: Locale key from money_format.LOCALES
+            decimal_fallback: Read a single misplaced thousands separator as
+                the decimal point (e.g. "5.5" as 5,5 in hr-HR), for form
+                fields where users type either convention
+
+        Raises:
+            ValueError: If the locale is unknown
+        """
+        if locale not in LOCALES:
+            raise ValueError(f"Unknown locale: {locale}")
+        spec = LOCALES[locale]
+        self.locale = locale
+        self.group_separator = spec.group_separator
+        self.decimal_separator = spec.decimal_separator
+        self.decimal_fallback = decimal_fallback
+        self._group = ord(spec.group_separator)
+        self._decimal = ord(spec.decimal_separator)
+        self._table = str.maketrans({spec.group_separator: None, spec.decimal_separator: "."})
+        self._digits_table = str.maketrans({spec.group_separator: None, spec.decimal_separator: None})
+        self._alternate_groups = spec.alternate_group_separators
+        self._alternate_table = str.maketrans(dict.fromkeys(spec.alternate_group_separators,
+                                                            spec.group_separator))
+
+    def parse(self, text: str, field_name: str = "Value", cents: bool = False) -> float:
+        """
+        Parse one field.
+
+        Returns:
+            The value, or whole cents as an int when ``cents`` is set
+
+        Raises:
+            ValueError: With a message naming ``field_name`` if the text is not a number
+        """
+        result = self.parse_many([text], cents=cents)
+        code = int(result.errors[0])
+        if code != OK:
+            raise ValueError(f"{field_name} {ERROR_MESSAGES[code]}")
+        value = result.values[0]
+        return int(value) if cents else float(value)
+
+    def check(self, text: str) -> int:
+        """Error code for one field without raising, e.g. for enabling buttons."""
+        return int(self.parse_many([text]).errors[0])
+
+    def is_partial(self, text: str) -> bool:
+        """
+        Whether ``text`` could still become a valid number by typing more,
+        for per-keystroke validation ("1.", "-" and "1.23" all can in hr-HR).
+        """
+        body = text.strip()
+        if body[:1] in "+-":
+            body = body[1:]
+        integer, _, fraction = body.partition(self.decimal_separator)
+        groups = self.group_separator + self._alternate_groups
+        return (all(c.isdigit() or c in groups for c in integer)
+                and all(c.isdigit() for c in fraction))
+
+    def parse_many(self, texts: Iterable[str], cents: bool = False) -> ParseResult:
+        """
+        Parse a whole column of strings.
+
+        Args:
+            texts: Strings to parse; surrounding whitespace is ignored
+            cents: Return int64 cents instead of float64 values, rejecting
+                rows with more than two decimals
+
+        Returns:
+            ParseResult whose values are 0 wherever the error code is not OK
+        """
+        texts = texts if isinstance(texts, Sequence) else list(texts)
+        values = np.zeros(len(texts), dtype=np.int64 if cents else float)
+        errors = np.zeros(len(texts), dtype=np.uint8)
+        for start in range(0, len(texts), CHUNK_SIZE):
+            chunk = slice(start, start + CHUNK_SIZE)
+            self._parse_chunk(texts[chunk], cents, values[chunk], errors[chunk])
+        return ParseResult(values, errors)
+
+    def _parse_chunk(self, texts: Sequence[str], cents: bool, values: np.ndarray, errors: np.ndarray) -> None:
+        count = len(texts)
+        if not count:
+            return
+        rows = list(map(str.strip, texts))
+        block = "\n".join(rows)
+        if block.count("\n") != count - 1:
+            # A line break inside a value would shift every later row
+            rows = [text.replace("\n", "\0") for text in rows]
+            block = "\n".join(rows)
+        alternate = None
+        if any(separator in block for separator in self._alternate_groups):
+            # Read "1 234" as "1.234"; such rows never take the decimal fallback
+            alternate = np.array([any(separator in text for separator in self._alternate_groups)
+                                  for text in rows])
+            block = block.translate(self._alternate_table)
+            rows = block.split("\n")
+        data = np.frombuffer(block.encode('utf-8'), dtype=np.uint8)
+
+        # Only non-digit bytes need classifying, and there are a few per row
+        # at most; uint8 subtraction wraps, so one comparison finds them all.
+        special_at = np.flatnonzero((data - _DIGIT_0) > 9)
+        special = data[special_at]
+        newline = special == _NEWLINE
+        ends = np.append(special_at[newline], data.size)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        at = special_at[~newline]
+        kind = special[~newline]
+        row = np.cumsum(newline)[~newline]
+
+        group, decimal = kind == self._group, kind == self._decimal
+        sign = (kind == _PLUS) | (kind == _MINUS)
+        group_at, group_row = at[group], row[group]
+        decimal_at, decimal_row = at[decimal], row[decimal]
+        sign_at, sign_row = at[sign], row[sign]
+
+        def per_row(rows: np.ndarray) -> np.ndarray:
+            return np.bincount(rows, minlength=count)
+
+        # Syntax: stray bytes, a sign anywhere but first, no digits, several or dangling decimal separators
+        groups, decimals, signs = per_row(group_row), per_row(decimal_row), per_row(sign_row)
+        syntax = per_row(row[~(group | decimal | sign)]) > 0
+        syntax |= per_row(sign_row[sign_at != starts[sign_row]]) > 0
+        syntax |= ends - starts == groups + decimals + signs
+        syntax |= decimals > 1
+        syntax[decimal_row[decimal_at + 1 == ends[decimal_row]]] = True
+
+        # Grouping: "d{1,3}(Gddd)+" has its separators every 4th byte from the
+        # end of the integer part, exactly (length - 1) // 4 of them, and a
+        # length that is not a multiple of 4 (the first group is not empty)
+        integer_end = ends.copy()
+        integer_end[decimal_row] = decimal_at
+        integer_start = starts + (signs > 0)
+        misplaced = per_row(group_row[((integer_end[group_row] - group_at) & 3 != 0)
+                                      | (group_at >= integer_end[group_row])
+                                      | (group_at <= integer_start[group_row])]) > 0
+        integer_length = integer_end - integer_start
+        misplaced |= (groups > 0) & ((groups != (integer_length - 1) // 4) | (integer_length & 3 == 0))
+
+        fallback = np.zeros(count, dtype=bool)
+        if self.decimal_fallback:
+            fallback = misplaced & (groups == 1) & (decimals == 0) & ~syntax
+            fallback[group_row[group_at + 1 == ends[group_row]]] = False
+            if alternate is not None:
+                fallback &= ~alternate
+            misplaced &= ~fallback
+
+        errors[:] = np.select([ends == starts, syntax, misplaced], [EMPTY, SYNTAX, GROUPING], OK)
+
+        if cents:
+            # Count fraction digits after the decimal separator (or the fallback point)
+            point = np.where(decimals > 0, integer_end, ends)
+            fallback_group = fallback[group_row]
+            point[group_row[fallback_group]] = group_at[fallback_group]
+            fraction_digits = ends - point - 1
+            errors[(errors == OK) & (fraction_digits > 2)] = PRECISION
+            values[:] = self._cents(block, errors, np.clip(fraction_digits, 0, 2), ends - starts)
+            return
+
+        # Convert every row in one pass; rows with errors are parsed as "0"
+        cleaned = block.translate(self._table).split("\n")
+        for index in np.flatnonzero(errors):
+            cleaned[index] = "0"
+        for index in np.flatnonzero(fallback & (errors == OK)):
+            cleaned[index] = rows[index].replace(self.group_separator, ".")
+        parsed = np.array(cleaned, dtype=float)
+
+        too_large = ~(np.abs(parsed) < np.inf)
+        if too_large.any():
+            errors[too_large] = RANGE
+            parsed[too_large] = 0
+        values[:] = parsed
+
+    def _cents(self, block: str, errors: np.ndarray, fraction_digits: np.ndarray,
+               lengths: np.ndarray) -> np.ndarray:
+        """
+        Whole cents of every row, read from the digits with the separators
+        removed ("1.234,5" -> 12345 * 10); float * 100 would get the last cent
+        wrong for amounts above 2**46. Sets RANGE on rows of MAX_CENTS_AMOUNT or more.
+        """
+        digits = block.translate(self._digits_table).split("\n")
+        for index in np.flatnonzero(errors):
+            digits[index] = "0"
+        # Rows with more digits than int64 can scale are rare; Python ints read them exactly
+        long_rows = np.flatnonzero((lengths > _INT64_DIGITS) & (errors == OK)).tolist()
+        long_values = [int(digits[index]) * int(_CENT_SCALE[fraction_digits[index]]) for index in long_rows]
+        for index in long_rows:
+            digits[index] = "0"
+        cents = np.array(digits, dtype=np.int64)
+        cents *= _CENT_SCALE[fraction_digits]
+
+        too_large = np.abs(cents) >= _MAX_CENTS
+        for index, value in zip(long_rows, long_values):
+            if abs(value) < _MAX_CENTS:
+                cents[index] = value
+            else:
+                too_large[index] = True
+        if too_large.any():
+            errors[too_large] = RANGE
+            cents[too_large] = 0
+        return cents
+
+
+_PARSERS: Dict[tuple, NumberParser] = {}
+
+
+def get_parser(locale: str = 'hr-HR', decimal_fallback: bool = False) -> NumberParser:
+    """Return a cached parser for a locale."""
+    key = (locale, decimal_fallback)
+    parser = _PARSERS.get(key)
+    if parser is None:
+        parser = _PARSERS[key] = NumberParser(locale, decimal_fallback)
+    return parser
+
+
+def parse_column(texts: Iterable[str], locale: str = 'hr-HR', cents: bool = False) -> ParseResult:
+    """Parse a column of strings with the cached parser for ``locale``."""
+    return get_parser(locale).parse_many(texts, cents=cents)
@@ -0,0 +1,241 @@
+"""
+Watch a folder of CSV portfolios and keep their results up to date.
+
+Polls the folder (no inotify needed) and compares every file's size and
+modification time with the last poll. For each file it remembers the byte
+offset up to which rows were processed:
+
+    new file        every row is processed
+    appended to     only the bytes after the offset are read, parsed and
+                    calculated; their results are added to the output
+    rewritten       (shrunk, or the bytes before the offset changed) the
+                    file is processed again from the start
+
+Rows are calculated with calculate_simple_interest from PerplexityENG.py.
+Output files are replaced atomically (written to a temporary file, then
+renamed), so readers never see a half-written result file. For an append
+this means the previous output is copied into the temporary file before the
+new rows are added: the rows are only calculated once, but every append
+costs a copy of the whole output. The copy is done with shutil.copyfile,
+which on Linux stays in the kernel (sendfile), so it is limited by disk
+speed rather than by Python.
+
+Usage:
+    python portfolio_watch.py portfolios/
+    python portfolio_watch.py portfolios/ --output results/ --interval 0.5
+"""
+
+import argparse
+import csv
+import glob
+import io
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from money_format import export_cell
+from number_parsing import OK, get_parser
+from PerplexityENG import calculate_simple_interest, validate_inputs
+
+
+INPUT_COLUMNS = ('principal', 'annual_rate', 'months')
+OUTPUT_HEADER = "principal,annual_rate,months,total_interest,total_amount,monthly_interest,error\n"
+
+# Bytes before the offset compared on every change to tell appends from rewrites
+CHECK_BYTES = 64
+
+
+@dataclass
+class FileState:
+    """What is known about one watched file."""
+    size: int = 0
+    mtime_ns: int = 0
+    offset: int = 0                  # bytes processed so far
+    header: List[str] = field(default_factory=list)
+    check: bytes = b""               # the CHECK_BYTES bytes just before offset
+    rows: int = 0
+
+
+def _read(path: str, start: int, end: int) -> bytes:
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def result_lines(rows: List[List[str]], header: List[str], locale: str = 'en-US') -> List[str]:
+    """
+    Calculate one output line per input row.
+
+    Rows that do not parse or fail validate_inputs are echoed as written,
+    with empty results and the reason in the error column.
+    """
+    if not rows:
+        return []
+    try:
+        indices = [header.index(name) for name in INPUT_COLUMNS]
+    except ValueError:
+        return [",,,,,,missing columns\n"] * len(rows)
+    parser = get_parser(locale)
+    columns = [parser.parse_many([row[index] if index < len(row) else "" for row in rows])
+               for index in indices]
+
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    for row, (principal, annual_rate, months) in enumerate(zip(*(column.values.tolist() for column in columns))):
+        try:
+            if any(column.errors[row] != OK for column in columns):
+                raise ValueError("invalid number")
+            validate_inputs(principal, annual_rate, months)
+            if months != int(months):
+                raise ValueError("Duration (months) must be a whole number.")
+            results = calculate_simple_interest(principal, annual_rate, int(months))
+        except ValueError as e:
+            # Echo the row as it was written, so it can be found and fixed
+            raw = [rows[row][index].strip() if index < len(rows[row]) else "" for index in indices]
+            writer.writerow(raw + ["", "", "", str(e)])
+            continue
+        writer.writerow([export_cell(principal, True), export_cell(annual_rate, False), export_cell(months, False)]
+                        + [export_cell(value, True) for value in results] + [""])
+    return out.getvalue().splitlines(keepends=True)
+
+
+class PortfolioWatcher:
+    """Polls a folder and updates one result file per input CSV."""
+
+    def __init__(self, input_dir: str, output_dir: Optional[str] = None, pattern: str = "*.csv",
+                 locale: str = 'en-US'):
+        self.input_dir = input_dir
+        self.output_dir = output_dir or os.path.join(input_dir, "results")
+        self.pattern = pattern
+        self.locale = locale
+        self.states: Dict[str, FileState] = {}
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    def output_path(self, path: str) -> str:
+        name = os.path.splitext(os.path.basename(path))[0]
+        return os.path.join(self.output_dir, f"{name}.results.csv")
+
+    def poll(self) -> Dict[str, str]:
+        """
+        Check every input file once.
+
+        Returns:
+            File name -> 'new', 'appended', 'rewritten' or 'removed', for files that changed
+        """
+        changes: Dict[str, str] = {}
+        paths = sorted(glob.glob(os.path.join(self.input_dir, self.pattern)))
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            state = self.states.get(path)
+            if state is not None and (stat.st_size, stat.st_mtime_ns) == (state.size, state.mtime_ns):
+                if state.offset < state.size and self._process(path, state, state.offset, state.size, final=True):
+                    # The writer has stopped without ending the last line; it was taken as complete
+                    changes[os.path.basename(path)] = 'appended'
+                continue
+
+            if state is None:
+                status, state = 'new', FileState()
+            elif self._is_append(path, state, stat.st_size):
+                status = 'appended'
+            else:
+                status, state = 'rewritten', FileState()
+            state.size, state.mtime_ns = stat.st_size, stat.st_mtime_ns
+            self.states[path] = state
+            if self._process(path, state, state.offset, stat.st_size, final=False) or status != 'appended':
+                changes[os.path.basename(path)] = status
+
+        for path in set(self.states) - set(paths):
+            del self.states[path]
+            changes[os.path.basename(path)] = 'removed'
+        return changes
+
+    def _is_append(self, path: str, state: FileState, size: int) -> bool:
+        """Whether the file only grew: it is longer and the bytes before the offset are unchanged."""
+        if size < state.offset:
+            return False
+        start = max(0, state.offset - CHECK_BYTES)
+        current = _read(path, start, state.offset)
+        # A last line taken as complete without a newline may since have been continued
+        return current == state.check and (not current or current.endswith(b"\n"))
+
+    def _process(self, path: str, state: FileState, start: int, end: int, final: bool) -> bool:
+        """
+        Parse and calculate the complete lines between ``start`` and ``end``.
+
+        Args:
+            final: Treat a last line without a newline as complete
+
+        Returns:
+            Whether any rows were processed
+        """
+        data = _read(path, start, end)
+        if not final:
+            data = data[:data.rfind(b"\n") + 1]
+        if not data and start > 0:
+            return False
+
+        rows = [row for row in csv.reader(io.StringIO(data.decode('utf-8-sig' if start == 0 else 'utf-8')))
+                if any(cell.strip() for cell in row)]
+        if start == 0:
+            state.header = [name.strip() for name in rows.pop(0)] if rows else []
+        lines = result_lines(rows, state.header, self.locale)
+        self._write(self.output_path(path), lines, append=start > 0)
+
+        state.offset = start + len(data)
+        state.check = _read(path, max(0, state.offset - CHECK_BYTES), state.offset)
+        state.rows = (state.rows if start > 0 else 0) + len(lines)
+        return True
+
+    def _write(self, output_path: str, lines: List[str], append: bool) -> None:
+        """Replace the output atomically; when appending, the old results are copied first."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            appending = append and os.path.exists(output_path)
+            if appending:
+                shutil.copyfile(output_path, tmp_path)
+            with open(tmp_path, 'a' if appending else 'w', encoding='utf-8', newline='') as out:
+                if not appending:
+                    out.write(OUTPUT_HEADER)
+                out.writelines(lines)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def run(self, interval: float = 1.0, polls: Optional[int] = None) -> None:
+        """Poll every ``interval`` seconds, forever or ``polls`` times, printing changes."""
+        count = 0
+        while polls is None or count < polls:
+            for name, status in self.poll().items():
+                state = next((s for p, s in self.states.items() if os.path.basename(p) == name), None)
+                rows = f" ({state.rows} rows)" if state else ""
+                print(f"[{status}] {name}{rows}")
+            count += 1
+            time.sleep(interval)
+
+
+def main() -> None:
+    """Command-line entry point: watch a folder of portfolios."""
+    parser = argparse.ArgumentParser(description="Recalculate CSV portfolios as they change.")
+    parser.add_argument('input_dir', help="folder with CSV files (principal, annual_rate, months)")
+    parser.add_argument('--output', default=None, help="folder for results (default: <input_dir>/results)")
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between polls")
+    parser.add_argument('--locale', default='en-US', help="number format of the input")
+    args = parser.parse_args()
+
+    watcher = PortfolioWatcher(args.input_dir, args.output, locale=args.locale)
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
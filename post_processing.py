@@ -0,0 +1,268 @@
+"""
+Declarative post-processing of interest results, fused into one pass.
+
+A Pipeline is a list of stages applied to raw interest in a fixed order:
+
+    interest -> withholding tax -> inflation -> currency conversion -> rounding
+
+Tax, inflation and conversion are all multiplicative, so a Pipeline folds any
+number of them into three coefficients: the share of interest kept after
+tax, the log of the yearly inflation deflator and the exchange rate. A chunk
+is then evaluated with a fixed handful of in-place NumPy operations into
+preallocated output buffers, however many stages were declared, and nothing
+is re-read between stages.
+
+Batch usage:
+    python post_processing.py accounts.csv results.csv --tax 12 --inflation 3 --fx 1.08 --currency USD
+
+The input CSV needs the columns principal, annual_rate (percent) and months;
+interest is calculated as simple interest, K = P * r * t.
+"""
+
+import argparse
+import csv
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from fixed_point import HALF_EVEN, HALF_UP, ROUNDING_MODES, TIE_TOLERANCE
+from money_format import write_csv
+
+
+@dataclass(frozen=True)
+class WithholdingTax:
+    """Tax withheld from the interest, in percent."""
+    rate: float
+
+
+@dataclass(frozen=True)
+class Inflation:
+    """Express amounts in today's money, deflating by an annual rate in percent."""
+    annual_rate: float
+
+
+@dataclass(frozen=True)
+class CurrencyConversion:
+    """Convert amounts with ``rate`` units of ``currency`` per unit of the source."""
+    rate: float
+    currency: str
+
+
+@dataclass(frozen=True)
+class Rounding:
+    """Round every output to a number of decimals."""
+    decimals: int = 2
+    mode: str = HALF_UP
+
+
+Stage = Union[WithholdingTax, Inflation, CurrencyConversion, Rounding]
+_STAGE_ORDER = (WithholdingTax, Inflation, CurrencyConversion, Rounding)
+
+OUTPUTS = ('tax', 'net_interest', 'final_amount')
+
+
+@dataclass(frozen=True)
+class CompiledPipeline:
+    """Stages folded into the coefficients of the fused evaluation."""
+    kept_share: float        # share of interest left after all taxes
+    log_deflator: float      # log of the yearly deflator; 0 without inflation
+    fx_rate: float
+    currency: Optional[str]
+    rounding: Optional[Rounding]
+
+
+class Pipeline:
+    """An ordered list of post-processing stages."""
+
+    def __init__(self, stages: Sequence[Stage] = ()):
+        """
+        Raises:
+            ValueError: If the stages are out of order or have invalid values
+        """
+        order = [_STAGE_ORDER.index(type(stage)) for stage in stages]
+        if order != sorted(order):
+            raise ValueError("Stages must follow the order tax -> inflation -> currency -> rounding")
+        if sum(isinstance(stage, Rounding) for stage in stages) > 1:
+            raise ValueError("Only one rounding stage is allowed")
+        self.stages = list(stages)
+        self.compiled = self._compile()
+
+    def _compile(self) -> CompiledPipeline:
+        kept_share, log_deflator, fx_rate, currency, rounding = 1.0, 0.0, 1.0, None, None
+        for stage in self.stages:
+            if isinstance(stage, WithholdingTax):
+                if not 0 <= stage.rate <= 100:
+                    raise ValueError("Tax rate must be between 0 and 100 %")
+                kept_share *= 1 - stage.rate / 100
+            elif isinstance(stage, Inflation):
+                if stage.annual_rate <= -100:
+                    raise ValueError("Inflation must be greater than -100 %")
+                log_deflator -= math.log1p(stage.annual_rate / 100)
+            elif isinstance(stage, CurrencyConversion):
+                if stage.rate <= 0:
+                    raise ValueError("Exchange rate must be positive")
+                fx_rate *= stage.rate
+                currency = stage.currency
+            else:
+                if stage.mode not in ROUNDING_MODES:
+                    raise ValueError(f"Unknown rounding mode: {stage.mode}")
+                rounding = stage
+        return CompiledPipeline(kept_share, log_deflator, fx_rate, currency, rounding)
+
+    def allocate(self, size: int) -> Dict[str, np.ndarray]:
+        """Output buffers (plus scratch space) for chunks of up to ``size`` rows."""
+        buffers = {name: np.empty(size) for name in OUTPUTS + ('_scale',)}
+        if self.compiled.rounding is not None:
+            # Tie tolerance and tie mask of the rounding stage
+            buffers['_tolerance'] = np.empty(size)
+            buffers['_tie'] = np.empty(size, dtype=bool)
+        return buffers
+
+    def evaluate(self, principal: np.ndarray, interest: np.ndarray, months: np.ndarray,
+                 buffers: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+        """
+        Run every stage over one chunk in a single fused pass.
+
+        Args:
+            principal: Principal per row
+            interest: Raw (gross) interest per row
+            months: Duration per row, for the inflation stage
+            buffers: Reusable buffers from allocate(); allocated if omitted
+
+        Returns:
+            Views of the buffers holding 'tax', 'net_interest' and 'final_amount'
+        """
+        plan = self.compiled
+        principal = np.asarray(principal, dtype=float)
+        interest = np.asarray(interest, dtype=float)
+        size = interest.shape[0] if interest.ndim else 1
+        if buffers is None or buffers['tax'].shape[0] < size:
+            buffers = self.allocate(size)
+        tax, net, final, scale = (buffers[name][:size] for name in OUTPUTS + ('_scale',))
+
+        # scale = fx * deflator(months): the factor every output is multiplied by
+        if plan.log_deflator:
+            np.multiply(months, plan.log_deflator / 12, out=scale)
+            np.exp(scale, out=scale)
+            scale *= plan.fx_rate
+        else:
+            scale.fill(plan.fx_rate)
+
+        np.multiply(interest, 1 - plan.kept_share, out=tax)
+        tax *= scale
+        np.multiply(interest, plan.kept_share, out=net)
+        net *= scale
+        np.multiply(principal, scale, out=final)
+        final += net
+
+        if plan.rounding is not None:
+            # scale is no longer needed, so it doubles as rounding scratch space
+            tolerance, tie = buffers['_tolerance'][:size], buffers['_tie'][:size]
+            for array in (tax, net, final):
+                _round_in_place(array, plan.rounding, scale, tolerance, tie)
+        return {'tax': tax, 'net_interest': net, 'final_amount': final}
+
+
+def _round_in_place(values: np.ndarray, rounding: Rounding, scratch: np.ndarray,
+                    tolerance: np.ndarray, tie: np.ndarray) -> None:
+    factor = 10.0 ** rounding.decimals
+    values *= factor
+    # Values within float noise of a midpoint (1.005 -> 100.49999999999999) are
+    # moved onto it, so ties round as fixed_point.to_fixed rounds them
+    np.floor(values, out=scratch)
+    scratch += 0.5
+    np.subtract(values, scratch, out=scratch)
+    np.abs(scratch, out=scratch)
+    np.abs(values, out=tolerance)
+    np.maximum(tolerance, 1.0, out=tolerance)
+    np.multiply(tolerance, TIE_TOLERANCE, out=tolerance)
+    np.less_equal(scratch, tolerance, out=tie)
+    np.floor(values, out=values, where=tie)
+    np.add(values, 0.5, out=values, where=tie)
+    if rounding.mode == HALF_EVEN:
+        np.rint(values, out=values)
+    else:
+        # Half away from zero: trunc(x + copysign(0.5, x))
+        np.copysign(0.5, values, out=scratch)
+        values += scratch
+        np.trunc(values, out=values)
+    values /= factor
+
+
+def build_pipeline(tax: float = 0.0, inflation: float = 0.0, fx_rate: float = 1.0,
+                   currency: Optional[str] = None, decimals: Optional[int] = 2,
+                   rounding: str = HALF_UP) -> Pipeline:
+    """Pipeline with only the stages whose settings differ from the neutral value."""
+    stages: List[Stage] = []
+    if tax:
+        stages.append(WithholdingTax(tax))
+    if inflation:
+        stages.append(Inflation(inflation))
+    if fx_rate != 1.0 or currency:
+        stages.append(CurrencyConversion(fx_rate, currency or ""))
+    if decimals is not None:
+        stages.append(Rounding(decimals, rounding))
+    return Pipeline(stages)
+
+
+def _read_chunks(path: str, chunk_size: int) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Yield (principal, annual_rate, months) arrays from a CSV file."""
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        rows: List[Tuple[str, str, str]] = []
+        for row in reader:
+            rows.append((row['principal'], row['annual_rate'], row['months']))
+            if len(rows) == chunk_size:
+                yield tuple(np.array(column, dtype=float) for column in zip(*rows))
+                rows = []
+        if rows:
+            yield tuple(np.array(column, dtype=float) for column in zip(*rows))
+
+
+def run_batch(pipeline: Pipeline, input_path: str, output_path: str, chunk_size: int = 65536) -> int:
+    """
+    Calculate simple interest for every CSV row and post-process it.
+
+    Returns:
+        Number of rows written
+    """
+    buffers = pipeline.allocate(chunk_size)
+    interest = np.empty(chunk_size)
+    decimals = pipeline.compiled.rounding.decimals if pipeline.compiled.rounding else 6
+    written = 0
+    with open(output_path, 'w', newline='', encoding='utf-8') as out:
+        out.write("gross_interest," + ",".join(OUTPUTS) + "\n")
+        for principal, annual_rate, months in _read_chunks(input_path, chunk_size):
+            gross = interest[:principal.shape[0]]
+            np.multiply(principal, annual_rate, out=gross)
+            gross *= months
+            gross /= 1200
+            results = pipeline.evaluate(principal, gross, months, buffers)
+            write_csv(out, [gross] + [results[name] for name in OUTPUTS], [True] * (len(OUTPUTS) + 1), decimals)
+            written += principal.shape[0]
+    return written
+
+
+def main() -> None:
+    """Command-line entry point: post-process a CSV of accounts."""
+    parser = argparse.ArgumentParser(description="Tax, inflation, currency and rounding for interest results.")
+    parser.add_argument('input', help="CSV with principal, annual_rate and months columns")
+    parser.add_argument('output', help="CSV to write")
+    parser.add_argument('--tax', type=float, default=0.0, help="withholding tax on interest, percent")
+    parser.add_argument('--inflation', type=float, default=0.0, help="annual inflation, percent")
+    parser.add_argument('--fx', type=float, default=1.0, help="exchange rate to the target currency")
+    parser.add_argument('--currency', default=None, help="target currency code")
+    parser.add_argument('--decimals', type=int, default=2, help="decimals to round to")
+    parser.add_argument('--rounding', choices=ROUNDING_MODES, default=HALF_UP)
+    parser.add_argument('--chunk-size', type=int, default=65536)
+    args = parser.parse_args()
+
+    pipeline = build_pipeline(args.tax, args.inflation, args.fx, args.currency, args.decimals, args.rounding)
+    rows = run_batch(pipeline, args.input, args.output, args.chunk_size)
+    print(f"Wrote {rows} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Piecewise variable-rate schedules with O(1) balance queries.
+
+A RateSchedule covers a horizon of whole months, each with its own annual
+rate (compounded monthly). On construction it precomputes two prefix
+arrays over the horizon:
+
+    growth[k]   = (1 + r_1) * ... * (1 + r_k)        (growth[0] = 1)
+    discount[k] = 1 / growth[1] + ... + 1 / growth[k] (discount[0] = 0)
+
+With deposits of a fixed amount at the end of every month, the balance
+after month k is growth[k] * (principal + deposit * discount[k]), so
+balances, interest between two months and required savings are a few array
+lookups per query. All query methods accept NumPy arrays of months for
+batches.
+"""
+
+from typing import Iterable, List, Tuple, Union
+
+import numpy as np
+
+
+MonthLike = Union[int, np.ndarray]
+
+
+def parse_rate_changes(text: str) -> List[Tuple[int, float]]:
+    """
+    Parse rate changes written as "month:rate" pairs, e.g. "13: 4.5, 25: 5".
+
+    Each pair sets the annual rate (in percent) from that month onwards;
+    months are 1-based. Pairs may be separated by commas or semicolons.
+
+    Raises:
+        ValueError: If a pair is malformed
+    """
+    changes = []
+    for item in text.replace(';', ',').split(','):
+        if not item.strip():
+            continue
+        month, separator, rate = item.partition(':')
+        if not separator:
+            raise ValueError(f"Rate change '{item.strip()}' must look like month:rate")
+        try:
+            changes.append((int(month), float(rate)))
+        except ValueError:
+            raise ValueError(f"Rate change '{item.strip()}' must look like month:rate") from None
+    return changes
+
+
+class RateSchedule:
+    """Monthly rates over a fixed horizon with cumulative growth prefix arrays."""
+
+    def __init__(self, monthly_rates: Iterable[float]):
+        """
+        Args:
+            monthly_rates: Rate for each month as a decimal per month
+                (e.g. 0.05 / 12 for 5% a year)
+
+        Raises:
+            ValueError: If the schedule is empty or a rate is -100% or less
+        """
+        self.monthly_rates = np.asarray(list(monthly_rates), dtype=float)
+        if self.monthly_rates.size == 0:
+            raise ValueError("A rate schedule needs at least one month")
+        if np.any(self.monthly_rates <= -1):
+            raise ValueError("Monthly rates must be greater than -100%")
+
+        # Summing log1p keeps the product accurate over long horizons
+        log_growth = np.concatenate(([0.0], np.cumsum(np.log1p(self.monthly_rates))))
+        self.growth = np.exp(log_growth)
+        self.discount = np.concatenate(([0.0], np.cumsum(np.exp(-log_growth[1:]))))
+
+    @classmethod
+    def from_annual_rates(cls, base_rate: float, months: int,
+                          changes: Iterable[Tuple[int, float]] = ()) -> 'RateSchedule':
+        """
+        Build a schedule from a starting annual rate and later changes.
+
+        Args:
+            base_rate: Annual rate in percent from month 1
+            months: Horizon in months
+            changes: (month, annual rate in percent) pairs; each rate applies
+                from that month (1-based) until the next change
+
+        Raises:
+            ValueError: If the horizon is not positive or a change is outside it
+        """
+        if months <= 0:
+            raise ValueError("Duration must be positive")
+        annual = np.full(months, float(base_rate))
+        for month, rate in sorted(changes):
+            if not 1 <= month <= months:
+                raise ValueError(f"Rate change at month {month} is outside the {months}-month duration")
+            annual[month - 1:] = rate
+        return cls(annual / 100 / 12)
+
+    @property
+    def months(self) -> int:
+        return self.monthly_rates.size
+
+    def _check_months(self, *months: MonthLike) -> None:
+        for month in months:
+            month = np.asarray(month)
+            if np.any(month < 0) or np.any(month > self.months):
+                raise ValueError(f"Months must lie between 0 and {self.months}")
+
+    def growth_between(self, start: MonthLike, end: MonthLike) -> Union[float, np.ndarray]:
+        """Factor by which a balance grows from the end of month ``start`` to the end of month ``end``."""
+        self._check_months(start, end)
+        return self.growth[end] / self.growth[start]
+
+    def balance(self, month: MonthLike, principal: float = 0.0,
+                monthly_deposit: float = 0.0) -> Union[float, np.ndarray]:
+        """
+        Balance at the end of ``month`` (0 = start).
+
+        Args:
+            month: Month index or array of indices
+            principal: Amount invested at the start
+            monthly_deposit: Amount deposited at the end of every month
+        """
+        self._check_months(month)
+        return self.growth[month] * (principal + monthly_deposit * self.discount[month])
+
+    def interest_between(self, start: MonthLike, end: MonthLike, principal: float = 0.0,
+                         monthly_deposit: float = 0.0) -> Union[float, np.ndarray]:
+        """Interest earned from the end of month ``start`` to the end of month ``end``."""
+        self._check_months(start, end)
+        deposits = monthly_deposit * (np.asarray(end) - np.asarray(start))
+        return (self.balance(end, principal, monthly_deposit)
+                - self.balance(start, principal, monthly_deposit) - deposits)
+
+    def required_deposit(self, target: Union[float, np.ndarray], month: MonthLike = None,
+                         principal: float = 0.0) -> Union[float, np.ndarray]:
+        """
+        Monthly deposit needed to reach ``target`` at the end of ``month``.
+
+        Args:
+            target: Target amount(s)
+            month: Month index or array of indices (default: the whole horizon)
+            principal: Amount invested at the start
+
+        Raises:
+            ValueError: If ``month`` is 0, where no deposit can be made
+        """
+        month = self.months if month is None else month
+        self._check_months(month)
+        if np.any(np.asarray(month) == 0):
+            raise ValueError("Required deposits need at least one month")
+        return (target / self.growth[month] - principal) / self.discount[month]
@@ -0,0 +1,229 @@
+"""
+Parameter sweeps of the monthly savings calculation over shared memory.
+
+A sweep evaluates ClaudeENG's calculate_monthly_savings (target / annuity
+factor of the monthly rate) for every combination of targets, annual rates
+and horizons. Spreading such a sweep over a process pool the usual way
+pickles every input slice to a worker and every result slice back, which
+for a cheap kernel costs more than the arithmetic.
+
+SharedSweep instead keeps one multiprocessing.shared_memory block holding
+the input columns and the output column side by side. The sweep is written
+straight into it, the workers attach to the block once and each computes
+a disjoint slice in place; the only messages are (block name, rows, start,
+stop) tuples. Rows calculate_monthly_savings would reject (target <= 0,
+negative rate, horizon <= 0) come out as NaN.
+
+Usage:
+    python savings_sweep.py
+    python savings_sweep.py --size 20000000 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from compounding import annuity_factor
+
+
+# Input columns followed by the output column in each shared block
+TARGET, RATE, MONTHS, OUTPUT = range(4)
+COLUMNS = 4
+
+# Slices per worker, so a worker that finishes early picks up more
+SLICES_PER_WORKER = 4
+
+
+def savings_kernel(target: np.ndarray, annual_rate: np.ndarray, months: np.ndarray,
+                   out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Vectorized calculate_monthly_savings: monthly deposit reaching ``target``.
+
+    Args:
+        target: Desired final amounts
+        annual_rate: Annual interest rates as percentages
+        months: Durations in months
+        out: Array to write the result into
+
+    Returns:
+        Required monthly deposits; NaN for invalid rows
+    """
+    factor = annuity_factor(annual_rate / 1200, months)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # months <= 0 gives a zero factor; those rows are set to NaN below
+        out = np.divide(target, factor, out=out)
+    out[(target <= 0) | (annual_rate < 0) | (months <= 0)] = np.nan
+    return out
+
+
+# Blocks the current worker process has attached to, by name
+_ATTACHED: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _compute_slice(task: Tuple[str, int, int, int]) -> None:
+    name, rows, start, stop = task
+    block = _ATTACHED.get(name)
+    if block is None:
+        for old in _ATTACHED.values():
+            old.close()
+        _ATTACHED.clear()
+        block = _ATTACHED[name] = shared_memory.SharedMemory(name=name)
+    table = np.ndarray((COLUMNS, rows), dtype=np.float64, buffer=block.buf)
+    savings_kernel(table[TARGET, start:stop], table[RATE, start:stop], table[MONTHS, start:stop],
+                   out=table[OUTPUT, start:stop])
+    del table
+
+
+class SharedSweep:
+    """Process pool computing sweeps in a shared-memory table."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or multiprocessing.cpu_count()
+        # Workers must share this process's tracker; one of their own would
+        # unlink the block when the worker exits
+        resource_tracker.ensure_running()
+        self._pool = multiprocessing.Pool(self.workers)
+        self._block: Optional[shared_memory.SharedMemory] = None
+        self._rows = 0
+
+    def table(self, rows: int) -> np.ndarray:
+        """
+        The (4, rows) shared table for the next run: target, rate and months
+        rows to fill, and the output row. Reused while large enough.
+        """
+        if self._block is None or self._block.size < COLUMNS * rows * 8:
+            self._release()
+            self._block = shared_memory.SharedMemory(create=True, size=max(COLUMNS * rows * 8, 1))
+        self._rows = rows
+        return np.ndarray((COLUMNS, rows), dtype=np.float64, buffer=self._block.buf)
+
+    def run(self, rows: int) -> np.ndarray:
+        """
+        Compute the output row of a table filled through table(rows).
+
+        Returns:
+            View of the output row; valid until the next table() call
+        """
+        if self._block is None or rows != self._rows:
+            raise ValueError("Fill the table with table(rows) before running it")
+        slices = self.workers * SLICES_PER_WORKER
+        bounds = np.linspace(0, rows, slices + 1).astype(int).tolist()
+        tasks = [(self._block.name, rows, start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+        self._pool.map(_compute_slice, tasks, chunksize=1)
+        return np.ndarray((COLUMNS, rows), dtype=np.float64, buffer=self._block.buf)[OUTPUT]
+
+    def calculate(self, target: Sequence[float], annual_rate: Sequence[float], months: Sequence[float]) -> np.ndarray:
+        """Monthly savings for rows of equal-length columns, returned as a new array."""
+        rows = len(target)
+        table = self.table(rows)
+        table[TARGET], table[RATE], table[MONTHS] = target, annual_rate, months
+        return self.run(rows).copy()
+
+    def sweep(self, targets: Sequence[float], rates: Sequence[float], horizons: Sequence[float]) -> np.ndarray:
+        """
+        Monthly savings for every combination, written into shared memory by broadcasting.
+
+        Returns:
+            Array of shape (len(targets), len(rates), len(horizons))
+        """
+        shape = (len(targets), len(rates), len(horizons))
+        rows = int(np.prod(shape))
+        table = self.table(rows)
+        table[TARGET].reshape(shape)[...] = np.asarray(targets, dtype=float)[:, None, None]
+        table[RATE].reshape(shape)[...] = np.asarray(rates, dtype=float)[None, :, None]
+        table[MONTHS].reshape(shape)[...] = np.asarray(horizons, dtype=float)[None, None, :]
+        return self.run(rows).reshape(shape).copy()
+
+    def _release(self) -> None:
+        if self._block is not None:
+            self._block.close()
+            self._block.unlink()
+            self._block = None
+
+    def close(self) -> None:
+        self._pool.close()
+        self._pool.join()
+        self._release()
+
+    def __enter__(self) -> 'SharedSweep':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _pickled_slice(columns: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+    return savings_kernel(*columns)
+
+
+def pickling_sweep(pool, target: np.ndarray, annual_rate: np.ndarray, months: np.ndarray,
+                   workers: int) -> np.ndarray:
+    """The conventional pool.map version: input slices and results travel by pickle."""
+    bounds = np.linspace(0, len(target), workers * SLICES_PER_WORKER + 1).astype(int).tolist()
+    parts = [(target[a:b], annual_rate[a:b], months[a:b]) for a, b in zip(bounds, bounds[1:])]
+    return np.concatenate(pool.map(_pickled_slice, parts, chunksize=1))
+
+
+def _best_time(function, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(size: int, workers: int, repeat: int = 3) -> List[Tuple[str, float]]:
+    """
+    Time one sweep of ``size`` rows single-process, with a pickling pool and with SharedSweep.
+
+    Returns:
+        Rows of (method, seconds)
+
+    Raises:
+        AssertionError: If the pooled results differ from the single-process ones
+    """
+    targets = np.linspace(1_000, 1_000_000, 100)
+    rates = np.linspace(0, 12, 121)
+    horizons = np.arange(1, max(2, size // (len(targets) * len(rates))) + 1, dtype=float)
+    grid = np.meshgrid(targets, rates, horizons, indexing='ij')
+    target, annual_rate, months = (np.ascontiguousarray(axis).ravel() for axis in grid)
+    expected = savings_kernel(target, annual_rate, months)
+
+    rows = [('single process', _best_time(lambda: savings_kernel(target, annual_rate, months), repeat))]
+    with multiprocessing.Pool(workers) as pool:
+        pickling_sweep(pool, target[:workers], annual_rate[:workers], months[:workers], workers)   # warm up
+        result = pickling_sweep(pool, target, annual_rate, months, workers)
+        assert np.array_equal(result, expected, equal_nan=True)
+        rows.append(('pickling pool', _best_time(
+            lambda: pickling_sweep(pool, target, annual_rate, months, workers), repeat)))
+    with SharedSweep(workers) as executor:
+        result = executor.sweep(targets, rates, horizons).ravel()
+        assert np.array_equal(result, expected, equal_nan=True)
+        rows.append(('shared memory', _best_time(lambda: executor.sweep(targets, rates, horizons), repeat)))
+        executor.table(len(target))
+        rows.append(('shared, compute only', _best_time(lambda: executor.run(len(target)), repeat)))
+    return rows
+
+
+def main() -> None:
+    """Command-line entry point: compare the sweep executors."""
+    parser = argparse.ArgumentParser(description="Shared-memory vs pickling pool for savings sweeps.")
+    parser.add_argument('--size', type=int, default=5_000_000, help="approximate rows in the sweep")
+    parser.add_argument('--workers', type=int, default=multiprocessing.cpu_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    timings = benchmark(args.size, args.workers, args.repeat)
+    baseline = timings[0][1]
+    print(f"{'method':<22}{'seconds':>10}{'vs single':>11}")
+    for method, seconds in timings:
+        print(f"{method:<22}{seconds:>10.3f}{baseline / seconds:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Static metrics for comparing the generated calculator scripts.
+
+Each script is parsed with ``ast`` in a worker process and measured per file
+and per function: cyclomatic complexity, widgets created, callbacks bound and
+the arithmetic operations on the calculation path. Results are cached under
+the file's SHA-256, so after editing one script only that script is parsed
+again.
+
+Usage:
+    python script_metrics.py
+    python script_metrics.py --functions
+    python script_metrics.py ClaudeENG.py ClaudeCro.py --json
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from file_cache import JsonCache, file_hash
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CALCULATOR_SCRIPTS = [
+    "ChatGptENG.py", "ChatGptCro.py",
+    "ClaudeENG.py", "ClaudeCro.py",
+    "CopilotENG.py", "CopilotCro.py",
+    "DeepSeekENG.py", "DeepSeekCro.py",
+    "GeminiENG.py", "GeminiCro.py",
+    "MetaAIENG.py",
+    "PerplexityENG.py", "PerplexityCro.py",
+]
+
+# Bumped whenever a metric definition changes, to invalidate the cache
+METRICS_VERSION = 1
+
+WIDGET_CLASSES = {
+    'Tk', 'Toplevel', 'Frame', 'LabelFrame', 'Label', 'Entry', 'Button', 'Canvas',
+    'Scrollbar', 'Separator', 'Scale', 'Spinbox', 'Combobox', 'Checkbutton',
+    'Radiobutton', 'Listbox', 'Text', 'Treeview', 'Notebook', 'Progressbar', 'Message',
+}
+CALLBACK_KEYWORDS = {'command', 'validatecommand', 'xscrollcommand', 'yscrollcommand'}
+CALLBACK_METHODS = {'bind', 'bind_all', 'bind_class', 'trace', 'trace_add', 'register', 'after'}
+
+# Functions whose names match this are on the calculation path
+CALCULATION_NAME_RE = re.compile(r'calc|izracun|racun|kamat|interest|savings', re.IGNORECASE)
+
+_DECISION_NODES = (ast.If, ast.IfExp, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler,
+                   ast.With, ast.AsyncWith, ast.Assert, ast.comprehension)
+_ARITHMETIC_OPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow)
+
+
+@dataclass
+class FunctionMetrics:
+    """Metrics of a single function or method."""
+    name: str
+    line: int
+    complexity: int
+    arithmetic_ops: int
+    on_calculation_path: bool
+
+
+@dataclass
+class ScriptMetrics:
+    """Metrics of a single script."""
+    script: str
+    lines: int
+    classes: int
+    functions: int
+    max_complexity: int
+    total_complexity: int
+    widgets: int
+    callbacks: int
+    calculation_ops: int
+    function_metrics: List[FunctionMetrics] = field(default_factory=list)
+
+
+def _complexity(node: ast.AST) -> int:
+    """McCabe complexity: one plus every branch point inside the function body."""
+    score = 1
+    for child in ast.walk(node):
+        if isinstance(child, _DECISION_NODES):
+            score += 1
+        elif isinstance(child, ast.BoolOp):
+            score += len(child.values) - 1
+        elif isinstance(child, ast.Try):
+            score += bool(child.orelse)
+    return score
+
+
+def _arithmetic_ops(node: ast.AST) -> int:
+    count = 0
+    for child in ast.walk(node):
+        if isinstance(child, (ast.BinOp, ast.AugAssign)) and isinstance(child.op, _ARITHMETIC_OPS):
+            count += 1
+    return count
+
+
+def _called_name(call: ast.Call) -> Optional[str]:
+    func = call.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return None
+
+
+def analyze_script(path: str) -> dict:
+    """Parse one script and return its metrics as a plain dict (runs in a worker)."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source, filename=path)
+
+    widgets = callbacks = 0
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = _called_name(node)
+        if name in WIDGET_CLASSES:
+            widgets += 1
+        if isinstance(node.func, ast.Attribute) and name in CALLBACK_METHODS:
+            callbacks += 1
+        callbacks += sum(1 for keyword in node.keywords if keyword.arg in CALLBACK_KEYWORDS)
+
+    functions: List[FunctionMetrics] = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            functions.append(FunctionMetrics(
+                name=node.name,
+                line=node.lineno,
+                complexity=_complexity(node),
+                arithmetic_ops=_arithmetic_ops(node),
+                on_calculation_path=bool(CALCULATION_NAME_RE.search(node.name)),
+            ))
+    functions.sort(key=lambda item: item.line)
+
+    complexities = [item.complexity for item in functions] or [0]
+    metrics = ScriptMetrics(
+        script=os.path.basename(path),
+        lines=len(source.splitlines()),
+        classes=sum(isinstance(node, ast.ClassDef) for node in ast.walk(tree)),
+        functions=len(functions),
+        max_complexity=max(complexities),
+        total_complexity=sum(complexities),
+        widgets=widgets,
+        callbacks=callbacks,
+        calculation_ops=sum(item.arithmetic_ops for item in functions if item.on_calculation_path),
+        function_metrics=functions,
+    )
+    return asdict(metrics)
+
+
+def collect_metrics(paths: List[str], workers: Optional[int] = None,
+                    cache: Optional[JsonCache] = None) -> Tuple[List[dict], List[str]]:
+    """
+    Return metrics for all scripts, analyzing only those not in the cache.
+
+    Returns:
+        (metrics in input order, names of the scripts that were re-analyzed)
+    """
+    cache = cache or JsonCache('script_metrics')
+    keys = {path: f"v{METRICS_VERSION}-{file_hash(path)}" for path in paths}
+    results: Dict[str, dict] = {}
+    for path in paths:
+        cached = cache.get(keys[path])
+        if cached is not None:
+            results[path] = cached
+
+    pending = [path for path in paths if path not in results]
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for path, metrics in zip(pending, pool.map(analyze_script, pending)):
+                cache.put(keys[path], metrics)
+                results[path] = metrics
+    return [results[path] for path in paths], [os.path.basename(path) for path in pending]
+
+
+def format_table(rows: List[List[str]], headers: List[str]) -> str:
+    """Render rows as a plain-text table with right-aligned numeric columns."""
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows)]
+    lines = ["  ".join(header.ljust(width) for header, width in zip(headers, widths))]
+    lines.append("  ".join("-" * width for width in widths))
+    for row in rows:
+        lines.append("  ".join(
+            str(cell).rjust(width) if isinstance(cell, (int, float)) else str(cell).ljust(width)
+            for cell, width in zip(row, widths)
+        ))
+    return "\n".join(lines)
+
+
+def comparison_table(metrics: List[dict], functions: bool = False) -> str:
+    """Build the cross-script comparison table (or the per-function table)."""
+    if functions:
+        headers = ["script", "function", "line", "complexity", "arith ops", "calc path"]
+        rows = [
+            [item['script'], fn['name'], fn['line'], fn['complexity'], fn['arithmetic_ops'],
+             "yes" if fn['on_calculation_path'] else ""]
+            for item in metrics for fn in item['function_metrics']
+        ]
+        return format_table(rows, headers)
+
+    headers = ["script", "lines", "classes", "functions", "max CC", "total CC",
+               "widgets", "callbacks", "calc ops"]
+    rows = [
+        [item['script'], item['lines'], item['classes'], item['functions'], item['max_complexity'],
+         item['total_complexity'], item['widgets'], item['callbacks'], item['calculation_ops']]
+        for item in metrics
+    ]
+    return format_table(rows, headers)
+
+
+def main() -> None:
+    """Command-line entry point: print the comparison table."""
+    parser = argparse.ArgumentParser(description="Compare static metrics of the calculator scripts.")
+    parser.add_argument('scripts', nargs='*', help="scripts to analyze (default: all 13 calculators)")
+    parser.add_argument('--functions', action='store_true', help="show the per-function table")
+    parser.add_argument('--json', action='store_true', help="print raw metrics as JSON")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    paths = [os.path.join(SCRIPT_DIR, name) for name in (args.scripts or CALCULATOR_SCRIPTS)]
+    metrics, analyzed = collect_metrics(paths, args.workers)
+
+    if args.json:
+        print(json.dumps(metrics, indent=2, ensure_ascii=False))
+        return
+    print(comparison_table(metrics, args.functions))
+    print(f"\nRe-analyzed: {', '.join(analyzed) if analyzed else 'none (all cached)'}")
+
+
+if __name__ == "__main__":
+    main()
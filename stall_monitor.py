@@ -0,0 +1,202 @@
+"""
+Event-loop stall monitor and debug overlay for the Tk apps.
+
+A heartbeat is scheduled with root.after every interval_ms. How late each
+beat runs is the time the event loop could not react to the user; its
+distribution (p50/p99) is the app's frame latency. Every Python callback
+Tk invokes (button commands, bindings, after() callbacks) goes through
+tkinter.CallWrapper, which the monitor wraps to time each callback. When a
+beat is late by more than stall_ms, the stall is attributed to the longest
+callback that ran since the previous beat.
+
+The overlay is a small label in the top right corner of the window showing
+the latencies and the worst callbacks; F12 toggles it.
+
+Usage:
+    monitor = StallMonitor(root)        # or attach_if_enabled(root) in main()
+    monitor.report()
+
+    STALL_MONITOR=1 python ClaudeENG.py
+"""
+
+import os
+import statistics
+import time
+import tkinter as tk
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+
+# Heartbeat period; about one frame at 60 Hz
+DEFAULT_INTERVAL_MS = 16
+
+# A beat later than this counts as a stall
+DEFAULT_STALL_MS = 100
+
+# Beats kept for the latency percentiles
+WINDOW = 1000
+
+# Overlay refresh period
+OVERLAY_REFRESH_MS = 500
+
+OVERLAY_KEY = '<F12>'
+
+
+@dataclass
+class CallbackStats:
+    """Timing of one callback, by name."""
+    calls: int = 0
+    total_ms: float = 0.0
+    worst_ms: float = 0.0
+    stalls: int = 0
+
+
+def callback_name(func: Callable) -> str:
+    """Readable name of a Tk callback; after() callbacks are unwrapped to the scheduled function."""
+    code = getattr(func, '__code__', None)
+    if code is not None and func.__closure__ and 'func' in code.co_freevars:
+        # tkinter.Misc.after wraps the function in a 'callit' closure
+        inner = func.__closure__[code.co_freevars.index('func')].cell_contents
+        if callable(inner):
+            func = inner
+    owner = getattr(func, '__self__', None)
+    name = getattr(func, '__qualname__', None) or getattr(func, '__name__', None) or repr(func)
+    if owner is not None and '.' not in name:
+        name = f"{type(owner).__qualname__}.{name}"
+    return name
+
+
+class StallMonitor:
+    """Heartbeat-based latency measurement with per-callback attribution."""
+
+    _active: Optional['StallMonitor'] = None
+
+    def __init__(self, root: tk.Misc, interval_ms: int = DEFAULT_INTERVAL_MS, stall_ms: float = DEFAULT_STALL_MS):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.stall_ms = stall_ms
+        self.latencies: Deque[float] = deque(maxlen=WINDOW)
+        self.callbacks: Dict[str, CallbackStats] = {}
+        self.stalls: List[Tuple[float, str, float]] = []     # (late ms, callback, callback ms)
+        self._longest: Tuple[float, str] = (0.0, "")
+        self._expected = 0.0
+        self._beat_id: Optional[str] = None
+        self._overlay: Optional[tk.Label] = None
+        self._overlay_shown = False
+        self._overlay_id: Optional[str] = None
+        self._original_call: Optional[Callable] = None
+        self.start()
+
+    def start(self) -> None:
+        """Wrap Tk callbacks and start the heartbeat; replaces any other active monitor."""
+        if StallMonitor._active is not None:
+            StallMonitor._active.stop()
+        StallMonitor._active = self
+        self._original_call = original = tk.CallWrapper.__call__
+        monitor = self
+
+        def timed_call(wrapper, *args):
+            start = time.perf_counter()
+            try:
+                return original(wrapper, *args)
+            finally:
+                monitor._record(wrapper.func, (time.perf_counter() - start) * 1000)
+
+        tk.CallWrapper.__call__ = timed_call
+        self.root.bind_all(OVERLAY_KEY, lambda event: self.toggle_overlay(), add='+')
+        self._schedule()
+
+    def stop(self) -> None:
+        """Restore Tk callbacks and cancel the heartbeat and overlay."""
+        if self._original_call is not None:
+            tk.CallWrapper.__call__ = self._original_call
+            self._original_call = None
+        for after_id in (self._beat_id, self._overlay_id):
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+        self._beat_id = self._overlay_id = None
+        if StallMonitor._active is self:
+            StallMonitor._active = None
+
+    def _schedule(self) -> None:
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._beat_id = self.root.after(self.interval_ms, self._beat)
+
+    def _beat(self) -> None:
+        late_ms = max(0.0, (time.perf_counter() - self._expected) * 1000)
+        self.latencies.append(late_ms)
+        if late_ms > self.stall_ms:
+            callback_ms, name = self._longest
+            name = name or "(outside Python callbacks)"
+            self.stalls.append((late_ms, name, callback_ms))
+            if name in self.callbacks:
+                self.callbacks[name].stalls += 1
+        self._longest = (0.0, "")
+        self._schedule()
+
+    def _record(self, func: Callable, elapsed_ms: float) -> None:
+        name = callback_name(func)
+        if name.startswith('StallMonitor.'):
+            return
+        stats = self.callbacks.get(name)
+        if stats is None:
+            stats = self.callbacks[name] = CallbackStats()
+        stats.calls += 1
+        stats.total_ms += elapsed_ms
+        stats.worst_ms = max(stats.worst_ms, elapsed_ms)
+        if elapsed_ms > self._longest[0]:
+            self._longest = (elapsed_ms, name)
+
+    def percentiles(self) -> Tuple[float, float]:
+        """(p50, p99) heartbeat lateness in milliseconds over the recent window."""
+        if len(self.latencies) < 2:
+            value = self.latencies[0] if self.latencies else 0.0
+            return value, value
+        cuts = statistics.quantiles(self.latencies, n=100, method='inclusive')
+        return cuts[49], cuts[98]
+
+    def worst_callbacks(self, count: int = 5) -> List[Tuple[str, CallbackStats]]:
+        """Callbacks with the longest single run, worst first."""
+        return sorted(self.callbacks.items(), key=lambda item: item[1].worst_ms, reverse=True)[:count]
+
+    def report(self) -> str:
+        """Readable summary of latency, stalls and the worst callbacks."""
+        p50, p99 = self.percentiles()
+        lines = [f"frame latency p50 {p50:.1f} ms, p99 {p99:.1f} ms, {len(self.stalls)} stalls > {self.stall_ms:g} ms"]
+        for name, stats in self.worst_callbacks():
+            lines.append(f"  {name}: worst {stats.worst_ms:.1f} ms, mean {stats.total_ms / stats.calls:.2f} ms, "
+                         f"{stats.calls} calls, {stats.stalls} stalls")
+        return "\n".join(lines)
+
+    def toggle_overlay(self) -> None:
+        """Show or hide the debug overlay."""
+        self._overlay_shown = not self._overlay_shown
+        if not self._overlay_shown:
+            self._overlay.place_forget()
+            if self._overlay_id is not None:
+                self.root.after_cancel(self._overlay_id)
+                self._overlay_id = None
+            return
+        if self._overlay is None:
+            self._overlay = tk.Label(self.root, justify='left', anchor='nw', bg='#202020', fg='#9cff9c',
+                                     font=('Courier', 9), padx=6, pady=4)
+        self._overlay.place(relx=1.0, rely=0.0, anchor='ne')
+        self._overlay.lift()
+        self._refresh_overlay()
+
+    def _refresh_overlay(self) -> None:
+        self._overlay.config(text=self.report())
+        self._overlay_id = self.root.after(OVERLAY_REFRESH_MS, self._refresh_overlay)
+
+
+def attach_if_enabled(root: tk.Misc) -> Optional[StallMonitor]:
+    """Start a monitor when the STALL_MONITOR environment variable is set; a value above 1 sets stall_ms."""
+    setting = os.environ.get('STALL_MONITOR')
+    if not setting:
+        return None
+    try:
+        stall_ms = float(setting)
+    except ValueError:
+        stall_ms = DEFAULT_STALL_MS
+    return StallMonitor(root, stall_ms=stall_ms if stall_ms > 1 else DEFAULT_STALL_MS)
@@ -0,0 +1,109 @@
+"""
+Savings products with tiered balance-band interest rates.
+
+A TieredProduct pays a different annual rate on each slice of the balance,
+like tax brackets: with bands 0-10k at 1.5% and 10k-50k at 2.5%, a balance
+of 15k earns 1.5% on the first 10k and 2.5% on the remaining 5k.
+
+Band lower bounds are kept sorted together with the interest accrued by all
+lower bands, so a balance is mapped to its band with one binary search
+(np.searchsorted) and its blended interest is one multiply-add. Arrays of
+millions of balances are evaluated in a single vectorized pass.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+
+ArrayLike = Union[float, np.ndarray]
+
+
+@dataclass(frozen=True)
+class TieredProduct:
+    """A savings product whose annual rate depends on the balance band."""
+    name: str
+    thresholds: Tuple[float, ...]
+    rates: Tuple[float, ...]
+    _lower: np.ndarray = field(init=False, repr=False, compare=False)
+    _rates: np.ndarray = field(init=False, repr=False, compare=False)
+    _base: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Validate the bands and precompute the per-band base interest.
+
+        ``thresholds`` are the band lower bounds starting at 0 and ``rates``
+        the annual rates (in percent) of the matching bands; the last band
+        is open-ended.
+
+        Raises:
+            ValueError: If the bands are empty, unsorted or mismatched
+        """
+        lower = np.asarray(self.thresholds, dtype=float)
+        rates = np.asarray(self.rates, dtype=float)
+        if lower.size == 0 or lower.size != rates.size:
+            raise ValueError("Every band needs exactly one rate")
+        if lower[0] != 0 or np.any(np.diff(lower) <= 0):
+            raise ValueError("Band thresholds must start at 0 and increase")
+        if np.any(rates < 0):
+            raise ValueError("Band rates cannot be negative")
+
+        # Annual interest earned by a balance sitting exactly at each lower bound
+        base = np.concatenate(([0.0], np.cumsum(np.diff(lower) * rates[:-1] / 100)))
+        object.__setattr__(self, '_lower', lower)
+        object.__setattr__(self, '_rates', rates / 100)
+        object.__setattr__(self, '_base', base)
+
+    def band_index(self, balances: ArrayLike) -> np.ndarray:
+        """Index of the band each balance falls into."""
+        return np.searchsorted(self._lower, balances, side='right') - 1
+
+    def annual_interest(self, balances: ArrayLike) -> np.ndarray:
+        """
+        Interest earned in one year by each balance.
+
+        Raises:
+            ValueError: If a balance is negative
+        """
+        balances = np.asarray(balances, dtype=float)
+        if np.any(balances < 0):
+            raise ValueError("Balances cannot be negative")
+        band = self.band_index(balances)
+        return self._base[band] + (balances - self._lower[band]) * self._rates[band]
+
+    def blended_rate(self, balances: ArrayLike) -> np.ndarray:
+        """Effective annual rate in percent; the first band's rate for a zero balance."""
+        balances = np.asarray(balances, dtype=float)
+        interest = self.annual_interest(balances)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(balances > 0, interest / balances * 100, self.rates[0])
+
+    def simple_interest(self, balances: ArrayLike, months: ArrayLike
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Simple interest on constant balances over a number of months.
+
+        Returns:
+            Tuple of (total_interest, monthly_interest, final_amount)
+        """
+        balances = np.asarray(balances, dtype=float)
+        monthly_interest = self.annual_interest(balances) / 12
+        total_interest = monthly_interest * months
+        return total_interest, monthly_interest, balances + total_interest
+
+
+PRODUCTS: Dict[str, TieredProduct] = {product.name: product for product in [
+    TieredProduct("Štednja Plus (1,5% do 10.000, 2,5% do 50.000, 3% iznad)",
+                  (0, 10_000, 50_000), (1.5, 2.5, 3.0)),
+    TieredProduct("Mala štednja (2% do 5.000, 0,5% iznad)",
+                  (0, 5_000), (2.0, 0.5)),
+]}
+
+
+def product_choices(flat_label: str) -> Dict[str, Optional[TieredProduct]]:
+    """Menu entries for the GUIs: a flat-rate entry first, then every product."""
+    choices: Dict[str, Optional[TieredProduct]] = {flat_label: None}
+    choices.update(PRODUCTS)
+    return choices
@@ -0,0 +1,236 @@
+"""
+Links the code blocks in the Razgovori/ transcripts to the calculator scripts.
+
+Every transcript is split into code blocks (each block is one revision of the
+program the model produced), and every block is diffed against the script
+written from that conversation. Documents are processed in parallel, one per
+worker process, and each document's result is cached under the hash of the
+document and of its candidate scripts, so re-runs only touch what changed.
+
+Usage:
+    python transcript_code.py
+    python transcript_code.py --output manifest.jsonl --workers 4
+"""
+
+import argparse
+import difflib
+import glob
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Tuple
+
+from file_cache import JsonCache, combined_hash, file_hash
+from transcripts import TRANSCRIPT_DIR, extract_paragraphs, list_transcripts
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MANIFEST_PATH = os.path.join(TRANSCRIPT_DIR, "code_manifest.jsonl")
+
+# Bumped whenever the extraction or diff logic changes, to invalidate the cache
+PIPELINE_VERSION = 1
+
+LANGUAGE_TAGS = {'python', 'py', 'python3'}
+
+_DOCUMENT_NAME_RE = re.compile(r'^(?P<model>[A-Za-z]+?)(?P<language>cro|eng)$', re.IGNORECASE)
+_CODE_START_RE = re.compile(r'^(import |from \S+ import |class \w|def \w|@\w)')
+_CODE_LINE_RE = re.compile(
+    r'^(\s|#|@|[)\]}]'
+    r'|(import|from|class|def|if|elif|else|try|except|finally|for|while|with|return|pass)\b'
+    r'|[A-Za-z_][\w.]*(\[[^\]]*\])?\s*([-+*/]?=|\(|:|,))'
+)
+
+
+@dataclass
+class CodeRevision:
+    """One code block of a transcript and its match against the scripts."""
+    document: str
+    model: str
+    language: str
+    revision: int
+    first_paragraph: int
+    line_count: int
+    valid_python: bool
+    matched_file: Optional[str]
+    similarity: float
+    lines_added: int
+    lines_removed: int
+
+
+def parse_document_name(path: str) -> Tuple[str, str]:
+    """Split a transcript name such as DeepSeekCro.docx into ('DeepSeek', 'CRO')."""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    match = _DOCUMENT_NAME_RE.match(stem)
+    if not match:
+        return stem, ""
+    return match.group('model'), match.group('language').upper()
+
+
+def candidate_scripts(model: str, language: str) -> List[str]:
+    """Return the calculator scripts that may come from a conversation."""
+    scripts = sorted(glob.glob(os.path.join(SCRIPT_DIR, "*.py")))
+    stems = {path: os.path.splitext(os.path.basename(path))[0].lower() for path in scripts}
+    matches = [
+        path for path in scripts
+        if stems[path].startswith(model.lower()) and stems[path].endswith(language.lower())
+    ]
+    return matches
+
+
+def extract_code_blocks(paragraphs: List[str]) -> List[Tuple[int, List[str]]]:
+    """
+    Find the code blocks in a transcript.
+
+    A block starts after a language tag line ("python") or at a line that
+    opens a Python module (import, class, def) and runs until the first
+    unindented line that does not look like code.
+
+    Returns:
+        List of (first paragraph index, code lines)
+    """
+    blocks: List[Tuple[int, List[str]]] = []
+    i = 0
+    while i < len(paragraphs):
+        line = paragraphs[i]
+        tagged = line.strip().lower() in LANGUAGE_TAGS
+        if not tagged and not _CODE_START_RE.match(line):
+            i += 1
+            continue
+
+        start = i + 1 if tagged else i
+        end = start
+        while end < len(paragraphs):
+            current = paragraphs[end]
+            if current.strip() and not _CODE_LINE_RE.match(current):
+                break
+            end += 1
+
+        lines = [text.rstrip() for text in paragraphs[start:end]]
+        while lines and not lines[-1]:
+            lines.pop()
+        if len(lines) >= 3:
+            blocks.append((start, lines))
+        i = max(end, i + 1)
+    return blocks
+
+
+def _is_valid_python(lines: List[str]) -> bool:
+    try:
+        compile("\n".join(lines) + "\n", "<transcript>", 'exec')
+        return True
+    except (SyntaxError, ValueError):
+        return False
+
+
+def _read_script(path: str) -> List[str]:
+    with open(path, encoding='utf-8') as f:
+        return [line.rstrip() for line in f.read().splitlines()]
+
+
+def analyze_document(path: str, scripts: List[str]) -> List[dict]:
+    """Extract and diff all code blocks of a single transcript (runs in a worker)."""
+    model, language = parse_document_name(path)
+    script_lines = {os.path.basename(script): _read_script(script) for script in scripts}
+    paragraphs = [paragraph for text in extract_paragraphs(path) for paragraph in text.split("\n")]
+
+    revisions = []
+    for number, (first, lines) in enumerate(extract_code_blocks(paragraphs), start=1):
+        best_name, best_ratio, best_lines = None, 0.0, []
+        for name, target in script_lines.items():
+            ratio = difflib.SequenceMatcher(None, lines, target, autojunk=False).ratio()
+            if ratio > best_ratio:
+                best_name, best_ratio, best_lines = name, ratio, target
+
+        added = removed = 0
+        if best_name is not None:
+            for diff_line in difflib.unified_diff(lines, best_lines, lineterm="", n=0):
+                if diff_line.startswith('+') and not diff_line.startswith('+++'):
+                    added += 1
+                elif diff_line.startswith('-') and not diff_line.startswith('---'):
+                    removed += 1
+
+        revisions.append(asdict(CodeRevision(
+            document=os.path.basename(path),
+            model=model,
+            language=language,
+            revision=number,
+            first_paragraph=first,
+            line_count=len(lines),
+            valid_python=_is_valid_python(lines),
+            matched_file=best_name,
+            similarity=round(best_ratio, 4),
+            lines_added=added,
+            lines_removed=removed,
+        )))
+    return revisions
+
+
+def build_manifest(paths: Optional[List[str]] = None, workers: Optional[int] = None,
+                   cache: Optional[JsonCache] = None) -> Tuple[List[dict], Dict[str, bool]]:
+    """
+    Run the pipeline over all transcripts.
+
+    Args:
+        paths: Transcript files; defaults to the .docx and .pdf files in Razgovori/
+        workers: Size of the process pool (None = CPU count)
+        cache: Result cache; defaults to .cache/transcript_code
+
+    Returns:
+        (manifest rows in document order, mapping of document name to cache hit)
+    """
+    if paths is None:
+        paths = [path for path in list_transcripts() if not path.lower().endswith('.txt')]
+    cache = cache or JsonCache('transcript_code')
+
+    jobs = []
+    for path in paths:
+        scripts = candidate_scripts(*parse_document_name(path))
+        if not scripts:
+            scripts = sorted(glob.glob(os.path.join(SCRIPT_DIR, "*.py")))
+        key = combined_hash(
+            [str(PIPELINE_VERSION), file_hash(path)]
+            + [os.path.basename(script) + ":" + file_hash(script) for script in scripts]
+        )
+        jobs.append((path, scripts, key, cache.get(key)))
+
+    results: Dict[str, List[dict]] = {}
+    pending = [(path, scripts, key) for path, scripts, key, cached in jobs if cached is None]
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                path: (key, pool.submit(analyze_document, path, scripts))
+                for path, scripts, key in pending
+            }
+            for path, (key, future) in futures.items():
+                results[path] = future.result()
+                cache.put(key, results[path])
+
+    manifest: List[dict] = []
+    hits: Dict[str, bool] = {}
+    for path, _, _, cached in jobs:
+        hits[os.path.basename(path)] = cached is not None
+        manifest.extend(cached if cached is not None else results[path])
+    return manifest, hits
+
+
+def main() -> None:
+    """Command-line entry point: write the JSONL manifest."""
+    parser = argparse.ArgumentParser(description="Link transcript code blocks to the calculator scripts.")
+    parser.add_argument('--output', default=DEFAULT_MANIFEST_PATH, help="manifest file (JSONL)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    manifest, hits = build_manifest(workers=args.workers)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        for row in manifest:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    for name, hit in hits.items():
+        print(f"{'cached' if hit else 'processed'}: {name}")
+    print(f"{len(manifest)} code revision(s) written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Persistent full-text index over the Razgovori/ transcripts.
+
+The index is an SQLite database holding every paragraph of every transcript
+and an inverted table of (term, paragraph) postings. Files are re-extracted
+only when their SHA-256 hash changes, so keeping the index current after a
+new transcript is added costs one extraction of that file.
+
+Usage:
+    python transcript_index.py monthly_deposit
+    python transcript_index.py "simple interest" --limit 5
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set
+
+from file_cache import file_hash
+from transcripts import TRANSCRIPT_DIR, extract_paragraphs, list_transcripts
+
+
+DEFAULT_INDEX_PATH = os.path.join(TRANSCRIPT_DIR, ".transcript_index.sqlite")
+
+_WORD_RE = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS passages (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id),
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    passage_id INTEGER NOT NULL REFERENCES passages(id),
+    PRIMARY KEY (term, passage_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS passages_by_document ON passages(document_id);
+"""
+
+
+@dataclass
+class SearchHit:
+    """A single matching passage."""
+    document: str
+    position: int
+    text: str
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Split text into lower-case index terms.
+
+    Identifiers such as ``monthly_deposit`` are indexed both whole and by
+    their underscore-separated parts.
+    """
+    terms = set()
+    for word in _WORD_RE.findall(text.lower()):
+        terms.add(word)
+        if "_" in word:
+            terms.update(part for part in word.split("_") if part)
+    return terms
+
+
+class TranscriptIndex:
+    """Inverted index of transcript paragraphs stored in SQLite."""
+
+    def __init__(self, index_path: str = DEFAULT_INDEX_PATH):
+        self.connection = sqlite3.connect(index_path)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def update(self, paths: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Bring the index up to date with the given transcript files.
+
+        Args:
+            paths: Transcript files to index; defaults to everything in Razgovori/
+
+        Returns:
+            Mapping of document name to 'added', 'updated', 'unchanged' or 'removed'
+        """
+        paths = list_transcripts() if paths is None else list(paths)
+        known = {
+            name: (doc_id, sha)
+            for doc_id, name, sha in self.connection.execute("SELECT id, name, sha256 FROM documents")
+        }
+        status: Dict[str, str] = {}
+
+        with self.connection:
+            for path in paths:
+                name = os.path.basename(path)
+                sha = file_hash(path)
+                if name in known and known[name][1] == sha:
+                    status[name] = 'unchanged'
+                    continue
+                if name in known:
+                    self._remove_document(known[name][0])
+                self._add_document(name, sha, path)
+                status[name] = 'updated' if name in known else 'added'
+
+            current = {os.path.basename(path) for path in paths}
+            for name, (doc_id, _) in known.items():
+                if name not in current:
+                    self._remove_document(doc_id)
+                    status[name] = 'removed'
+        return status
+
+    def _add_document(self, name: str, sha: str, path: str) -> None:
+        cursor = self.connection.execute(
+            "INSERT INTO documents (name, sha256) VALUES (?, ?)", (name, sha)
+        )
+        doc_id = cursor.lastrowid
+        for position, text in enumerate(extract_paragraphs(path)):
+            terms = tokenize(text)
+            if not terms:
+                continue
+            passage_id = self.connection.execute(
+                "INSERT INTO passages (document_id, position, text) VALUES (?, ?, ?)",
+                (doc_id, position, text),
+            ).lastrowid
+            self.connection.executemany(
+                "INSERT INTO postings (term, passage_id) VALUES (?, ?)",
+                ((term, passage_id) for term in terms),
+            )
+
+    def _remove_document(self, doc_id: int) -> None:
+        self.connection.execute(
+            "DELETE FROM postings WHERE passage_id IN (SELECT id FROM passages WHERE document_id = ?)",
+            (doc_id,),
+        )
+        self.connection.execute("DELETE FROM passages WHERE document_id = ?", (doc_id,))
+        self.connection.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+    def search(self, query: str, limit: int = 20) -> List[SearchHit]:
+        """
+        Return passages containing every term of the query.
+
+        Args:
+            query: Free text; all terms must match
+            limit: Maximum number of passages returned
+
+        Returns:
+            Matching passages ordered by document and position
+        """
+        terms = sorted(set(_WORD_RE.findall(query.lower())))
+        if not terms:
+            return []
+        # Intersect the postings lists inside SQLite, one term per join
+        joins = " ".join(
+            f"JOIN postings p{i} ON p{i}.passage_id = passages.id AND p{i}.term = ?"
+            for i in range(len(terms))
+        )
+        rows = self.connection.execute(
+            f"SELECT documents.name, passages.position, passages.text FROM passages {joins} "
+            "JOIN documents ON documents.id = passages.document_id "
+            "ORDER BY documents.name, passages.position LIMIT ?",
+            (*terms, limit),
+        )
+        return [SearchHit(name, position, text) for name, position, text in rows]
+
+
+def main() -> None:
+    """Command-line entry point: update the index and run a query."""
+    parser = argparse.ArgumentParser(description="Search the Razgovori transcripts.")
+    parser.add_argument('query', help="terms to search for (all must match)")
+    parser.add_argument('--limit', type=int, default=20, help="maximum number of passages")
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help="path of the index database")
+    args = parser.parse_args()
+
+    index = TranscriptIndex(args.index)
+    try:
+        for name, state in index.update().items():
+            if state != 'unchanged':
+                print(f"[{state}] {name}")
+
+        start = time.perf_counter()
+        hits = index.search(args.query, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+    finally:
+        index.close()
+
+    for hit in hits:
+        print(f"{hit.document}:{hit.position}: {hit.text.strip()}")
+    print(f"{len(hits)} passage(s) in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
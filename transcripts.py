@@ -0,0 +1,357 @@
+"""
+Text extraction for the conversation transcripts in Razgovori/.
+
+Everything here uses only the standard library: .docx files are read as zip
+archives and their document.xml is streamed with iterparse, PDF files are
+parsed object by object and their content streams are decoded through the
+fonts' ToUnicode CMaps. All extractors yield text one paragraph (docx, txt)
+or one line (pdf) at a time.
+"""
+
+import os
+import re
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+TRANSCRIPT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Razgovori")
+TRANSCRIPT_EXTENSIONS = ('.docx', '.pdf', '.txt')
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def list_transcripts(directory: str = TRANSCRIPT_DIR) -> List[str]:
+    """Return the paths of all supported transcript files, sorted by name."""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(TRANSCRIPT_EXTENSIONS)
+    )
+
+
+def extract_paragraphs(path: str) -> Iterator[str]:
+    """
+    Stream the text of a transcript paragraph by paragraph.
+
+    Args:
+        path: Path to a .docx, .pdf or .txt transcript
+
+    Yields:
+        Paragraphs (docx, txt) or text lines (pdf), empty ones included so
+        that positions stay stable
+
+    Raises:
+        ValueError: If the file type is not supported
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.docx':
+        return _docx_paragraphs(path)
+    if extension == '.pdf':
+        return _pdf_lines(path)
+    if extension == '.txt':
+        return _txt_lines(path)
+    raise ValueError(f"Unsupported transcript type: {extension}")
+
+
+# --- docx -------------------------------------------------------------------
+
+def _docx_paragraphs(path: str) -> Iterator[str]:
+    """Yield paragraph texts from word/document.xml without loading the whole tree."""
+    with zipfile.ZipFile(path) as archive, archive.open('word/document.xml') as xml_file:
+        parts: List[str] = []
+        depth = 0
+        for event, element in ET.iterparse(xml_file, events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                if tag == _W + 'p':
+                    depth += 1
+                continue
+            if tag == _W + 't':
+                parts.append(element.text or "")
+            elif tag == _W + 'tab':
+                parts.append("\t")
+            elif tag in (_W + 'br', _W + 'cr'):
+                parts.append("\n")
+            elif tag == _W + 'p':
+                depth -= 1
+                if depth == 0:
+                    yield "".join(parts)
+                    parts = []
+                element.clear()
+            elif tag == _W + 'body':
+                element.clear()
+
+
+# --- txt --------------------------------------------------------------------
+
+def _txt_lines(path: str) -> Iterator[str]:
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+# --- pdf --------------------------------------------------------------------
+
+_OBJ_RE = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_REF_RE = re.compile(rb'(\d+)\s+\d+\s+R')
+_LENGTH_RE = re.compile(rb'/Length\s+(\d+)(\s+\d+\s+R)?')
+_TOKEN_RE = re.compile(
+    rb'\((?:\\.|[^\\()])*\)'          # literal string (no nested parentheses)
+    rb'|<[0-9A-Fa-f\s]*>'            # hex string
+    rb'|\[|\]'                      # array delimiters
+    rb'|/[^\s/\[\]()<>{}%]+'        # name
+    rb'|[-+]?(?:\d+\.?\d*|\.\d+)'   # number
+    rb'|[A-Za-z\'"*]+'              # operator
+)
+
+
+class _PdfFile:
+    """Minimal random-access reader for uncompressed-xref PDF files."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offsets: Dict[int, int] = {}
+        for match in _OBJ_RE.finditer(data):
+            # Later definitions win, as in incremental updates
+            self.offsets[int(match.group(1))] = match.end()
+
+    def dictionary(self, number: int) -> bytes:
+        """Return the raw bytes of an object up to its stream or endobj keyword."""
+        start = self.offsets[number]
+        end = self.data.find(b'endobj', start)
+        stream_at = self.data.find(b'stream', start, end)
+        return self.data[start:stream_at if stream_at != -1 else end]
+
+    def stream(self, number: int) -> bytes:
+        """Return the decoded stream content of an object."""
+        header = self.dictionary(number)
+        start = self.offsets[number] + len(header) + len(b'stream')
+        if self.data[start:start + 2] == b'\r\n':
+            start += 2
+        elif self.data[start:start + 1] in (b'\n', b'\r'):
+            start += 1
+
+        length_match = _LENGTH_RE.search(header)
+        if length_match and length_match.group(2):
+            length = int(self.dictionary(int(length_match.group(1))).strip())
+        elif length_match:
+            length = int(length_match.group(1))
+        else:
+            length = self.data.find(b'endstream', start) - start
+        raw = self.data[start:start + length]
+
+        if b'/FlateDecode' in header:
+            return zlib.decompress(raw)
+        return raw
+
+    def pages(self) -> Iterator[bytes]:
+        """Yield page dictionaries in document order."""
+        catalog = next(
+            number for number in self.offsets
+            if re.search(rb'/Type\s*/Catalog\b', self.dictionary(number))
+        )
+        root = _REF_RE.search(self.dictionary(catalog).split(b'/Pages', 1)[1]).group(1)
+        yield from self._walk(int(root))
+
+    def _walk(self, number: int) -> Iterator[bytes]:
+        node = self.dictionary(number)
+        if re.search(rb'/Type\s*/Pages\b', node):
+            kids = re.search(rb'/Kids\s*\[(.*?)\]', node, re.S).group(1)
+            for kid in _REF_RE.finditer(kids):
+                yield from self._walk(int(kid.group(1)))
+        else:
+            yield node
+
+    def resolve_dict(self, owner: bytes, key: bytes) -> bytes:
+        """Return the body of a dictionary-valued entry, following a reference if needed."""
+        match = re.search(rb'/' + key + rb'\s*(\d+\s+\d+\s+R|<<)', owner)
+        if not match:
+            return b""
+        if match.group(1) != b'<<':
+            return self.dictionary(int(match.group(1).split()[0]))
+        return _balanced_dict(owner, match.start(1))
+
+
+def _balanced_dict(data: bytes, start: int) -> bytes:
+    """Return the << ... >> dictionary starting at ``start``."""
+    depth = 0
+    i = start
+    while i < len(data):
+        if data.startswith(b'<<', i):
+            depth += 1
+            i += 2
+        elif data.startswith(b'>>', i):
+            depth -= 1
+            i += 2
+            if depth == 0:
+                return data[start:i]
+        else:
+            i += 1
+    return data[start:]
+
+
+class _CMap:
+    """ToUnicode mapping of a single font."""
+
+    def __init__(self, source: bytes):
+        self.code_bytes = 1
+        self.mapping: Dict[int, str] = {}
+        space = re.search(rb'begincodespacerange\s*<([0-9A-Fa-f]+)>', source)
+        if space:
+            self.code_bytes = max(1, len(space.group(1)) // 2)
+        for block in re.findall(rb'beginbfchar(.*?)endbfchar', source, re.S):
+            for code, target in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>', block):
+                self.mapping[int(code, 16)] = _utf16(target)
+        for block in re.findall(rb'beginbfrange(.*?)endbfrange', source, re.S):
+            for low, high, target in re.findall(
+                    rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]*>|\[.*?\])', block, re.S):
+                low, high = int(low, 16), int(high, 16)
+                if target.startswith(b'['):
+                    targets = re.findall(rb'<([0-9A-Fa-f]*)>', target)
+                    for offset, item in enumerate(targets[:high - low + 1]):
+                        self.mapping[low + offset] = _utf16(item)
+                else:
+                    base = _utf16(target[1:-1])
+                    for offset in range(high - low + 1):
+                        self.mapping[low + offset] = base[:-1] + chr(ord(base[-1]) + offset)
+
+    def decode(self, raw: bytes) -> str:
+        step = self.code_bytes
+        return "".join(
+            self.mapping.get(int.from_bytes(raw[i:i + step], 'big'), "")
+            for i in range(0, len(raw) - step + 1, step)
+        )
+
+
+def _utf16(hex_digits: bytes) -> str:
+    if not hex_digits:
+        return ""
+    return bytes.fromhex(hex_digits.decode('ascii')).decode('utf-16-be', errors='replace')
+
+
+def _pdf_string(token: bytes) -> bytes:
+    """Decode a PDF literal or hex string token into raw bytes."""
+    if token.startswith(b'<'):
+        digits = re.sub(rb'\s', b'', token[1:-1])
+        if len(digits) % 2:
+            digits += b'0'
+        return bytes.fromhex(digits.decode('ascii'))
+    body = token[1:-1]
+    return re.sub(
+        rb'\\([nrtbf()\\]|[0-7]{1,3})',
+        lambda m: _ESCAPES.get(m.group(1)) or bytes([int(m.group(1), 8) & 0xFF]),
+        body,
+    )
+
+
+_ESCAPES = {b'n': b'\n', b'r': b'\r', b't': b'\t', b'b': b'\b', b'f': b'\f',
+            b'(': b'(', b')': b')', b'\\': b'\\'}
+
+
+def _pdf_lines(path: str) -> Iterator[str]:
+    """Yield text lines of a PDF, page by page."""
+    with open(path, 'rb') as f:
+        pdf = _PdfFile(f.read())
+
+    cmaps: Dict[int, Optional[_CMap]] = {}
+    for page in pdf.pages():
+        fonts = _page_fonts(pdf, page, cmaps)
+        contents = re.search(rb'/Contents\s*(\[.*?\]|\d+\s+\d+\s+R)', page, re.S)
+        if not contents:
+            continue
+        content = b"\n".join(
+            pdf.stream(int(ref.group(1))) for ref in _REF_RE.finditer(contents.group(1))
+        )
+        yield from _content_lines(content, fonts)
+
+
+def _page_fonts(pdf: _PdfFile, page: bytes,
+                cmaps: Dict[int, Optional[_CMap]]) -> Dict[bytes, Optional[_CMap]]:
+    """Map the font resource names of a page to their ToUnicode CMaps."""
+    resources = pdf.resolve_dict(page, b'Resources')
+    font_dict = pdf.resolve_dict(resources, b'Font')
+    fonts: Dict[bytes, Optional[_CMap]] = {}
+    for name, number in re.findall(rb'/([^\s/<>\[\]]+)\s+(\d+)\s+\d+\s+R', font_dict):
+        number = int(number)
+        if number not in cmaps:
+            to_unicode = re.search(rb'/ToUnicode\s+(\d+)\s+\d+\s+R', pdf.dictionary(number))
+            cmaps[number] = _CMap(pdf.stream(int(to_unicode.group(1)))) if to_unicode else None
+        fonts[name] = cmaps[number]
+    return fonts
+
+
+def _content_lines(content: bytes, fonts: Dict[bytes, Optional[_CMap]]) -> Iterator[str]:
+    """Interpret the text operators of a content stream and yield lines."""
+    operands: list = []
+    array: Optional[List[bytes]] = None
+    font: Optional[_CMap] = None
+    line: List[str] = []
+    line_y: Optional[float] = None
+
+    def show(raw: bytes) -> None:
+        line.append(font.decode(raw) if font else raw.decode('latin-1'))
+
+    for match in _TOKEN_RE.finditer(content):
+        token = match.group()
+        if token == b'[':
+            array = []
+        elif token == b']':
+            operands.append(array or [])
+            array = None
+        elif array is not None:
+            array.append(token)
+        elif token[:1] in b'(<[/+-.0123456789':
+            operands.append(token)
+        else:
+            # Operator
+            if token == b'Tf' and len(operands) >= 2:
+                font = fonts.get(operands[-2][1:])
+            elif token in (b'Tj', b"'", b'"') and operands:
+                if token != b'Tj':
+                    yield "".join(line)
+                    line = []
+                show(_pdf_string(operands[-1]))
+            elif token == b'TJ' and operands and isinstance(operands[-1], list):
+                for item in operands[-1]:
+                    if item[:1] in b'(<':
+                        show(_pdf_string(item))
+            elif token == b'Tm' and len(operands) >= 6:
+                y = float(operands[-1])
+                if line_y is not None and abs(y - line_y) > 0.5 and line:
+                    yield "".join(line)
+                    line = []
+                line_y = y
+            elif token in (b'Td', b'TD') and len(operands) >= 2:
+                ty = float(operands[-1])
+                if ty and line:
+                    yield "".join(line)
+                    line = []
+                if ty and line_y is not None:
+                    line_y += ty
+            elif token == b'T*' and line:
+                yield "".join(line)
+                line = []
+            elif token == b'cm':
+                # A new transformation moves the origin, so Tm positions
+                # before and after it are not comparable
+                if line:
+                    yield "".join(line)
+                    line = []
+                line_y = None
+            operands = []
+    if line:
+        yield "".join(line)
+
+
+def extract_text(path: str) -> str:
+    """Return the whole text of a transcript as a single string."""
+    return "\n".join(extract_paragraphs(path))
+
+
+def iter_corpus(directory: str = TRANSCRIPT_DIR) -> Iterator[Tuple[str, int, str]]:
+    """Yield (path, position, paragraph) for every transcript in a directory."""
+    for path in list_transcripts(directory):
+        for position, paragraph in enumerate(extract_paragraphs(path)):
+            yield path, position, paragraph
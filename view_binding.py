@@ -0,0 +1,119 @@
+"""
+Diff-based widget updates, batched per idle cycle.
+
+Every config() call on a Tk widget is a round trip into Tcl and may trigger
+a relayout, even when the new text equals the old one, and pack()/
+pack_forget() on every calculation remaps widgets that are already where
+they should be. A ViewBinding remembers the last options and visibility it
+rendered for each widget. set(), show() and hide() only record the wanted
+state; once per idle cycle flush() compares it with what was rendered and
+issues one configure() per widget whose options actually changed and a
+pack() or pack_forget() only where visibility changed.
+
+Bound widgets should only be updated through their binding, otherwise its
+record of what is on screen goes stale.
+
+Usage:
+    view = ViewBinding(root)
+    view.set(label, text="12.50 €")
+    view.show(results_frame, fill='both', expand=True)
+    view.hide(message_label)
+"""
+
+import tkinter as tk
+from typing import Any, Dict, Optional, Tuple
+
+
+class ViewBinding:
+    """Wanted widget state, pushed to Tk on idle and only where it differs."""
+
+    def __init__(self, master: tk.Misc):
+        """
+        Args:
+            master: Any widget of the window; flushes are scheduled on its event loop
+        """
+        self.master = master
+        self._rendered: Dict[str, Dict[str, Any]] = {}
+        self._visible: Dict[str, bool] = {}
+        self._widgets: Dict[str, tk.Misc] = {}
+        self._options: Dict[str, Dict[str, Any]] = {}
+        self._visibility: Dict[str, Tuple[bool, Dict[str, Any]]] = {}
+        self._after_id: Optional[str] = None
+
+    def _schedule(self, widget: tk.Misc) -> str:
+        key = str(widget)
+        self._widgets[key] = widget
+        if self._after_id is None:
+            self._after_id = self.master.after_idle(self.flush)
+        return key
+
+    def set(self, widget: tk.Misc, **options: Any) -> None:
+        """Request widget options (e.g. text=...); later requests in the same cycle win."""
+        self._options.setdefault(self._schedule(widget), {}).update(options)
+
+    def show(self, widget: tk.Misc, **pack_options: Any) -> None:
+        """Request the widget to be packed with ``pack_options``."""
+        key = self._schedule(widget)
+        self._visibility.pop(key, None)         # keep requests in call order for the packing order
+        self._visibility[key] = (True, pack_options)
+
+    def hide(self, widget: tk.Misc) -> None:
+        """Request the widget to be unpacked."""
+        key = self._schedule(widget)
+        self._visibility.pop(key, None)
+        self._visibility[key] = (False, {})
+
+    def flush(self) -> int:
+        """
+        Push pending changes now.
+
+        Returns:
+            Number of Tk calls made
+        """
+        if self._after_id is not None:
+            try:
+                self.master.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        options, self._options = self._options, {}
+        visibility, self._visibility = self._visibility, {}
+        calls = 0
+
+        for key, (visible, pack_options) in visibility.items():
+            widget = self._widgets[key]
+            try:
+                if key not in self._visible:
+                    self._visible[key] = bool(widget.winfo_manager())
+                if self._visible[key] == visible:
+                    continue
+                if visible:
+                    widget.pack(**pack_options)
+                else:
+                    widget.pack_forget()
+            except tk.TclError:         # destroyed since the request
+                self._forget(key)
+                continue
+            self._visible[key] = visible
+            calls += 1
+
+        for key, wanted in options.items():
+            if key not in self._widgets:
+                continue
+            rendered = self._rendered.setdefault(key, {})
+            changed = {name: value for name, value in wanted.items()
+                       if name not in rendered or rendered[name] != value}
+            if not changed:
+                continue
+            try:
+                self._widgets[key].configure(**changed)
+            except tk.TclError:
+                self._forget(key)
+                continue
+            rendered.update(changed)
+            calls += 1
+        return calls
+
+    def _forget(self, key: str) -> None:
+        for store in (self._rendered, self._visible, self._widgets):
+            store.pop(key, None)